@@ -1,17 +1,15 @@
-"""Demo script for TOPSIS algorithm - standalone example."""
+"""Demo script for TOPSIS algorithm - standalone example.
 
-import sys
-import os
+Requires the project to be installed (``pip install -e .``).
+"""
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-import pandas as pd
 from src.services.ranking.topsis import calculate_topsis_scores
+from src.utils.fast_render import render_table
 
 
 def main():
     """Run TOPSIS algorithm demo with realistic model selection example."""
+    import pandas as pd
     
     print("=" * 80)
     print("TOPSIS Algorithm Demo - LLM Model Selection")
@@ -26,10 +24,21 @@ def main():
         'throughput': [450, 380, 500, 350, 470],       # tokens/sec (higher better)
         'cost_per_hour': [8, 15, 7, 18, 9],            # USD (lower better)
         'vram_gb': [14, 16, 13, 20, 15]                # VRAM required (lower better for cost)
+    }).astype({
+        'accuracy': 'float64',
+        'ttft_p90_ms': 'int32',
+        'throughput': 'int32',
+        'cost_per_hour': 'int32',
+        'vram_gb': 'int32',
     })
     
     print("📊 Input Data:")
-    print(data.to_string(index=False))
+    input_cols = list(data.columns)
+    print(render_table(
+        data[input_cols].itertuples(index=False),
+        input_cols,
+        ['s', '.2f', 'd', 'd', 'd', 'd']
+    ))
     print()
     
     # Define criteria weights (must sum to 1.0)
@@ -75,20 +84,21 @@ def main():
     
     # Display results with formatting
     display_cols = ['topsis_rank', 'model', 'topsis_score', 'accuracy', 'ttft_p90_ms', 'throughput', 'cost_per_hour']
-    result_display = result_sorted[display_cols].copy()
-    result_display['topsis_score'] = result_display['topsis_score'].round(4)
-    
-    print(result_display.to_string(index=False))
+    print(render_table(
+        result_sorted[display_cols].itertuples(index=False),
+        display_cols,
+        ['d', 's', '.4f', '.2f', 'd', 'd', 'd']
+    ))
     print()
     
     # Highlight top 3
     print("🥇 Top 3 Recommended Models:")
-    for i, row in result_sorted.head(3).iterrows():
-        rank_emoji = ['🥇', '🥈', '🥉'][int(row['topsis_rank']) - 1]
-        print(f"{rank_emoji} Rank {int(row['topsis_rank'])}: {row['model']}")
-        print(f"   Score: {row['topsis_score']:.4f}")
-        print(f"   Accuracy: {row['accuracy']:.2f} | Latency: {row['ttft_p90_ms']:.0f}ms | "
-              f"Throughput: {row['throughput']:.0f} tok/s | Cost: ${row['cost_per_hour']:.0f}/hr")
+    for row in result_sorted.head(3).itertuples(index=False):
+        rank_emoji = ['🥇', '🥈', '🥉'][int(row.topsis_rank) - 1]
+        print(f"{rank_emoji} Rank {int(row.topsis_rank)}: {row.model}")
+        print(f"   Score: {row.topsis_score:.4f}")
+        print(f"   Accuracy: {row.accuracy:.2f} | Latency: {row.ttft_p90_ms:.0f}ms | "
+              f"Throughput: {row.throughput:.0f} tok/s | Cost: ${row.cost_per_hour:.0f}/hr")
         print()
     
     # Analysis
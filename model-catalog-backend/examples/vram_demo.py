@@ -1,18 +1,32 @@
-"""Demo script for VRAM calculator - standalone example."""
+"""Demo script for VRAM calculator - standalone example.
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+Requires the project to be installed (``pip install -e .``).
+"""
 
 from src.services.hardware.vram_calculator import (
     calculate_vram_requirement,
     recommend_gpu_config,
-    get_quantization_comparison,
     estimate_max_batch_size
 )
 
+QUANTS = ['fp32', 'fp16', 'int8', 'int4']
+
 
 def main():
+    models = [
+        ("Llama-3.1-7B", 7_000_000_000, 'fp16'),
+        ("Llama-3.1-70B", 70_000_000_000, 'int4'),
+        ("GPT-3.5", 175_000_000_000, 'int8'),
+        ("Mistral-7B", 7_300_000_000, 'fp16'),
+    ]
+    
+    # Compute each (parameters, quantization) pair once up front
+    vram_table = {
+        (params, quant): calculate_vram_requirement(params, quant)
+        for _, params, _ in models
+        for quant in QUANTS
+    }
+    
     print("=" * 80)
     print("VRAM Calculator & GPU Matcher Demo")
     print("=" * 80)
@@ -22,15 +36,8 @@ def main():
     print("📊 Example 1: VRAM Requirements for Popular Models")
     print("-" * 80)
     
-    models = [
-        ("Llama-3.1-7B", 7_000_000_000, 'fp16'),
-        ("Llama-3.1-70B", 70_000_000_000, 'int4'),
-        ("GPT-3.5", 175_000_000_000, 'int8'),
-        ("Mistral-7B", 7_300_000_000, 'fp16'),
-    ]
-    
     for name, params, quant in models:
-        vram = calculate_vram_requirement(params, quant)
+        vram = vram_table[(params, quant)]
         print(f"{name:20s} ({quant:4s}): {vram:6.1f} GB")
     print()
     
@@ -38,7 +45,7 @@ def main():
     print("🔬 Example 2: Quantization Comparison for Llama-7B")
     print("-" * 80)
     
-    comparison = get_quantization_comparison(7_000_000_000)
+    comparison = {quant: vram_table[(7_000_000_000, quant)] for quant in QUANTS}
     for quant, vram in comparison.items():
         savings = ((comparison['fp32'] - vram) / comparison['fp32']) * 100
         print(f"{quant:6s}: {vram:5.1f} GB (saves {savings:4.0f}% vs FP32)")
@@ -48,7 +55,7 @@ def main():
     print("🎯 Example 3: GPU Recommendations for Llama-70B (INT4)")
     print("-" * 80)
     
-    vram_needed = calculate_vram_requirement(70_000_000_000, 'int4')
+    vram_needed = vram_table[(70_000_000_000, 'int4')]
     print(f"Required VRAM: {vram_needed:.1f} GB\n")
     
     configs = recommend_gpu_config(vram_needed, prefer_spot=True)
@@ -88,7 +95,7 @@ def main():
     
     print("1. Choosing quantization:")
     for quant in ['fp16', 'int8', 'int4']:
-        vram = calculate_vram_requirement(model_params, quant)
+        vram = vram_table[(model_params, quant)]
         configs = recommend_gpu_config(vram, prefer_spot=True, max_cost_per_hour=5.0)
         if configs:
             best = configs[0]
@@ -97,7 +104,7 @@ def main():
     
     print()
     print("2. Selected: INT4 quantization")
-    selected_vram = calculate_vram_requirement(model_params, 'int4')
+    selected_vram = vram_table[(model_params, 'int4')]
     print(f"   Required VRAM: {selected_vram:.1f} GB")
     
     print()
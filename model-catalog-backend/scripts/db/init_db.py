@@ -2,38 +2,68 @@
 """Database initialization script."""
 
 import asyncio
-import os
 import sys
 from pathlib import Path
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
 
-from sqlalchemy import create_engine, text
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from src.core.config import settings
+from src.core.serialization import json_deserializer, json_serializer
 
 
-async def init_database():
+def _alembic_config() -> Config:
+    """Build the Alembic config independent of the current working directory."""
+    cfg = Config(str(PROJECT_ROOT / "alembic.ini"))
+    cfg.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    return cfg
+
+
+async def check_connection(engine: AsyncEngine) -> None:
+    """Verify the database is reachable."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    print("✅ Database connection successful")
+
+
+async def run_migrations(engine: AsyncEngine) -> None:
+    """Run Alembic migrations in-process on an async connection."""
+    print("🔄 Running database migrations...")
+    
+    def _upgrade(sync_conn: Connection) -> None:
+        cfg = _alembic_config()
+        cfg.attributes["connection"] = sync_conn
+        command.upgrade(cfg, "head")
+    
+    async with engine.begin() as conn:
+        await conn.run_sync(_upgrade)
+    print("✅ Database migrations completed")
+
+
+async def init_database() -> None:
     """Initialize the database."""
     print("🔄 Initializing database...")
     
-    # Create database engine
-    engine = create_engine(settings.DATABASE_URL)
+    # Create async database engine
+    engine = create_async_engine(
+        settings.DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://'),
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
+    )
     
     try:
-        # Test database connection
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1"))
-            print("✅ Database connection successful")
-        
-        # Run Alembic migrations
-        print("🔄 Running database migrations...")
-        os.system("alembic upgrade head")
-        print("✅ Database migrations completed")
-        
+        await asyncio.gather(check_connection(engine), run_migrations(engine))
     except Exception as e:
         print(f"❌ Database initialization failed: {e}")
         sys.exit(1)
+    finally:
+        await engine.dispose()
     
     print("🎉 Database initialization completed successfully!")
 
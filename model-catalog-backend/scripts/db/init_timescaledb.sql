@@ -30,7 +30,38 @@ SELECT add_retention_policy(
     if_not_exists => TRUE
 );
 
+-- Denormalized model id: per-model benchmark queries filter on
+-- benchmark_results.model_id instead of joining through model_versions.
+-- Kept in sync from model_versions by a trigger; rows written before the
+-- column existed are backfilled.
+ALTER TABLE benchmark_results
+    ADD COLUMN IF NOT EXISTS model_id UUID REFERENCES models (id);
+
+CREATE OR REPLACE FUNCTION set_benchmark_result_model_id()
+RETURNS trigger AS $$
+BEGIN
+    SELECT model_id INTO NEW.model_id
+    FROM model_versions
+    WHERE id = NEW.model_version_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_benchmark_results_model_id ON benchmark_results;
+CREATE TRIGGER trg_benchmark_results_model_id
+    BEFORE INSERT OR UPDATE OF model_version_id ON benchmark_results
+    FOR EACH ROW EXECUTE FUNCTION set_benchmark_result_model_id();
+
+UPDATE benchmark_results br
+SET model_id = mv.model_id
+FROM model_versions mv
+WHERE mv.id = br.model_version_id
+  AND br.model_id IS NULL;
+
 -- Create indexes for common query patterns
+CREATE INDEX IF NOT EXISTS idx_benchmark_model_created
+    ON benchmark_results (model_id, created_at);
+
 CREATE INDEX IF NOT EXISTS idx_benchmark_results_ttft_throughput
     ON benchmark_results (ttft_p90_ms, throughput_tokens_sec, benchmark_date DESC);
 
@@ -93,6 +124,155 @@ CREATE INDEX IF NOT EXISTS idx_top_configs_throughput
 -- Refresh policy for top_performing_configs (manual for now)
 -- REFRESH MATERIALIZED VIEW top_performing_configs;
 
+-- Create materialized view for workflow progress per model version
+-- Polled by the Argo UI through GET /workflow/progress; the API refreshes
+-- it every WORKFLOW_PROGRESS_REFRESH_SECONDS (30s by default)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_workflow_progress AS
+SELECT
+    model_version_id,
+    COUNT(*) FILTER (WHERE status = 'pending') AS pending,
+    COUNT(*) FILTER (WHERE status = 'running') AS running,
+    COUNT(*) FILTER (WHERE status = 'completed') AS completed,
+    COUNT(*) FILTER (WHERE status = 'failed') AS failed,
+    COUNT(*) AS total
+FROM benchmark_configs
+GROUP BY model_version_id;
+
+-- Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_workflow_progress_model_version
+    ON mv_workflow_progress (model_version_id);
+
+-- Claim index: pending rows only, in claim order (priority, created_at).
+-- Replaces the earlier (status, priority, created_at) index over pending
+-- and running rows on existing databases without blocking writes.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_benchmark_config_pending_priority
+    ON benchmark_configs (priority, created_at)
+    WHERE status = 'pending';
+DROP INDEX CONCURRENTLY IF EXISTS idx_benchmark_config_status_priority;
+
+-- Partial indexes for the skewed boolean filters: spot-only hardware
+-- listings by price, and recommended models of a use case by suitability.
+-- The latter includes model_id so the join to models needs no heap
+-- access; it replaces idx_model_use_case_top_recommended.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_hardware_spot_cost
+    ON hardware_configs (cost_per_hour_usd)
+    WHERE spot_available = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_model_use_case_recommended_covering
+    ON model_use_cases (use_case_id, suitability_score DESC)
+    INCLUDE (model_id)
+    WHERE recommended = true;
+DROP INDEX CONCURRENTLY IF EXISTS idx_model_use_case_top_recommended;
+
+-- GIN indexes for JSONB containment (@>) filters; jsonb_path_ops is
+-- smaller and faster than the default opclass but only supports @>.
+-- Queries must use col @> '{"key": "value"}' (Column.contains in
+-- SQLAlchemy) rather than col->>'key' = 'value' to hit them.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_models_metadata_gin
+    ON models USING gin (metadata jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_model_versions_model_config_gin
+    ON model_versions USING gin (model_config jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_hardware_specs_gin
+    ON hardware_configs USING gin (specs jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_framework_capabilities_gin
+    ON inference_frameworks USING gin (capabilities jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_taxonomy_characteristics_gin
+    ON use_case_taxonomy USING gin (characteristics jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_taxonomy_default_weights_gin
+    ON use_case_taxonomy USING gin (default_weights jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_model_use_case_performance_gin
+    ON model_use_cases USING gin (performance_summary jsonb_path_ops);
+
+-- Publish status count changes of benchmark_configs for the API's
+-- in-memory progress counters (src/repositories/progress_counter.py).
+-- One notification per model version per statement, carrying the net
+-- change per status and the writer's transaction id. seq keeps payloads
+-- distinct: PostgreSQL folds identical notifications within a transaction.
+CREATE SEQUENCE IF NOT EXISTS benchmark_config_status_seq;
+
+CREATE OR REPLACE FUNCTION notify_benchmark_config_status()
+RETURNS trigger AS $$
+DECLARE
+    changes json;
+    change record;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT json_agg(c) INTO changes
+        FROM (
+            SELECT model_version_id, json_object_agg(status, n) AS deltas
+            FROM (
+                SELECT model_version_id, status, COUNT(*) AS n
+                FROM new_rows
+                GROUP BY model_version_id, status
+            ) AS counts
+            GROUP BY model_version_id
+        ) AS c;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT json_agg(c) INTO changes
+        FROM (
+            SELECT model_version_id, json_object_agg(status, -n) AS deltas
+            FROM (
+                SELECT model_version_id, status, COUNT(*) AS n
+                FROM old_rows
+                GROUP BY model_version_id, status
+            ) AS counts
+            GROUP BY model_version_id
+        ) AS c;
+    ELSE
+        -- Updates that leave status alone net out to nothing
+        SELECT json_agg(c) INTO changes
+        FROM (
+            SELECT model_version_id, json_object_agg(status, n) AS deltas
+            FROM (
+                SELECT model_version_id, status, SUM(delta) AS n
+                FROM (
+                    SELECT model_version_id, status, 1 AS delta FROM new_rows
+                    UNION ALL
+                    SELECT model_version_id, status, -1 AS delta FROM old_rows
+                ) AS moves
+                GROUP BY model_version_id, status
+                HAVING SUM(delta) <> 0
+            ) AS counts
+            GROUP BY model_version_id
+        ) AS c;
+    END IF;
+
+    FOR change IN
+        SELECT * FROM json_to_recordset(changes) AS (model_version_id uuid, deltas json)
+    LOOP
+        PERFORM pg_notify(
+            'benchmark_config_status',
+            json_build_object(
+                'seq', nextval('benchmark_config_status_seq'),
+                'xid', txid_current(),
+                'model_version_id', change.model_version_id,
+                'deltas', change.deltas
+            )::text
+        );
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables need one trigger per event and no column list, so
+-- every UPDATE fires; those not touching status send nothing
+DROP TRIGGER IF EXISTS trg_benchmark_config_status_insert ON benchmark_configs;
+CREATE TRIGGER trg_benchmark_config_status_insert
+    AFTER INSERT ON benchmark_configs
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_benchmark_config_status();
+
+DROP TRIGGER IF EXISTS trg_benchmark_config_status_update ON benchmark_configs;
+CREATE TRIGGER trg_benchmark_config_status_update
+    AFTER UPDATE ON benchmark_configs
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_benchmark_config_status();
+
+DROP TRIGGER IF EXISTS trg_benchmark_config_status_delete ON benchmark_configs;
+CREATE TRIGGER trg_benchmark_config_status_delete
+    AFTER DELETE ON benchmark_configs
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_benchmark_config_status();
+
 -- Grant permissions (adjust as needed)
 -- GRANT SELECT ON ALL TABLES IN SCHEMA public TO model_catalog_user;
 -- GRANT SELECT ON daily_model_stats_view TO model_catalog_user;
@@ -106,5 +286,7 @@ BEGIN
     RAISE NOTICE 'Compression policy: 7 days';
     RAISE NOTICE 'Retention policy: 90 days';
     RAISE NOTICE 'Continuous aggregate: daily_model_stats_view';
+    RAISE NOTICE 'Materialized view: mv_workflow_progress';
+    RAISE NOTICE 'Status change triggers: benchmark_config_status channel';
 END $$;
 
@@ -2,20 +2,24 @@
 """Setup script for Model Catalog Backend development environment."""
 
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 
 def run_command(command, description):
-    """Run a command and handle errors."""
+    """Run a command (argument list, no shell) and handle errors.
+    
+    Output is streamed straight to the terminal rather than buffered.
+    """
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(command, check=True)
         print(f"✅ {description} completed successfully")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed: {e.stderr}")
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"❌ {description} failed: {e}")
         return False
 
 
@@ -30,25 +34,24 @@ def main():
     
     # Create virtual environment
     if not Path("venv").exists():
-        if not run_command("python -m venv venv", "Creating virtual environment"):
+        if not run_command([sys.executable, "-m", "venv", "venv"], "Creating virtual environment"):
             sys.exit(1)
     
-    # Determine activation script based on OS
+    # Determine the venv interpreter based on OS
     if os.name == 'nt':  # Windows
-        activate_script = "venv\\Scripts\\activate"
-        pip_command = "venv\\Scripts\\pip"
+        venv_python = str(Path("venv") / "Scripts" / "python.exe")
     else:  # Unix-like
-        activate_script = "source venv/bin/activate"
-        pip_command = "venv/bin/pip"
+        venv_python = str(Path("venv") / "bin" / "python")
     
     # Install dependencies and development dependencies
-    if not run_command(f"{pip_command} install -e .[dev]", "Installing dependencies and development dependencies"):
+    if not run_command([venv_python, "-m", "pip", "install", "-e", ".[dev]"], "Installing dependencies and development dependencies"):
         sys.exit(1)
     
     # Create .env file if it doesn't exist
     if not Path(".env").exists():
         if Path("env.example").exists():
-            run_command("copy env.example .env" if os.name == 'nt' else "cp env.example .env", "Creating .env file")
+            shutil.copy("env.example", ".env")
+            print("✅ Creating .env file completed successfully")
         else:
             print("⚠️  No env.example file found, please create .env manually")
     
@@ -7,17 +7,26 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
+from datetime import datetime
+from typing import Any, Iterator, List, Tuple
 from uuid import UUID
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
+from sqlalchemy import Select, select, text
 
 from src.core.config import settings
-from src.models import (
-    BenchmarkConfig, ModelVersion, HardwareConfig,
-    InferenceFramework
-)
-from src.repositories.benchmark_config_repository import BenchmarkConfigRepository
+from src.models import ModelVersion, HardwareConfig, InferenceFramework
+from src.repositories.benchmark_config_repository import BULK_CHUNK_SIZE, BenchmarkConfigRepository
+
+try:
+    # asyncpg's C-level uuid.UUID subclass is much cheaper to construct
+    from asyncpg.pgproto.pgproto import UUID as _PgUUID
+    
+    def _uuid_from_bytes(raw: bytes) -> UUID:
+        return _PgUUID(raw)
+except ImportError:  # pragma: no cover - asyncpg is a core dependency
+    def _uuid_from_bytes(raw: bytes) -> UUID:
+        return UUID(bytes=raw)
 
 
 # Configuration matrix dimensions
@@ -32,6 +41,30 @@ WORKLOAD_TYPES = [
 BATCH_SIZES = [1, 2, 4, 8]           # Inference batch sizes
 SEQUENCE_LENGTHS = [1024, 2048, 4096]  # Context lengths
 
+# Priority distribution buckets (upper edges are exclusive)
+PRIORITY_BUCKET_EDGES = [200, 300, 500]
+PRIORITY_BUCKET_NAMES = [
+    "Highest (100-199)",
+    "High (200-299)",
+    "Medium (300-499)",
+    "Low (500+)"
+]
+
+# Priority components (lower = runs first)
+WORKLOAD_BASE_PRIORITY = {
+    "chatbot": 100,
+    "qa": 200,
+    "code-generation": 300,
+    "creative-writing": 400,
+    "summarization": 500
+}
+SEQ_LENGTH_PENALTY = {
+    1024: 0,
+    2048: 20,
+    4096: 40,
+    8192: 60
+}
+
 
 def calculate_priority(workload: str, batch_size: int, sequence_length: int) -> int:
     """
@@ -53,28 +86,158 @@ def calculate_priority(workload: str, batch_size: int, sequence_length: int) ->
     Returns:
         Priority value (100-1000)
     """
-    base_priority = {
-        "chatbot": 100,
-        "qa": 200,
-        "code-generation": 300,
-        "creative-writing": 400,
-        "summarization": 500
-    }.get(workload, 600)
+    base_priority = WORKLOAD_BASE_PRIORITY.get(workload, 600)
     
     # Penalize larger batch sizes (less priority)
     batch_penalty = (batch_size - 1) * 10
     
     # Penalize longer contexts (less priority)
-    seq_penalty = {
-        1024: 0,
-        2048: 20,
-        4096: 40,
-        8192: 60
-    }.get(sequence_length, 80)
+    seq_penalty = SEQ_LENGTH_PENALTY.get(sequence_length, 80)
     
     return base_priority + batch_penalty + seq_penalty
 
 
+def build_priority_table() -> np.ndarray:
+    """
+    Precompute priorities for every (workload, batch size, sequence length).
+    
+    Same rules as calculate_priority, evaluated once by broadcasting.
+    
+    Returns:
+        int16 array indexed as [workload_idx, batch_idx, seq_idx]
+    """
+    base = np.array([WORKLOAD_BASE_PRIORITY.get(w, 600) for w in WORKLOAD_TYPES])
+    batch_pen = (np.array(BATCH_SIZES) - 1) * 10
+    seq_pen = np.array([SEQ_LENGTH_PENALTY.get(s, 80) for s in SEQUENCE_LENGTHS])
+    
+    table = base[:, None, None] + batch_pen[None, :, None] + seq_pen[None, None, :]
+    return table.astype(np.int16)
+
+
+PRIORITY_TABLE = build_priority_table()
+
+
+def random_uuids(n: int) -> List[UUID]:
+    """
+    Generate random version-4 UUIDs in bulk.
+    
+    One os.urandom call with vectorized version/variant bits replaces n
+    uuid4() calls, which dominate matrix generation time. The results are
+    native uuid.UUID instances, so binary COPY sends them as-is.
+    
+    Args:
+        n: Number of UUIDs
+        
+    Returns:
+        List of n UUIDs
+    """
+    raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    buf = raw.tobytes()
+    return [_uuid_from_bytes(buf[i:i + 16]) for i in range(0, 16 * n, 16)]
+
+
+def generate_config_records(
+    model_version_id: UUID,
+    hardware_ids: List[UUID],
+    framework_ids: List[UUID],
+    block_size: int = BULK_CHUNK_SIZE
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Lazily yield config records for the full test matrix.
+    
+    The matrix is enumerated in blocks of flat indices: np.unravel_index
+    maps each block to (hardware, framework, workload, batch, sequence)
+    indices and the column values are gathered with NumPy, so Python only
+    assembles the final tuples.
+    
+    Records follow CONFIG_COPY_COLUMNS order so they can be streamed to
+    BenchmarkConfigRepository.bulk_create_configs without materializing
+    the whole matrix. Every value has the column's native Python type
+    (UUID, int, str, naive UTC datetime for the timestamp column, matching
+    its datetime.utcnow default) so asyncpg's binary COPY encodes it
+    directly, with no text parsing on either side.
+    
+    Args:
+        model_version_id: Model version UUID
+        hardware_ids: Compatible hardware config IDs
+        framework_ids: Inference framework IDs
+        block_size: Records generated per vectorized block
+        
+    Yields:
+        One record tuple per (hardware, framework, workload, batch, sequence)
+    """
+    created_at = datetime.utcnow()
+    shape = (len(hardware_ids), len(framework_ids)) + PRIORITY_TABLE.shape
+    total = int(np.prod(shape))
+    
+    hw_values = np.array(hardware_ids, dtype=object)
+    fw_values = np.array(framework_ids, dtype=object)
+    workload_values = np.array(WORKLOAD_TYPES, dtype=object)
+    batch_values = np.array(BATCH_SIZES)
+    seq_values = np.array(SEQUENCE_LENGTHS)
+    
+    for start in range(0, total, block_size):
+        hw, fw, wl, bs, sl = np.unravel_index(
+            np.arange(start, min(start + block_size, total)), shape
+        )
+        columns = zip(
+            random_uuids(len(hw)),
+            hw_values[hw].tolist(),
+            fw_values[fw].tolist(),
+            workload_values[wl].tolist(),
+            batch_values[bs].tolist(),
+            seq_values[sl].tolist(),
+            PRIORITY_TABLE[wl, bs, sl].tolist()
+        )
+        for config_id, hw_id, fw_id, workload, batch_size, seq_len, priority in columns:
+            yield (
+                config_id,
+                model_version_id,
+                hw_id,
+                fw_id,
+                workload,
+                batch_size,
+                seq_len,
+                'pending',
+                priority,
+                created_at,
+                0
+            )
+
+
+async def fetch_rows(engine: AsyncEngine, stmt: Select) -> List[Any]:
+    """
+    Run a read-only select on its own pooled connection.
+    
+    asyncpg connections can't run statements concurrently, so independent
+    lookups each take a connection to overlap their round trips.
+    
+    Args:
+        engine: Async engine to borrow a connection from
+        stmt: Select statement
+        
+    Returns:
+        Result rows
+    """
+    async with engine.connect() as conn:
+        result = await conn.execute(stmt)
+        return result.all()
+
+
+def emit(lines: List[str]) -> None:
+    """
+    Write buffered report lines with a single write and flush.
+    
+    Args:
+        lines: Lines to write; the list is cleared afterwards
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    lines.clear()
+
+
 async def populate_matrix(
     model_version_id: UUID,
     session: AsyncSession,
@@ -90,57 +253,72 @@ async def populate_matrix(
     - Batch sizes (1, 2, 4, 8)
     - Sequence lengths (1024, 2048, 4096)
     
+    The caller owns the transaction: run this inside ``session.begin()``
+    so the whole matrix lands in a single commit.
+    
     Args:
         model_version_id: Model version UUID
-        session: Database session
+        session: Database session with an active transaction
         dry_run: If True, only count configs without creating
         
     Returns:
         Number of configs created
     """
     
-    # Verify model version exists
-    result = await session.execute(
-        select(ModelVersion).where(ModelVersion.id == model_version_id)
+    # Report lines are buffered and written once per phase
+    out: List[str] = []
+    
+    # Independent metadata lookups, overlapped on separate connections.
+    # Only the columns the matrix needs are fetched.
+    engine = session.bind
+    model_rows, hardware_rows, framework_rows = await asyncio.gather(
+        fetch_rows(engine, select(
+            ModelVersion.quantization,
+            ModelVersion.format,
+            ModelVersion.vram_requirement_gb
+        ).where(ModelVersion.id == model_version_id)),
+        fetch_rows(engine, select(HardwareConfig.id, HardwareConfig.total_vram_gb)),
+        fetch_rows(engine, select(InferenceFramework.id))
     )
-    model_version = result.scalar_one_or_none()
+    
+    # Verify model version exists
+    model_version = model_rows[0] if model_rows else None
     
     if not model_version:
-        print(f"❌ Model version {model_version_id} not found")
+        out.append(f"❌ Model version {model_version_id} not found")
+        emit(out)
         sys.exit(1)
     
-    print(f"\n{'='*70}")
-    print(f"📊 Benchmark Matrix Population")
-    print(f"{'='*70}\n")
-    print(f"Model Version ID: {model_version_id}")
-    print(f"Quantization: {model_version.quantization}")
-    print(f"Format: {model_version.format}")
-    print(f"VRAM Requirement: {model_version.vram_requirement_gb:.2f} GB")
-    print(f"\n{'='*70}\n")
-    
-    # Fetch all hardware configs
-    hw_result = await session.execute(select(HardwareConfig))
-    hardware_configs = hw_result.scalars().all()
-    print(f"🔧 Hardware Configs: {len(hardware_configs)}")
-    
-    # Filter hardware by VRAM requirement (model must fit)
+    out.append(f"\n{'='*70}")
+    out.append(f"📊 Benchmark Matrix Population")
+    out.append(f"{'='*70}\n")
+    out.append(f"Model Version ID: {model_version_id}")
+    out.append(f"Quantization: {model_version.quantization}")
+    out.append(f"Format: {model_version.format}")
+    out.append(f"VRAM Requirement: {model_version.vram_requirement_gb:.2f} GB")
+    out.append(f"\n{'='*70}\n")
+    
+    out.append(f"🔧 Hardware Configs: {len(hardware_rows)}")
+    
+    # Filter hardware by VRAM requirement (model must fit) with one
+    # vectorized comparison over the whole catalog
     vram_needed = model_version.vram_requirement_gb
-    compatible_hardware = [
-        hw for hw in hardware_configs 
-        if hw.total_vram_gb >= vram_needed
-    ]
-    print(f"   Compatible (VRAM >= {vram_needed:.1f}GB): {len(compatible_hardware)}")
+    hw_ids = np.array([hw_id for hw_id, _ in hardware_rows], dtype=object)
+    hw_vram = np.fromiter(
+        (vram for _, vram in hardware_rows), dtype=np.float64, count=len(hardware_rows)
+    )
+    compatible_hardware = hw_ids[hw_vram >= vram_needed].tolist()
+    out.append(f"   Compatible (VRAM >= {vram_needed:.1f}GB): {len(compatible_hardware)}")
     
     if not compatible_hardware:
-        print(f"\n❌ No compatible hardware found for this model!")
-        print(f"   Model requires: {vram_needed:.1f}GB VRAM")
-        print(f"   Max available: {max(hw.total_vram_gb for hw in hardware_configs):.1f}GB")
+        out.append(f"\n❌ No compatible hardware found for this model!")
+        out.append(f"   Model requires: {vram_needed:.1f}GB VRAM")
+        out.append(f"   Max available: {hw_vram.max(initial=0.0):.1f}GB")
+        emit(out)
         sys.exit(1)
     
-    # Fetch all frameworks
-    fw_result = await session.execute(select(InferenceFramework))
-    frameworks = fw_result.scalars().all()
-    print(f"🚀 Inference Frameworks: {len(frameworks)}")
+    frameworks = [fw_id for (fw_id,) in framework_rows]
+    out.append(f"🚀 Inference Frameworks: {len(frameworks)}")
     
     # Calculate expected matrix size
     expected_count = (
@@ -151,64 +329,49 @@ async def populate_matrix(
         len(SEQUENCE_LENGTHS)
     )
     
-    print(f"\n📈 Matrix Dimensions:")
-    print(f"   Hardware:        {len(compatible_hardware)}")
-    print(f"   Frameworks:      {len(frameworks)}")
-    print(f"   Workloads:       {len(WORKLOAD_TYPES)}")
-    print(f"   Batch Sizes:     {len(BATCH_SIZES)}")
-    print(f"   Seq Lengths:     {len(SEQUENCE_LENGTHS)}")
-    print(f"   {'─'*50}")
-    print(f"   Expected Total:  {expected_count:,} configs")
+    out.append(f"\n📈 Matrix Dimensions:")
+    out.append(f"   Hardware:        {len(compatible_hardware)}")
+    out.append(f"   Frameworks:      {len(frameworks)}")
+    out.append(f"   Workloads:       {len(WORKLOAD_TYPES)}")
+    out.append(f"   Batch Sizes:     {len(BATCH_SIZES)}")
+    out.append(f"   Seq Lengths:     {len(SEQUENCE_LENGTHS)}")
+    out.append(f"   {'─'*50}")
+    out.append(f"   Expected Total:  {expected_count:,} configs")
     
     if dry_run:
-        print(f"\n🏁 DRY RUN - No configs created")
-        print(f"{'='*70}\n")
+        out.append(f"\n🏁 DRY RUN - No configs created")
+        out.append(f"{'='*70}\n")
+        emit(out)
         return expected_count
     
-    # Generate cartesian product
-    print(f"\n⚙️  Generating configs...")
-    configs = []
-    
-    for hw in compatible_hardware:
-        for fw in frameworks:
-            for workload in WORKLOAD_TYPES:
-                for batch_size in BATCH_SIZES:
-                    for seq_len in SEQUENCE_LENGTHS:
-                        priority = calculate_priority(workload, batch_size, seq_len)
-                        
-                        config = BenchmarkConfig(
-                            model_version_id=model_version_id,
-                            hardware_config_id=hw.id,
-                            framework_id=fw.id,
-                            workload_type=workload,
-                            batch_size=batch_size,
-                            sequence_length=seq_len,
-                            status='pending',
-                            priority=priority
-                        )
-                        configs.append(config)
-    
-    # Bulk insert using repository
-    print(f"💾 Inserting {len(configs):,} configs into database...")
+    # Stream the cartesian product straight into chunked COPY batches
+    out.append(f"\n⚙️  Generating configs...")
+    configs = generate_config_records(model_version_id, compatible_hardware, frameworks)
+    
+    # Bulk load using repository (COPY on asyncpg). The matrix can simply be
+    # regenerated, so skip waiting on the WAL flush for this transaction.
+    out.append(f"💾 Inserting {expected_count:,} configs into database...")
+    emit(out)
+    await session.execute(text("SET LOCAL synchronous_commit = OFF"))
     repo = BenchmarkConfigRepository(session)
-    count = await repo.bulk_create_configs(configs)
+    count = await repo.bulk_create_configs(configs, commit=False)
     
-    print(f"\n✅ Successfully created {count:,} benchmark configurations!")
+    out.append(f"\n✅ Successfully created {count:,} benchmark configurations!")
     
-    # Show priority distribution
-    priority_ranges = {
-        "Highest (100-199)": len([c for c in configs if 100 <= c.priority < 200]),
-        "High (200-299)": len([c for c in configs if 200 <= c.priority < 300]),
-        "Medium (300-499)": len([c for c in configs if 300 <= c.priority < 500]),
-        "Low (500+)": len([c for c in configs if c.priority >= 500])
-    }
+    # Show priority distribution: every (hardware, framework) pair repeats the
+    # same priority table, so bucket the table once and scale
+    bucket_counts = np.bincount(
+        np.digitize(PRIORITY_TABLE.ravel(), PRIORITY_BUCKET_EDGES),
+        minlength=len(PRIORITY_BUCKET_NAMES)
+    ) * (len(compatible_hardware) * len(frameworks))
     
-    print(f"\n📊 Priority Distribution:")
-    for range_name, count in priority_ranges.items():
-        pct = (count / len(configs) * 100) if configs else 0
-        print(f"   {range_name}: {count:,} ({pct:.1f}%)")
+    out.append(f"\n📊 Priority Distribution:")
+    for range_name, bucket_count in zip(PRIORITY_BUCKET_NAMES, bucket_counts.tolist()):
+        pct = (bucket_count / count * 100) if count else 0
+        out.append(f"   {range_name}: {bucket_count:,} ({pct:.1f}%)")
     
-    print(f"\n{'='*70}\n")
+    out.append(f"\n{'='*70}\n")
+    emit(out)
     
     return count
 
@@ -225,24 +388,29 @@ async def main():
     model_version_id = UUID(sys.argv[1])
     dry_run = "--dry-run" in sys.argv
     
-    engine = create_async_engine(settings.database_url, echo=False)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    engine = create_async_engine(
+        settings.DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://'),
+        echo=False
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
     
     try:
-        async with async_session() as session:
+        async with async_session() as session, session.begin():
             count = await populate_matrix(model_version_id, session, dry_run=dry_run)
             
             if not dry_run:
                 # Show next steps
-                print("🎯 Next Steps:")
-                print(f"   1. Trigger Argo workflow:")
-                print(f"      argo submit benchmark-workflow-v2.yaml \\")
-                print(f"        -p model-version-id=\"{model_version_id}\"")
-                print(f"\n   2. Monitor progress:")
-                print(f"      curl http://api:8000/api/v1/workflow/progress/{model_version_id}")
-                print(f"\n   3. Watch workflow:")
-                print(f"      argo watch model-benchmark-pipeline-v2-xxxxx")
-                print()
+                emit([
+                    "🎯 Next Steps:",
+                    f"   1. Trigger Argo workflow:",
+                    f"      argo submit benchmark-workflow-v2.yaml \\",
+                    f"        -p model-version-id=\"{model_version_id}\"",
+                    f"\n   2. Monitor progress:",
+                    f"      curl http://api:8000/api/v1/workflow/progress/{model_version_id}",
+                    f"\n   3. Watch workflow:",
+                    f"      argo watch model-benchmark-pipeline-v2-xxxxx",
+                    ""
+                ])
                 
     except Exception as e:
         print(f"\n❌ Error: {str(e)}")
@@ -0,0 +1,42 @@
+"""Conditional GET support: weak ETags and If-None-Match handling.
+
+A route derives its ETag from the values its response depends on and
+answers 304 with no body when the client already holds that version.
+
+Example:
+    >>> etag = make_etag(model.id, model.updated_at)
+    >>> if is_not_modified(request, etag):
+    ...     return not_modified_response(etag)
+    >>> response.headers["ETag"] = etag
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values a response is derived from."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already covers etag.
+    
+    Uses the weak comparison from RFC 9110: the W/ prefix is ignored and
+    the header may list several tags or be "*".
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def not_modified_response(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
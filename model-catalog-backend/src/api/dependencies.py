@@ -3,11 +3,20 @@
 Clean dependency injection without business logic.
 """
 
-from typing import AsyncGenerator
-from fastapi import Depends, Header
+import hashlib
+import hmac
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Deque, Dict, Optional, Tuple
+
+import numpy as np
+from fastapi import Depends, Header, HTTPException, status
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from src.core.config import settings
+from src.core.serialization import json_deserializer, json_serializer
 from src.repositories import (
     ModelRepository,
     BenchmarkRepository,
@@ -20,11 +29,26 @@ from src.services import ModelService
 # Database Dependencies
 # ============================================================================
 
-# Create async engine
+# Create async engine with an explicitly sized pool for concurrent requests.
+# No pre-ping: pool_recycle already retires connections before the server
+# drops them, and asyncpg's prepared-statement cache skips the PARSE round
+# trip for repeated queries.
 async_engine = create_async_engine(
     settings.DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://'),
+    pool_size=settings.POOL_SIZE,
+    max_overflow=settings.MAX_OVERFLOW,
+    pool_pre_ping=False,
+    pool_recycle=settings.POOL_RECYCLE,
+    pool_timeout=settings.POOL_TIMEOUT,
+    connect_args={
+        "statement_cache_size": settings.STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.STATEMENT_CACHE_SIZE,
+        "server_settings": {"jit": "off"}
+    },
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer
 )
 
 # Create async session factory
@@ -36,6 +60,36 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False
 )
 
+# Session factory for read-only endpoints, bound to a read-only view of the
+# engine: asyncpg opens each transaction with BEGIN READ ONLY, lazily on the
+# first query, so a handler that never queries (e.g. a cache hit) never
+# touches the pool. Transactions are begun explicitly by get_read_db.
+ReadOnlySessionLocal = async_sessionmaker(
+    async_engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autobegin=False
+)
+
+# Recent latencies (ms) of opening new pool connections, reported by
+# pool_status(); measured by pool events, so sessions still acquire lazily
+_connect_latencies_ms: Deque[float] = deque(maxlen=1000)
+
+
+@event.listens_for(async_engine.sync_engine, "do_connect")
+def _connect_started(dialect: Any, conn_rec: Any, cargs: Any, cparams: Any) -> None:
+    """Stamp the start of a new DBAPI connection on its pool record."""
+    conn_rec.info["connect_started"] = time.perf_counter()
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def _connect_finished(dbapi_connection: Any, connection_record: Any) -> None:
+    """Record how long the new connection took to open."""
+    started = connection_record.info.pop("connect_started", None)
+    if started is not None:
+        _connect_latencies_ms.append((time.perf_counter() - started) * 1000)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get async database session.
@@ -57,6 +111,52 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get a read-only async database session.
+    
+    The session runs a single explicit READ ONLY transaction, so the
+    server can skip write bookkeeping and any accidental write fails fast.
+    No connection is checked out until the first query. Use for GET and
+    query endpoints only.
+    
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    async with ReadOnlySessionLocal() as session, session.begin():
+        yield session
+
+
+def pool_status() -> Dict[str, Any]:
+    """Get connection pool occupancy and connect latency percentiles.
+    
+    Returns:
+        Dictionary with pool counters and p50/p95/p99 latency (ms) of the
+        most recently opened connections; checked_out near size plus
+        max_overflow means requests are queueing for a connection
+    """
+    pool = async_engine.pool
+    latencies = np.fromiter(_connect_latencies_ms, dtype=np.float64)
+    if latencies.size:
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]).round(3).tolist()
+    else:
+        p50 = p95 = p99 = None
+    
+    return {
+        "status": pool.status(),
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.MAX_OVERFLOW,
+        "connect_ms": {
+            "samples": int(latencies.size),
+            "p50": p50,
+            "p95": p95,
+            "p99": p99
+        }
+    }
+
+
 # ============================================================================
 # Repository Dependencies
 # ============================================================================
@@ -103,21 +203,52 @@ async def get_hardware_repository(
     return HardwareRepository(db)
 
 
+async def get_read_benchmark_repository(
+    db: AsyncSession = Depends(get_read_db)
+) -> BenchmarkRepository:
+    """Get benchmark repository bound to a read-only session.
+    
+    Args:
+        db: Read-only database session from get_read_db dependency
+        
+    Returns:
+        BenchmarkRepository: Repository instance
+    """
+    return BenchmarkRepository(db)
+
+
+async def get_read_hardware_repository(
+    db: AsyncSession = Depends(get_read_db)
+) -> HardwareRepository:
+    """Get hardware repository bound to a read-only session.
+    
+    Args:
+        db: Read-only database session from get_read_db dependency
+        
+    Returns:
+        HardwareRepository: Repository instance
+    """
+    return HardwareRepository(db)
+
+
 # ============================================================================
 # Service Dependencies
 # ============================================================================
 
 async def get_model_service(
-    model_repo: ModelRepository = Depends(get_model_repository),
-    benchmark_repo: BenchmarkRepository = Depends(get_benchmark_repository),
-    hardware_repo: HardwareRepository = Depends(get_hardware_repository)
+    db: AsyncSession = Depends(get_read_db)
 ) -> ModelService:
-    """Get model service instance with injected repositories.
+    """Get model service instance with repositories over one read-only session.
+    
+    The repositories are built here rather than as three separate
+    dependencies, so FastAPI resolves a single dependency per request.
+    They only wrap the session, so construction is cheap; the service is
+    per request because the session is. Recommendations never write, and
+    the lazy read-only session means a recommendation cache hit never
+    checks out a connection.
     
     Args:
-        model_repo: Model repository (injected)
-        benchmark_repo: Benchmark repository (injected)
-        hardware_repo: Hardware repository (injected)
+        db: Read-only database session from get_read_db dependency
         
     Returns:
         ModelService: Service instance with all dependencies
@@ -134,9 +265,9 @@ async def get_model_service(
         ```
     """
     return ModelService(
-        model_repo=model_repo,
-        benchmark_repo=benchmark_repo,
-        hardware_repo=hardware_repo
+        model_repo=ModelRepository(db),
+        benchmark_repo=BenchmarkRepository(db),
+        hardware_repo=HardwareRepository(db)
     )
 
 
@@ -144,8 +275,46 @@ async def get_model_service(
 # Utility Dependencies
 # ============================================================================
 
+def _hash_api_key(api_key: str) -> bytes:
+    """Hash an API key so raw keys are never compared or cached."""
+    return hashlib.blake2b(api_key.encode(), digest_size=32).digest()
+
+
+@lru_cache(maxsize=1)
+def _configured_key_digests() -> Tuple[bytes, ...]:
+    """Digests of settings.API_KEYS, computed once."""
+    return tuple(_hash_api_key(key) for key in settings.API_KEYS)
+
+
+@lru_cache(maxsize=None)
+def _user_for_digest(key_digest: bytes) -> Dict[str, str]:
+    """User for a configured key digest.
+    
+    Only called after _lookup_user matched the digest, so the cache holds at
+    most one entry per configured key; unknown keys never reach it.
+    """
+    return {"id": f"key-{key_digest.hex()[:12]}", "role": "admin"}
+
+
+def _lookup_user(key_digest: bytes) -> Optional[Dict[str, str]]:
+    """Resolve a key digest to its user, or None if the key is unknown.
+    
+    Compares against every configured digest with hmac.compare_digest so
+    timing doesn't reveal which key (or how much of it) matched.
+    """
+    matched = False
+    for known in _configured_key_digests():
+        matched |= hmac.compare_digest(key_digest, known)
+    
+    if not matched:
+        return None
+    return _user_for_digest(key_digest)
+
+
 async def verify_api_key(api_key: str = Header(None)) -> str:
-    """Verify API key for protected endpoints (placeholder).
+    """Verify API key for protected endpoints.
+    
+    With no API_KEYS configured (development), any key is accepted.
     
     Args:
         api_key: API key from header
@@ -154,32 +323,31 @@ async def verify_api_key(api_key: str = Header(None)) -> str:
         str: Verified API key
         
     Raises:
-        HTTPException: If API key is invalid
-        
-    Note:
-        This is a placeholder. Implement actual authentication as needed.
+        HTTPException: If API key is missing or invalid
     """
-    # TODO: Implement actual API key verification
-    # For now, just return the key
-    return api_key or "dev-key"
+    if not settings.API_KEYS:
+        return api_key or "dev-key"
+    
+    if not api_key or _lookup_user(_hash_api_key(api_key)) is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing API key"
+        )
+    return api_key
 
 
 async def get_current_user(api_key: str = Depends(verify_api_key)) -> dict:
-    """Get current authenticated user (placeholder).
+    """Get current authenticated user.
     
     Args:
         api_key: Verified API key
         
     Returns:
         dict: User information
-        
-    Note:
-        This is a placeholder. Implement actual user retrieval as needed.
     """
-    # TODO: Implement actual user retrieval
-    return {
-        "id": "dev-user",
-        "role": "admin",
-        "api_key": api_key
-    }
+    user = _lookup_user(_hash_api_key(api_key)) if settings.API_KEYS else None
+    if user is None:
+        user = {"id": "dev-user", "role": "admin"}
+    
+    return {**user, "api_key": api_key}
 
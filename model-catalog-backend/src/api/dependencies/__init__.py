@@ -1 +0,0 @@
-"""API dependencies package."""
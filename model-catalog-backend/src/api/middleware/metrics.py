@@ -1,5 +1,8 @@
 """Prometheus metrics middleware for monitoring and observability."""
 
+from itertools import product
+from typing import Dict, Tuple
+
 from prometheus_client import Counter, Histogram, Gauge, Info
 from prometheus_fastapi_instrumentator import Instrumentator
 
@@ -71,6 +74,27 @@ APP_INFO = Info(
 )
 
 
+# ============================================================================
+# Pre-bound Label Children
+# ============================================================================
+# Counter.labels() parses kwargs and takes a lock on every call; hot paths
+# reuse the bound children instead.
+
+CACHE_OPERATION_TYPES = ('get', 'set', 'delete')
+CACHE_OPERATION_RESULTS = ('hit', 'miss', 'error')
+
+_CACHE_OPS: Dict[Tuple[str, str], Counter] = {
+    (operation, result): CACHE_OPERATIONS.labels(operation=operation, result=result)
+    for operation, result in product(CACHE_OPERATION_TYPES, CACHE_OPERATION_RESULTS)
+}
+
+# Use cases are open-ended, so recommendation children are bound on first use
+_RECOMMENDATION_COUNTS: Dict[Tuple[str, bool], Counter] = {}
+
+# Running get hit/miss totals behind CACHE_HIT_RATE
+_cache_get_totals = {'hit': 0, 'miss': 0}
+
+
 def setup_metrics(app):
     """Setup Prometheus metrics instrumentation.
     
@@ -128,7 +152,17 @@ def record_cache_operation(operation: str, result: str):
         operation: Operation type (get, set, delete)
         result: Operation result (hit, miss, error)
     """
-    CACHE_OPERATIONS.labels(operation=operation, result=result).inc()
+    child = _CACHE_OPS.get((operation, result))
+    if child is None:
+        child = _CACHE_OPS[(operation, result)] = CACHE_OPERATIONS.labels(
+            operation=operation, result=result
+        )
+    child.inc()
+    
+    if operation == 'get' and result in _cache_get_totals:
+        _cache_get_totals[result] += 1
+        hits = _cache_get_totals['hit']
+        update_cache_metrics(hits / (hits + _cache_get_totals['miss']) * 100)
 
 
 def record_recommendation(use_case: str, cache_hit: bool, duration: float):
@@ -139,10 +173,13 @@ def record_recommendation(use_case: str, cache_hit: bool, duration: float):
         cache_hit: Whether result came from cache
         duration: Time taken in seconds
     """
-    RECOMMENDATION_COUNT.labels(
-        use_case=use_case,
-        cache_hit='true' if cache_hit else 'false'
-    ).inc()
+    child = _RECOMMENDATION_COUNTS.get((use_case, cache_hit))
+    if child is None:
+        child = _RECOMMENDATION_COUNTS[(use_case, cache_hit)] = RECOMMENDATION_COUNT.labels(
+            use_case=use_case,
+            cache_hit='true' if cache_hit else 'false'
+        )
+    child.inc()
     
     RECOMMENDATION_DURATION.observe(duration)
 
@@ -0,0 +1,127 @@
+"""Read-through Redis caching for read-only API routes.
+
+Cache failures never fail a request: errors count as misses and the route
+falls through to the database. Every lookup is recorded in the Prometheus
+cache metrics (hit/miss/error counters and the hit-rate gauge).
+
+Example:
+    >>> cached = get_cached(key)
+    >>> if cached is not None:
+    ...     return BenchmarkResponse(**cached)
+    >>> response = ...
+    >>> set_cached(key, response.model_dump(mode="json"), ttl=60)
+
+Namespaces that writes must invalidate wholesale carry a generation number
+in their keys (see generation_key): invalidating is a single INCR, and
+entries of older generations are never read again and expire with their TTL.
+"""
+
+from typing import Any, Optional
+
+from src.api.middleware.metrics import record_cache_operation
+from src.services.cache.redis_cache import cache
+
+
+def get_cached(key: Optional[str]) -> Optional[Any]:
+    """Get a cached value.
+    
+    Args:
+        key: Cache key; None (no generation_key available) is a miss
+        
+    Returns:
+        Cached value, or None on miss or cache error
+    """
+    if key is None:
+        return None
+    try:
+        value = cache.get(key)
+    except Exception:
+        record_cache_operation('get', 'error')
+        return None
+    
+    record_cache_operation('get', 'miss' if value is None else 'hit')
+    return value
+
+
+def set_cached(key: Optional[str], value: Any, ttl: int) -> None:
+    """Cache a JSON-serializable value, ignoring cache errors.
+    
+    Args:
+        key: Cache key; None (no generation_key available) skips the write
+        value: Value to cache (use ``model_dump(mode="json")``)
+        ttl: Time to live in seconds
+    """
+    if key is None:
+        return
+    try:
+        cache.set(key, value, ttl=ttl)
+    except Exception:
+        record_cache_operation('set', 'error')
+
+
+def get_cached_bytes(key: str) -> Optional[bytes]:
+    """Get a cached response body.
+    
+    Args:
+        key: Cache key
+        
+    Returns:
+        Cached bytes, or None on miss or cache error
+    """
+    try:
+        value = cache.get_bytes(key)
+    except Exception:
+        record_cache_operation('get', 'error')
+        return None
+    
+    record_cache_operation('get', 'miss' if value is None else 'hit')
+    return value
+
+
+def set_cached_bytes(key: str, value: bytes, ttl: int) -> None:
+    """Cache a serialized response body, ignoring cache errors.
+    
+    Args:
+        key: Cache key
+        value: Encoded body, returned verbatim by get_cached_bytes
+        ttl: Time to live in seconds
+    """
+    try:
+        cache.set_bytes(key, value, ttl=ttl)
+    except Exception:
+        record_cache_operation('set', 'error')
+
+
+def generation_key(namespace: str, key: str) -> Optional[str]:
+    """Build a cache key under the namespace's current generation.
+    
+    Args:
+        namespace: Key prefix invalidated as a whole (e.g. ``"models:search"``)
+        key: Key within the namespace
+        
+    Returns:
+        ``"<namespace>:<generation>:<key>"``, or None on cache error, in which
+        case the route skips the cache rather than risk reading a stale entry
+    """
+    try:
+        generation = cache.get_bytes(f"{namespace}:generation")
+    except Exception:
+        record_cache_operation('get', 'error')
+        return None
+    
+    return f"{namespace}:{int(generation or 0)}:{key}"
+
+
+def bump_generation(namespace: str) -> None:
+    """Invalidate every key of a namespace, ignoring cache errors.
+    
+    O(1), unlike deleting by pattern: the generation counter moves on, so
+    generation_key stops producing the old keys.
+    
+    Args:
+        namespace: Key prefix passed to generation_key
+    """
+    try:
+        cache.increment(f"{namespace}:generation")
+    except Exception:
+        record_cache_operation('delete', 'error')
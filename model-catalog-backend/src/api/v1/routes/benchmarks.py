@@ -3,8 +3,10 @@
 from typing import List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 
-from src.api.dependencies import get_benchmark_repository
+from src.api.dependencies import get_benchmark_repository, get_read_benchmark_repository
+from src.api.route_cache import bump_generation, generation_key, get_cached, set_cached
 from src.repositories import BenchmarkRepository
 from src.schemas import (
     BenchmarkCreateRequest,
@@ -19,6 +21,14 @@ from src.models import BenchmarkResult
 
 router = APIRouter(prefix="/benchmarks", tags=["Benchmarks"])
 
+# Validates a whole page of ORM rows in one pydantic-core call
+_BENCH_LIST_ADAPTER = TypeAdapter(list[BenchmarkResponse])
+
+# Cache TTLs (seconds): results are immutable once written, stats only
+# change when a benchmark is added (which invalidates them)
+BENCHMARK_CACHE_TTL = 60
+STATS_CACHE_TTL = 300
+
 
 @router.post(
     "",
@@ -58,6 +68,9 @@ async def create_benchmark(
     # Save to database
     created_benchmark = await repo.create(benchmark)
     
+    # Aggregated stats for this model version are now stale
+    bump_generation(f"benchmarks:stats:{request.model_version_id}")
+    
     return BenchmarkResponse.model_validate(created_benchmark)
 
 
@@ -69,25 +82,23 @@ async def create_benchmark(
 )
 async def query_benchmarks(
     request: BenchmarkQueryRequest,
-    repo: BenchmarkRepository = Depends(get_benchmark_repository)
+    repo: BenchmarkRepository = Depends(get_read_benchmark_repository)
 ) -> BenchmarkListResponse:
     """Query benchmarks with filters."""
-    # Get filtered benchmarks
-    benchmarks = await repo.get_by_criteria(
+    # Get filtered page and total match count (paginated in SQL)
+    benchmarks, total = await repo.get_by_criteria(
         model_version_id=request.model_version_id,
         hardware_config_id=request.hardware_config_id,
         framework_id=request.framework_id,
         workload_type=request.workload_type,
         max_ttft_p90=request.max_ttft_p90_ms,
-        min_throughput=request.min_throughput
+        min_throughput=request.min_throughput,
+        skip=request.skip,
+        limit=request.limit
     )
     
-    # Apply pagination
-    total = len(benchmarks)
-    paginated = benchmarks[request.skip:request.skip + request.limit]
-    
     # Convert to responses
-    items = [BenchmarkResponse.model_validate(b) for b in paginated]
+    items = _BENCH_LIST_ADAPTER.validate_python(benchmarks, from_attributes=True)
     
     return BenchmarkListResponse(
         items=items,
@@ -106,9 +117,14 @@ async def query_benchmarks(
 )
 async def get_benchmark(
     benchmark_id: UUID,
-    repo: BenchmarkRepository = Depends(get_benchmark_repository)
+    repo: BenchmarkRepository = Depends(get_read_benchmark_repository)
 ) -> BenchmarkResponse:
     """Get benchmark by ID."""
+    cache_key = f"benchmarks:{benchmark_id}"
+    cached = get_cached(cache_key)
+    if cached is not None:
+        return BenchmarkResponse(**cached)
+    
     benchmark = await repo.get_by_id(benchmark_id)
     
     if not benchmark:
@@ -117,7 +133,9 @@ async def get_benchmark(
             detail=f"Benchmark with id {benchmark_id} not found"
         )
     
-    return BenchmarkResponse.model_validate(benchmark)
+    response = BenchmarkResponse.model_validate(benchmark)
+    set_cached(cache_key, response.model_dump(mode="json"), ttl=BENCHMARK_CACHE_TTL)
+    return response
 
 
 @router.get(
@@ -130,17 +148,17 @@ async def get_benchmarks_by_model_version(
     model_version_id: UUID,
     skip: int = 0,
     limit: int = 50,
-    repo: BenchmarkRepository = Depends(get_benchmark_repository)
+    repo: BenchmarkRepository = Depends(get_read_benchmark_repository)
 ) -> BenchmarkListResponse:
     """Get benchmarks for a model version."""
-    benchmarks = await repo.get_by_model_version(model_version_id)
-    
-    # Apply pagination
-    total = len(benchmarks)
-    paginated = benchmarks[skip:skip + limit]
+    benchmarks, total = await repo.get_by_model_version(
+        model_version_id,
+        skip=skip,
+        limit=limit
+    )
     
     # Convert to responses
-    items = [BenchmarkResponse.model_validate(b) for b in paginated]
+    items = _BENCH_LIST_ADAPTER.validate_python(benchmarks, from_attributes=True)
     
     return BenchmarkListResponse(
         items=items,
@@ -159,14 +177,22 @@ async def get_benchmarks_by_model_version(
 async def get_benchmark_stats(
     model_version_id: UUID,
     workload_type: str | None = None,
-    repo: BenchmarkRepository = Depends(get_benchmark_repository)
+    repo: BenchmarkRepository = Depends(get_read_benchmark_repository)
 ) -> BenchmarkStatsResponse:
     """Get aggregated benchmark statistics."""
+    cache_key = generation_key(
+        f"benchmarks:stats:{model_version_id}", workload_type or 'all'
+    )
+    cached = get_cached(cache_key)
+    if cached is not None:
+        return BenchmarkStatsResponse(**cached)
+    
     stats = await repo.get_aggregated_stats(
         model_version_id=model_version_id,
         workload_type=workload_type
     )
     
+    set_cached(cache_key, stats, ttl=STATS_CACHE_TTL)
     return BenchmarkStatsResponse(**stats)
 
 
@@ -179,20 +205,20 @@ async def get_benchmark_stats(
 async def get_latest_benchmarks(
     model_version_id: UUID,
     limit: int = 10,
-    repo: BenchmarkRepository = Depends(get_benchmark_repository)
+    repo: BenchmarkRepository = Depends(get_read_benchmark_repository)
 ) -> BenchmarkListResponse:
     """Get latest benchmarks."""
-    benchmarks = await repo.get_latest_benchmarks(
+    benchmarks, total = await repo.get_latest_benchmarks(
         model_version_id=model_version_id,
         limit=limit
     )
     
     # Convert to responses
-    items = [BenchmarkResponse.model_validate(b) for b in benchmarks]
+    items = _BENCH_LIST_ADAPTER.validate_python(benchmarks, from_attributes=True)
     
     return BenchmarkListResponse(
         items=items,
-        total=len(items),
+        total=total,
         skip=0,
         limit=limit
     )
@@ -1,18 +1,23 @@
 """Hardware and VRAM calculation API endpoints."""
 
+from functools import lru_cache
 from typing import List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 
-from src.api.dependencies import get_hardware_repository
+from src.api.dependencies import get_hardware_repository, get_read_hardware_repository
+from src.api.route_cache import get_cached, set_cached
 from src.repositories import HardwareRepository
 from src.schemas import (
     HardwareConfigCreateRequest,
     HardwareConfigQueryRequest,
     VRAMCalculationRequest,
+    VRAMBatchCalculationRequest,
     GPURecommendationRequest,
     HardwareConfigResponse,
     VRAMCalculationResponse,
+    VRAMBatchCalculationResponse,
     GPURecommendationResponse,
     GPUConfigRecommendation,
     HardwareConfigListResponse,
@@ -20,6 +25,7 @@ from src.schemas import (
 )
 from src.models import HardwareConfig
 from src.services.hardware.vram_calculator import (
+    calculate_vram_batch,
     calculate_vram_requirement,
     recommend_gpu_config
 )
@@ -27,6 +33,12 @@ from src.services.hardware.vram_calculator import (
 
 router = APIRouter(prefix="/hardware", tags=["Hardware"])
 
+# Validates a whole page of ORM rows in one pydantic-core call
+_HARDWARE_LIST_ADAPTER = TypeAdapter(list[HardwareConfigResponse])
+
+# Cache TTL (seconds) for single hardware configs
+HARDWARE_CACHE_TTL = 60
+
 
 # ============================================================================
 # Hardware Config Endpoints
@@ -69,35 +81,35 @@ async def create_hardware_config(
 )
 async def query_hardware_configs(
     request: HardwareConfigQueryRequest,
-    repo: HardwareRepository = Depends(get_hardware_repository)
+    repo: HardwareRepository = Depends(get_read_hardware_repository)
 ) -> HardwareConfigListResponse:
     """Query hardware configurations."""
+    page = {"skip": request.skip, "limit": request.limit}
+    
     # Get configs by GPU type if specified
     if request.gpu_type:
-        configs = await repo.get_by_gpu_type(request.gpu_type)
+        configs, total = await repo.get_by_gpu_type(request.gpu_type, **page)
     # Get by VRAM requirement
     elif request.min_vram_gb:
-        configs = await repo.get_by_vram_requirement(
+        configs, total = await repo.get_by_vram_requirement(
             min_vram_gb=request.min_vram_gb,
-            prefer_spot=request.spot_only
+            prefer_spot=request.spot_only,
+            **page
         )
     # Get cost-optimized
     elif request.min_vram_gb and request.max_cost_per_hour:
-        configs = await repo.get_cost_optimized(
+        configs, total = await repo.get_cost_optimized(
             min_vram_gb=request.min_vram_gb,
             max_cost_per_hour=request.max_cost_per_hour,
-            cloud_provider=request.cloud_provider
+            cloud_provider=request.cloud_provider,
+            **page
         )
     # Get all
     else:
-        configs = await repo.list(skip=request.skip, limit=request.limit)
-    
-    # Apply pagination
-    total = len(configs)
-    paginated = configs[request.skip:request.skip + request.limit]
+        configs, total = await repo.list_paginated(**page)
     
     # Convert to responses
-    items = [HardwareConfigResponse.model_validate(c) for c in paginated]
+    items = _HARDWARE_LIST_ADAPTER.validate_python(configs, from_attributes=True)
     
     return HardwareConfigListResponse(
         items=items,
@@ -116,9 +128,14 @@ async def query_hardware_configs(
 )
 async def get_hardware_config(
     config_id: UUID,
-    repo: HardwareRepository = Depends(get_hardware_repository)
+    repo: HardwareRepository = Depends(get_read_hardware_repository)
 ) -> HardwareConfigResponse:
     """Get hardware configuration by ID."""
+    cache_key = f"hardware:{config_id}"
+    cached = get_cached(cache_key)
+    if cached is not None:
+        return HardwareConfigResponse(**cached)
+    
     config = await repo.get_by_id(config_id)
     
     if not config:
@@ -127,7 +144,9 @@ async def get_hardware_config(
             detail=f"Hardware configuration with id {config_id} not found"
         )
     
-    return HardwareConfigResponse.model_validate(config)
+    response = HardwareConfigResponse.model_validate(config)
+    set_cached(cache_key, response.model_dump(mode="json"), ttl=HARDWARE_CACHE_TTL)
+    return response
 
 
 # ============================================================================
@@ -154,19 +173,43 @@ async def calculate_vram(
     This is a pure calculation endpoint - no database access needed.
     """
     try:
-        vram_gb = calculate_vram_requirement(
-            parameters=request.parameters,
-            quantization=request.quantization,
-            batch_size=request.batch_size,
-            sequence_length=request.sequence_length
+        return _vram_response(
+            request.parameters,
+            request.quantization,
+            request.batch_size,
+            request.sequence_length
         )
         
-        return VRAMCalculationResponse(
-            vram_required_gb=vram_gb,
-            parameters=request.parameters,
-            quantization=request.quantization,
-            batch_size=request.batch_size,
-            sequence_length=request.sequence_length
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+
+
+@router.post(
+    "/vram/calculate_batch",
+    response_model=VRAMBatchCalculationResponse,
+    summary="Calculate VRAM requirements in bulk",
+    description="""
+    Calculate VRAM requirements for several models in one call.
+    
+    `parameters` and `quantization` are aligned lists (one entry per model);
+    results are returned in the same order.
+    """
+)
+async def calculate_vram_batch_endpoint(
+    request: VRAMBatchCalculationRequest
+) -> VRAMBatchCalculationResponse:
+    """Calculate VRAM requirements for several models.
+    
+    This is a pure calculation endpoint - no database access needed.
+    """
+    try:
+        vram_gb = calculate_vram_batch(
+            request.parameters,
+            request.quantization,
+            batch_size=request.batch_size
         )
         
     except ValueError as e:
@@ -174,6 +217,33 @@ async def calculate_vram(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(e)
         )
+    
+    return VRAMBatchCalculationResponse(vram_required_gb=vram_gb.tolist())
+
+
+@lru_cache(maxsize=4096)
+def _vram_response(
+    parameters: int,
+    quantization: str,
+    batch_size: int,
+    sequence_length: int
+) -> VRAMCalculationResponse:
+    """Build the VRAM response for one input combination.
+    
+    Inputs come from a small discrete space and the result is pure, so
+    responses are memoized whole: repeat requests skip both the
+    calculation and response model construction. Invalid quantizations
+    raise ValueError, which is never cached.
+    """
+    return VRAMCalculationResponse(
+        vram_required_gb=calculate_vram_requirement(
+            parameters, quantization, batch_size, sequence_length
+        ),
+        parameters=parameters,
+        quantization=quantization,
+        batch_size=batch_size,
+        sequence_length=sequence_length
+    )
 
 
 # ============================================================================
@@ -210,13 +280,12 @@ async def recommend_gpu(
             max_cost_per_hour=request.max_cost_per_hour
         )
         
-        # Convert to response models
-        recommendations = [
-            GPUConfigRecommendation(**config)
-            for config in configs
-        ]
+        # Convert to response models; configs come from our own
+        # calculator, so skip re-validating every field of every row
+        construct = GPUConfigRecommendation.model_construct
+        recommendations = [construct(**config) for config in configs]
         
-        return GPURecommendationResponse(
+        return GPURecommendationResponse.model_construct(
             vram_needed_gb=request.vram_needed_gb,
             recommendations=recommendations
         )
@@ -1,17 +1,22 @@
 """Model-related API endpoints."""
 
+import hashlib
+import json
 from typing import List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.conditional import is_not_modified, make_etag, not_modified_response
 from src.api.dependencies import get_db, get_model_repository
+from src.api.route_cache import bump_generation, generation_key, get_cached, set_cached
 from src.repositories import ModelRepository
 from src.schemas import (
     ModelCreateRequest,
     ModelUpdateRequest,
     ModelSearchRequest,
     ModelResponse,
+    ModelVersionResponse,
     ModelSummaryResponse,
     ModelDetailResponse,
     ModelListResponse,
@@ -23,6 +28,44 @@ from src.models import Model
 
 router = APIRouter(prefix="/models", tags=["Models"])
 
+# Column fields copied from ORM rows by _model_response
+_MODEL_FIELDS = tuple(f for f in ModelResponse.model_fields if f != 'versions')
+_VERSION_FIELDS = tuple(ModelVersionResponse.model_fields)
+
+# Search results are cached briefly; popular filter combinations repeat
+# across clients, and every model write invalidates them
+SEARCH_CACHE_TTL = 30
+SEARCH_CACHE_NAMESPACE = "models:search"
+
+
+def _model_response(model: Model) -> ModelResponse:
+    """Build a ModelResponse from an ORM row without re-validating it.
+    
+    Rows come from our own database, so the schema's constraints already
+    hold; model_construct skips validation and just copies attributes.
+    """
+    return ModelResponse.model_construct(
+        **{field: getattr(model, field) for field in _MODEL_FIELDS},
+        versions=[
+            ModelVersionResponse.model_construct(
+                **{field: getattr(version, field) for field in _VERSION_FIELDS}
+            )
+            for version in model.versions
+        ]
+    )
+
+
+def _summary_response(model: Model, version_count: int) -> ModelSummaryResponse:
+    """Build a list-view summary from an ORM row and its version count."""
+    return ModelSummaryResponse.model_construct(
+        id=model.id,
+        name=model.name,
+        architecture=model.architecture,
+        parameters=model.parameters,
+        tags=model.tags,
+        version_count=version_count
+    )
+
 
 @router.post(
     "",
@@ -43,13 +86,14 @@ async def create_model(
         parameters=request.parameters,
         base_model=request.base_model,
         tags=request.tags,
-        metadata={}
+        model_metadata={}
     )
     
     # Save to database
     created_model = await repo.create(model)
+    bump_generation(SEARCH_CACHE_NAMESPACE)
     
-    return ModelResponse.model_validate(created_model)
+    return _model_response(created_model)
 
 
 @router.get(
@@ -59,38 +103,32 @@ async def create_model(
     description="Get paginated list of models with optional filters"
 )
 async def list_models(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 20,
     architecture: str | None = None,
     repo: ModelRepository = Depends(get_model_repository)
 ) -> ModelListResponse:
-    """List models with pagination."""
-    # Build criteria
-    criteria = {}
-    if architecture:
-        criteria['architecture'] = architecture
+    """List models with pagination.
     
-    # Get models
-    if criteria:
-        models = await repo.find_by_criteria(criteria, skip=skip, limit=limit)
-    else:
-        models = await repo.list(skip=skip, limit=limit)
+    The page is tagged with an ETag over its rows (id, updated_at, version
+    count) and the total, so an unchanged page is answered with 304 and
+    no body.
+    """
+    # Get models with version counts and total (single query)
+    rows, total = await repo.list_summaries(skip=skip, limit=limit, architecture=architecture)
     
-    # Get total count
-    total = await repo.count()
+    etag = make_etag(
+        total, skip, limit, architecture,
+        [(m.id, m.updated_at, version_count) for m, version_count in rows]
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
     
     # Convert to summary responses
-    items = [
-        ModelSummaryResponse(
-            id=m.id,
-            name=m.name,
-            architecture=m.architecture,
-            parameters=m.parameters,
-            tags=m.tags,
-            version_count=len(m.versions) if hasattr(m, 'versions') else 0
-        )
-        for m in models
-    ]
+    items = [_summary_response(m, version_count) for m, version_count in rows]
     
     return ModelListResponse(
         items=items,
@@ -109,10 +147,17 @@ async def list_models(
 )
 async def get_model(
     model_id: UUID,
+    request: Request,
+    response: Response,
     repo: ModelRepository = Depends(get_model_repository)
 ) -> ModelResponse:
-    """Get model by ID."""
-    model = await repo.get_by_id(model_id)
+    """Get model by ID.
+    
+    Returns 304 without a body when If-None-Match matches the model's
+    ETag. The tag covers the versions too, since adding a version does
+    not touch the model's updated_at.
+    """
+    model = await repo.get_with_versions(model_id)
     
     if not model:
         raise HTTPException(
@@ -120,7 +165,15 @@ async def get_model(
             detail=f"Model with id {model_id} not found"
         )
     
-    return ModelResponse.model_validate(model)
+    etag = make_etag(
+        model.id, model.updated_at,
+        [(v.id, v.updated_at) for v in model.versions]
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+    
+    return _model_response(model)
 
 
 @router.get(
@@ -159,24 +212,19 @@ async def update_model(
     repo: ModelRepository = Depends(get_model_repository)
 ) -> ModelResponse:
     """Update model."""
-    # Get existing model
-    model = await repo.get_by_id(model_id)
+    # Write only the fields provided, in one UPDATE ... RETURNING
+    updated_model = await repo.update_fields(
+        model_id, request.model_dump(exclude_unset=True)
+    )
     
-    if not model:
+    if not updated_model:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Model with id {model_id} not found"
         )
     
-    # Update fields if provided
-    update_data = request.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(model, field, value)
-    
-    # Save changes
-    updated_model = await repo.update(model_id, model)
-    
-    return ModelResponse.model_validate(updated_model)
+    bump_generation(SEARCH_CACHE_NAMESPACE)
+    return _model_response(updated_model)
 
 
 @router.delete(
@@ -191,18 +239,16 @@ async def delete_model(
     repo: ModelRepository = Depends(get_model_repository)
 ) -> DeleteResponse:
     """Delete model."""
-    # Check if exists
-    exists = await repo.exists(model_id)
+    # Delete; the statement's row count doubles as the existence check
+    deleted = await repo.delete(model_id)
     
-    if not exists:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Model with id {model_id} not found"
         )
     
-    # Delete
-    deleted = await repo.delete(model_id)
-    
+    bump_generation(SEARCH_CACHE_NAMESPACE)
     return DeleteResponse(
         success=deleted,
         message="Model deleted successfully",
@@ -220,34 +266,40 @@ async def search_models(
     request: ModelSearchRequest,
     repo: ModelRepository = Depends(get_model_repository)
 ) -> ModelListResponse:
-    """Search models with filters."""
-    models = await repo.search_models(
+    """Search models with filters.
+    
+    Results are cached for SEARCH_CACHE_TTL seconds per distinct request
+    (filters and page); creating, updating or deleting a model bumps the
+    search cache generation, which invalidates them all.
+    """
+    # Every request field selects the page, so all of them form the key
+    key_str = json.dumps(request.model_dump(), sort_keys=True)
+    cache_key = generation_key(
+        SEARCH_CACHE_NAMESPACE, hashlib.md5(key_str.encode()).hexdigest()
+    )
+    cached = get_cached(cache_key)
+    if cached is not None:
+        return ModelListResponse(**cached)
+    
+    rows, total = await repo.search_summaries(
         query=request.query or "",
         architecture=request.architecture,
         min_parameters=request.min_parameters,
-        max_parameters=request.max_parameters
+        max_parameters=request.max_parameters,
+        skip=request.skip,
+        limit=request.limit
     )
     
-    # Apply pagination
-    paginated_models = models[request.skip:request.skip + request.limit]
-    
     # Convert to summary responses
-    items = [
-        ModelSummaryResponse(
-            id=m.id,
-            name=m.name,
-            architecture=m.architecture,
-            parameters=m.parameters,
-            tags=m.tags,
-            version_count=len(m.versions) if hasattr(m, 'versions') else 0
-        )
-        for m in paginated_models
-    ]
+    items = [_summary_response(m, version_count) for m, version_count in rows]
     
-    return ModelListResponse(
+    response = ModelListResponse(
         items=items,
-        total=len(models),
+        total=total,
         skip=request.skip,
         limit=request.limit
     )
+    set_cached(cache_key, response.model_dump(mode="json"), ttl=SEARCH_CACHE_TTL)
+    
+    return response
 
@@ -1,12 +1,28 @@
-"""Workflow orchestration API endpoints for Argo."""
+"""Workflow orchestration API endpoints for Argo.
 
-from typing import List, Optional
+Handlers return JSON encoded with orjson from plain column rows: Argo
+pods poll these endpoints with batches of up to 1000 rows, and orjson
+encodes UUID and datetime values natively, without a per-row validation
+and jsonable_encoder pass. Config lists are joined from memoized per-row
+encodings, and claimed batches arrive as JSON built by PostgreSQL. The
+schemas below document the responses (``responses=``) rather than being
+used to serialize them.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, List, Optional, Sequence, Tuple
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from pydantic import BaseModel, Field, model_validator
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db
+from src.api.conditional import is_not_modified, make_etag, not_modified_response
+from src.api.dependencies import get_db, get_read_db
+from src.api.route_cache import get_cached_bytes, set_cached_bytes
+from src.core.serialization import ORJSONResponse, json_bytes
 from src.repositories.benchmark_config_repository import BenchmarkConfigRepository
 
 
@@ -31,9 +47,9 @@ class ConfigResponse(BaseModel):
     sequence_length: int
     status: str
     priority: int
-    created_at: str
-    started_at: Optional[str] = None
-    completed_at: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     retry_count: int
     
@@ -47,6 +63,36 @@ class ConfigStatusUpdate(BaseModel):
     error_message: Optional[str] = Field(None, max_length=1000, description="Error message if failed")
 
 
+class ConfigStatusItem(ConfigStatusUpdate):
+    """Status update for one config of a bulk request."""
+    config_id: UUID = Field(..., description="Config to update")
+
+
+class BulkStatusUpdate(BaseModel):
+    """Update the status of many configs at once."""
+    updates: List[ConfigStatusItem] = Field(
+        ..., min_length=1, max_length=500, description="Status updates (1-500)"
+    )
+    
+    @model_validator(mode='after')
+    def require_error_messages(self) -> 'BulkStatusUpdate':
+        """Failed configs must carry an error message."""
+        for item in self.updates:
+            if item.status == "failed" and not item.error_message:
+                raise ValueError(
+                    f"error_message is required when status is 'failed' "
+                    f"(config {item.config_id})"
+                )
+        return self
+
+
+class BulkStatusResponse(BaseModel):
+    """Response from a bulk status update."""
+    success: bool
+    configs_updated: int
+    message: str
+
+
 class ProgressStatsResponse(BaseModel):
     """Progress statistics."""
     total: int = Field(..., description="Total number of configs")
@@ -71,10 +117,50 @@ class SuccessResponse(BaseModel):
     message: Optional[str] = None
 
 
+# Config columns returned by the config endpoints, in response order, and
+# a getter reading all of them from a row in one C-level call
+_CONFIG_FIELDS = tuple(ConfigResponse.model_fields)
+_config_values = attrgetter(*_CONFIG_FIELDS)
+
+# Encoded config rows kept for reuse; about two model versions' matrices
+CONFIG_ROW_CACHE_SIZE = 20_000
+
+# Largest X-Pending-Count reported by HEAD /configs/available; counting
+# stops there, which is plenty to tell pods whether to claim
+AVAILABLE_COUNT_CAP = 1000
+
+# Seconds a model version's encoded config list is kept in Redis. Entries
+# are keyed by the list's ETag, so a change is never served stale.
+CONFIG_LIST_CACHE_TTL = 60
+
+
+@lru_cache(maxsize=CONFIG_ROW_CACHE_SIZE)
+def _encode_config_row(values: Tuple[Any, ...]) -> bytes:
+    """JSON object for one config row, memoized by its field values.
+    
+    The key is the full row, so any change (status, timestamps, retries)
+    is a different entry and a stale encoding is never served.
+    """
+    return json_bytes(dict(zip(_CONFIG_FIELDS, values)))
+
+
+def _configs_body(configs: Sequence[Row]) -> bytes:
+    """JSON array of config rows, joined from per-row encodings.
+    
+    Rows polled repeatedly (e.g. the configs of a model version) are
+    encoded once and then only looked up. Both per-row steps are C
+    callables (attrgetter and the lru_cache wrapper) chained with map, so
+    no Python frame runs per row on a cache hit.
+    """
+    rows = map(_encode_config_row, map(_config_values, configs))
+    return b"[" + b",".join(rows) + b"]"
+
+
 # API Endpoints
 @router.post(
     "/configs/get-batch",
-    response_model=List[ConfigResponse],
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[ConfigResponse]}},
     summary="Get pending configs batch",
     description="""
     Get batch of pending configs for workflow to process.
@@ -98,35 +184,18 @@ class SuccessResponse(BaseModel):
 async def get_pending_configs(
     request: ConfigBatchRequest,
     db: AsyncSession = Depends(get_db)
-) -> List[ConfigResponse]:
+) -> ORJSONResponse:
     """Get batch of pending configs for workflow to process."""
     repo = BenchmarkConfigRepository(db)
     
     try:
-        configs = await repo.get_pending_batch(
+        # Claimed and encoded in one statement; the body is passed through
+        body = await repo.claim_pending_batch_json(
             limit=request.limit,
             priority_threshold=request.priority_threshold
         )
         
-        return [
-            ConfigResponse(
-                id=c.id,
-                model_version_id=c.model_version_id,
-                hardware_config_id=c.hardware_config_id,
-                framework_id=c.framework_id,
-                workload_type=c.workload_type,
-                batch_size=c.batch_size,
-                sequence_length=c.sequence_length,
-                status=c.status,
-                priority=c.priority,
-                created_at=c.created_at.isoformat() if c.created_at else None,
-                started_at=c.started_at.isoformat() if c.started_at else None,
-                completed_at=c.completed_at.isoformat() if c.completed_at else None,
-                error_message=c.error_message,
-                retry_count=c.retry_count
-            )
-            for c in configs
-        ]
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
         raise HTTPException(
@@ -135,9 +204,53 @@ async def get_pending_configs(
         )
 
 
+@router.head(
+    "/configs/available",
+    status_code=status.HTTP_200_OK,
+    responses={204: {"description": "No claimable configs"}},
+    summary="Check for claimable configs",
+    description="""
+    Cheap gate before `POST /configs/get-batch`: no rows are locked or
+    claimed. Returns 200 with the number of claimable pending configs in
+    `X-Pending-Count` (capped at 1000), or 204 when there
+    are none.
+    
+    **Example:**
+    ```bash
+    while true; do
+      code=$(curl -s -o /dev/null -w "%{http_code}" -I \
+        "http://api:8000/api/v1/workflow/configs/available?priority_threshold=1000")
+      [ "$code" = 204 ] && { sleep 10; continue; }
+      curl -X POST http://api:8000/api/v1/workflow/configs/get-batch ...
+    done
+    ```
+    """
+)
+async def check_configs_available(
+    priority_threshold: int = Query(1000, ge=0, description="Max priority to count"),
+    db: AsyncSession = Depends(get_read_db)
+) -> Response:
+    """Report whether a get-batch call would claim anything."""
+    repo = BenchmarkConfigRepository(db)
+    
+    try:
+        count = await repo.count_claimable(priority_threshold, cap=AVAILABLE_COUNT_CAP)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to count pending configs: {str(e)}"
+        )
+    
+    return Response(
+        status_code=status.HTTP_200_OK if count else status.HTTP_204_NO_CONTENT,
+        headers={"X-Pending-Count": str(count)}
+    )
+
+
 @router.post(
     "/configs/{config_id}/status",
-    response_model=SuccessResponse,
+    response_class=ORJSONResponse,
+    responses={200: {"model": SuccessResponse}},
     summary="Update config status",
     description="""
     Update config status after processing.
@@ -146,6 +259,9 @@ async def get_pending_configs(
     - **Completing** a benchmark (status='completed')
     - **Failing** a benchmark (status='failed', error_message required)
     
+    Costs one request and one commit per config; pods reporting many
+    results should batch them through `/configs/status/bulk`.
+    
     **Example - Success:**
     ```bash
     curl -X POST http://api:8000/api/v1/workflow/configs/{id}/status \\
@@ -165,7 +281,7 @@ async def update_config_status(
     config_id: UUID,
     update: ConfigStatusUpdate,
     db: AsyncSession = Depends(get_db)
-) -> SuccessResponse:
+) -> ORJSONResponse:
     """Update config status after processing."""
     repo = BenchmarkConfigRepository(db)
     
@@ -183,11 +299,11 @@ async def update_config_status(
             config = await repo.mark_failed(config_id, update.error_message)
             message = "Config marked as failed"
         
-        return SuccessResponse(
-            success=True,
-            config_id=str(config.id),
-            message=message
-        )
+        return ORJSONResponse({
+            "success": True,
+            "config_id": str(config.id),
+            "message": message
+        })
         
     except HTTPException:
         raise
@@ -198,14 +314,66 @@ async def update_config_status(
         )
 
 
+@router.post(
+    "/configs/status/bulk",
+    response_class=ORJSONResponse,
+    responses={200: {"model": BulkStatusResponse}},
+    summary="Update many config statuses",
+    description="""
+    Update the status of up to 500 configs in one request.
+    
+    All updates are applied with a single UPDATE in one transaction.
+    Unknown config ids are skipped; `configs_updated` reports how many
+    configs were changed.
+    
+    **Example:**
+    ```bash
+    curl -X POST http://api:8000/api/v1/workflow/configs/status/bulk \\
+      -H "Content-Type: application/json" \\
+      -d '{"updates": [
+            {"config_id": "...", "status": "completed"},
+            {"config_id": "...", "status": "failed", "error_message": "OOM killed"}
+          ]}'
+    ```
+    """
+)
+async def bulk_update_config_status(
+    request: BulkStatusUpdate,
+    db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
+    """Update the status of many configs in one transaction."""
+    repo = BenchmarkConfigRepository(db)
+    
+    try:
+        count = await repo.bulk_set_final_status(
+            [(u.config_id, u.status, u.error_message) for u in request.updates]
+        )
+        
+        return ORJSONResponse({
+            "success": True,
+            "configs_updated": count,
+            "message": f"Updated {count} of {len(request.updates)} configs"
+        })
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to update configs: {str(e)}"
+        )
+
+
 @router.get(
     "/progress/{model_version_id}",
-    response_model=ProgressStatsResponse,
+    response_class=ORJSONResponse,
+    responses={200: {"model": ProgressStatsResponse}},
     summary="Get workflow progress",
     description="""
     Get workflow progress for a model version.
     
-    Returns status breakdown and completion percentage.
+    Returns status breakdown and completion percentage. Counts are kept in
+    memory, updated by database notifications on every status change; if
+    the listener is down they come from a materialized view refreshed
+    every 30 seconds.
     
     **Example:**
     ```bash
@@ -227,14 +395,14 @@ async def update_config_status(
 )
 async def get_workflow_progress(
     model_version_id: UUID,
-    db: AsyncSession = Depends(get_db)
-) -> ProgressStatsResponse:
+    db: AsyncSession = Depends(get_read_db)
+) -> ORJSONResponse:
     """Get workflow progress for a model version."""
     repo = BenchmarkConfigRepository(db)
     
     try:
         stats = await repo.get_progress_stats(model_version_id)
-        return ProgressStatsResponse(**stats)
+        return ORJSONResponse(stats)
         
     except Exception as e:
         raise HTTPException(
@@ -245,7 +413,8 @@ async def get_workflow_progress(
 
 @router.post(
     "/maintenance/reset-stale",
-    response_model=StaleResetResponse,
+    response_class=ORJSONResponse,
+    responses={200: {"model": StaleResetResponse}},
     summary="Reset stale running configs",
     description="""
     Reset stale 'running' configs back to 'pending'.
@@ -266,18 +435,18 @@ async def get_workflow_progress(
 async def reset_stale_configs(
     timeout_minutes: int = Query(120, ge=30, le=1440, description="Timeout in minutes (30-1440)"),
     db: AsyncSession = Depends(get_db)
-) -> StaleResetResponse:
+) -> ORJSONResponse:
     """Reset stale 'running' configs back to 'pending'."""
     repo = BenchmarkConfigRepository(db)
     
     try:
         count = await repo.reset_stale_running(timeout_minutes)
         
-        return StaleResetResponse(
-            success=True,
-            configs_reset=count,
-            message=f"Reset {count} stale configs back to pending (timeout: {timeout_minutes}min)"
-        )
+        return ORJSONResponse({
+            "success": True,
+            "configs_reset": count,
+            "message": f"Reset {count} stale configs back to pending (timeout: {timeout_minutes}min)"
+        })
         
     except Exception as e:
         raise HTTPException(
@@ -288,7 +457,8 @@ async def reset_stale_configs(
 
 @router.get(
     "/configs/{model_version_id}",
-    response_model=List[ConfigResponse],
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[ConfigResponse]}},
     summary="Get configs for model version",
     description="""
     Get all configs for a model version, optionally filtered by status.
@@ -302,43 +472,48 @@ async def reset_stale_configs(
     ```bash
     curl "http://api:8000/api/v1/workflow/configs/{model-version-id}?status=failed"
     ```
+    
+    Responses carry an ETag; polls sending it back in `If-None-Match` get
+    `304 Not Modified` while the configs are unchanged.
     """
 )
 async def get_configs_by_model_version(
     model_version_id: UUID,
-    status: Optional[str] = Query(None, pattern="^(pending|running|completed|failed)$"),
+    request: Request,
+    status_filter: Optional[str] = Query(
+        None, alias="status", pattern="^(pending|running|completed|failed)$"
+    ),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db)
-) -> List[ConfigResponse]:
-    """Get configs for a model version."""
+) -> ORJSONResponse:
+    """Get configs for a model version.
+    
+    One cheap aggregate (latest updated_at and count of the filtered
+    configs) identifies the current list. Unchanged lists are answered
+    with 304, or with the encoded body cached in Redis under the ETag;
+    only a changed list is fetched and encoded.
+    """
     repo = BenchmarkConfigRepository(db)
     
     try:
-        configs = await repo.get_by_model_version(
-            model_version_id=model_version_id,
-            status=status,
-            limit=limit
-        )
+        latest, count = await repo.get_change_marker(model_version_id, status_filter)
+        etag = make_etag(model_version_id, status_filter, limit, latest, count)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        headers = {"ETag": etag}
         
-        return [
-            ConfigResponse(
-                id=c.id,
-                model_version_id=c.model_version_id,
-                hardware_config_id=c.hardware_config_id,
-                framework_id=c.framework_id,
-                workload_type=c.workload_type,
-                batch_size=c.batch_size,
-                sequence_length=c.sequence_length,
-                status=c.status,
-                priority=c.priority,
-                created_at=c.created_at.isoformat() if c.created_at else None,
-                started_at=c.started_at.isoformat() if c.started_at else None,
-                completed_at=c.completed_at.isoformat() if c.completed_at else None,
-                error_message=c.error_message,
-                retry_count=c.retry_count
+        cache_key = f"workflow:configs:{etag}"
+        body = get_cached_bytes(cache_key)
+        if body is None:
+            configs = await repo.get_by_model_version(
+                model_version_id=model_version_id,
+                status=status_filter,
+                limit=limit
             )
-            for c in configs
-        ]
+            body = _configs_body(configs)
+            set_cached_bytes(cache_key, body, ttl=CONFIG_LIST_CACHE_TTL)
+        
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except Exception as e:
         raise HTTPException(
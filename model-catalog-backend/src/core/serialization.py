@@ -0,0 +1,70 @@
+"""JSON (de)serializers backed by orjson.
+
+Passed to SQLAlchemy engines so JSONB columns (specs, capabilities,
+config_template, ...) are encoded and decoded with orjson instead of the
+stdlib json module. ORJSONResponse and json_bytes do the same for
+handlers that build their response by hand.
+
+Example:
+    >>> engine = create_async_engine(
+    ...     url,
+    ...     json_serializer=json_serializer,
+    ...     json_deserializer=json_deserializer,
+    ... )
+"""
+
+from typing import Any
+from uuid import UUID
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types orjson does not encode natively.
+    
+    orjson's UUID fast path only accepts ``uuid.UUID`` itself, while
+    asyncpg decodes uuid columns to its own C subclass; those are passed
+    through as-is and stringified here.
+    """
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def json_serializer(value: Any) -> str:
+    """Serialize a value to a JSON string."""
+    return orjson.dumps(value, default=_default).decode()
+
+
+def json_deserializer(value: str | bytes) -> Any:
+    """Deserialize a JSON string or bytes."""
+    return orjson.loads(value)
+
+
+def json_bytes(value: Any) -> bytes:
+    """Serialize a value to JSON bytes.
+    
+    Dataclasses, datetime, UUID and NumPy values are encoded natively, so
+    service results can be written out without building schema objects.
+    UUIDs read by asyncpg are accepted without converting them first.
+    """
+    return orjson.dumps(
+        value,
+        default=_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+    
+    For handlers without a response_model. Routes with a response_model
+    should keep the default response class: FastAPI then serializes them
+    straight to JSON bytes with pydantic-core, which a custom response
+    class would disable.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize content; datetime, UUID and NumPy values are native."""
+        return json_bytes(content)
@@ -1,12 +1,96 @@
 """Main FastAPI application for LLM Benchmarking Platform."""
 
-from fastapi import FastAPI
+import asyncio
+import contextlib
+from typing import AsyncIterator
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
 
 from src.core.config import settings
+from src.core.serialization import ORJSONResponse
 from src.api.v1.routes import api_router
+from src.api.dependencies import AsyncSessionLocal, async_engine, pool_status, verify_api_key
 from src.api.middleware.metrics import setup_metrics
+from src.repositories.benchmark_config_repository import BenchmarkConfigRepository
+from src.repositories.progress_counter import progress_counter
+from src.services.ranking import topsis_numba
+
+
+async def refresh_workflow_progress() -> None:
+    """Refresh the workflow progress view every WORKFLOW_PROGRESS_REFRESH_SECONDS.
+    
+    The view only serves reads while the NOTIFY listener is down, so ticks
+    are skipped while it is listening.
+    """
+    while True:
+        await asyncio.sleep(settings.WORKFLOW_PROGRESS_REFRESH_SECONDS)
+        if progress_counter.listening:
+            continue
+        try:
+            async with AsyncSessionLocal() as db:
+                await BenchmarkConfigRepository(db).refresh_progress_view()
+        except Exception as e:
+            # Keep serving the last snapshot; retry on the next tick
+            print(f"⚠️  Workflow progress refresh failed: {e}")
+
+
+async def warm_pool() -> None:
+    """Open POOL_SIZE connections up front so early requests skip the connect.
+    
+    Each connection runs SELECT 1 and goes back to the pool. A database
+    that is not reachable yet only logs a warning; connections are then
+    opened on demand as before.
+    """
+    async def ping() -> None:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    try:
+        await asyncio.gather(*(ping() for _ in range(settings.POOL_SIZE)))
+    except Exception as e:
+        print(f"⚠️  Database pool warm-up failed: {e}")
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm the connection pool and run background tasks for the app's lifetime."""
+    # Resolve ORM mappers and relationships now (~35 ms) rather than in the
+    # first request that queries or builds a model. Pydantic schemas need
+    # no warm-up: v2 builds their validators when the classes are defined.
+    configure_mappers()
+    # Compile the TOPSIS kernel in a worker thread so startup work (and
+    # nothing else) waits on Numba
+    await asyncio.to_thread(topsis_numba.warm_up)
+    await warm_pool()
+    progress_refresh = asyncio.create_task(refresh_workflow_progress())
+    # Dedicated asyncpg connection (outside the pool) for status NOTIFYs
+    progress_listener = asyncio.create_task(progress_counter.run(
+        async_engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    ))
+    
+    print("=" * 80)
+    print(f"🚀 {settings.APP_NAME} v{settings.VERSION}")
+    print("=" * 80)
+    print(f"📊 API Documentation: http://localhost:8000/docs")
+    print(f"📚 ReDoc: http://localhost:8000/redoc")
+    print(f"🔧 Debug mode: {settings.DEBUG}")
+    print(f"🌐 API prefix: {settings.API_V1_STR}")
+    print("=" * 80)
+    
+    yield
+    
+    for task in (progress_refresh, progress_listener):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await async_engine.dispose()
+    
+    print(f"\n👋 {settings.APP_NAME} shutting down...")
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -15,7 +99,8 @@ app = FastAPI(
     version=settings.VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    lifespan=lifespan
 )
 
 # Configure CORS middleware
@@ -27,6 +112,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON bodies (config lists run to hundreds of KB of
+# repetitive UUIDs) for clients sending Accept-Encoding: gzip
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL
+)
+
 # Setup Prometheus metrics
 setup_metrics(app)
 
@@ -37,7 +130,7 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 @app.get("/", include_in_schema=False)
 async def root():
     """Root endpoint - API information."""
-    return JSONResponse({
+    return ORJSONResponse({
         "name": settings.APP_NAME,
         "version": settings.VERSION,
         "status": "running",
@@ -49,23 +142,10 @@ async def root():
     })
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event."""
-    print("=" * 80)
-    print(f"🚀 {settings.APP_NAME} v{settings.VERSION}")
-    print("=" * 80)
-    print(f"📊 API Documentation: http://localhost:8000/docs")
-    print(f"📚 ReDoc: http://localhost:8000/redoc")
-    print(f"🔧 Debug mode: {settings.DEBUG}")
-    print(f"🌐 API prefix: {settings.API_V1_STR}")
-    print("=" * 80)
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event."""
-    print(f"\n👋 {settings.APP_NAME} shutting down...")
+@app.get("/debug/pool", include_in_schema=False, dependencies=[Depends(verify_api_key)])
+async def debug_pool():
+    """Database connection pool status and connect latency percentiles (API key required)."""
+    return ORJSONResponse(pool_status())
 
 
 if __name__ == "__main__":
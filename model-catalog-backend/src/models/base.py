@@ -1,12 +1,13 @@
 """Base model classes and utilities."""
 
+import operator
 import uuid
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy import Column, String, DateTime, Text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
 Base = declarative_base()
@@ -30,12 +31,35 @@ class BaseModel(Base, UUIDMixin, TimestampMixin):
     
     __abstract__ = True
     
+    # Columns BaseRepository.list_after orders and seeks on, newest first;
+    # unique together, so every row has a distinct position
+    __keyset__ = ('created_at', 'id')
+    
+    @classmethod
+    def _cols(cls) -> tuple[str, ...]:
+        """Column names of this model's table, computed once per class.
+        
+        Stored with an attrgetter over the columns' mapped attributes
+        (named differently where a column is, e.g. Model.model_metadata),
+        so to_dict reads every column in one call. Looked up in the class's
+        own __dict__, so a subclass never reuses its parent's columns.
+        """
+        if "_cached_cols" not in cls.__dict__:
+            columns = tuple(cls.__table__.columns)
+            cls._cached_cols = tuple(c.name for c in columns)
+            cls._cached_cols_getter = operator.attrgetter(
+                *(cls.__mapper__.get_property_by_column(c).key for c in columns)
+            )
+        return cls._cached_cols
+    
     def to_dict(self) -> dict[str, Any]:
         """Convert model instance to dictionary."""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        cols = self._cols()
+        values = self._cached_cols_getter(self)
+        # attrgetter returns a bare value, not a tuple, for a single name
+        if len(cols) == 1:
+            values = (values,)
+        return dict(zip(cols, values))
     
     def update_from_dict(self, data: dict[str, Any]) -> None:
         """Update model instance from dictionary."""
@@ -18,6 +18,10 @@ class BenchmarkResult(BaseModel):
     hardware_config_id = Column(UUID(as_uuid=True), ForeignKey("hardware_configs.id"), nullable=False, index=True)
     framework_id = Column(UUID(as_uuid=True), ForeignKey("inference_frameworks.id"), nullable=False, index=True)
     
+    # Denormalized from model_versions.model_id so per-model queries skip the
+    # join; set by the trg_benchmark_results_model_id trigger on insert
+    model_id = Column(UUID(as_uuid=True), ForeignKey("models.id"), nullable=True)
+    
     # Link to configuration that generated this result (nullable for backward compatibility)
     config_id = Column(UUID(as_uuid=True), ForeignKey("benchmark_configs.id"), nullable=True, index=True)
     
@@ -62,6 +66,7 @@ class BenchmarkResult(BaseModel):
         Index('idx_benchmark_composite', 'model_version_id', 'hardware_config_id', 'framework_id', 'benchmark_date', 'config_id'),
         Index('idx_benchmark_latency_sla', 'ttft_p90_ms', 'throughput_tokens_sec'),
         Index('idx_benchmark_date_workload', 'benchmark_date', 'workload_type'),
+        Index('idx_benchmark_model_created', 'model_id', 'created_at'),
     )
     
     def __repr__(self) -> str:
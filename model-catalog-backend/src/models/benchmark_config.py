@@ -84,11 +84,13 @@ class BenchmarkConfig(BaseModel):
     
     # Indexes for performance
     __table_args__ = (
-        # Workflow queries: get pending configs ordered by priority
+        # Workflow queries: claim pending configs ordered by priority. Only
+        # pending rows are indexed, in claim order, so FOR UPDATE SKIP LOCKED
+        # walks the index without filtering or sorting
         Index(
-            'idx_benchmark_config_status_priority', 
-            'status', 'priority', 'created_at',
-            postgresql_where=Column('status').in_(['pending', 'running'])
+            'idx_benchmark_config_pending_priority',
+            'priority', 'created_at',
+            postgresql_where=Column('status') == 'pending'
         ),
         
         # Uniqueness: prevent duplicate configs
@@ -1,6 +1,6 @@
 """Hardware configuration and use case taxonomy models."""
 
-from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, Index
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -34,6 +34,10 @@ class HardwareConfig(BaseModel):
     __table_args__ = (
         Index('idx_hardware_vram_cost', 'total_vram_gb', 'cost_per_hour_usd', 'spot_available'),
         Index('idx_hardware_provider_gpu', 'cloud_provider', 'gpu_type', 'gpu_count'),
+        # Spot-only listings, cheapest first
+        Index('idx_hardware_spot_cost', 'cost_per_hour_usd', postgresql_where='spot_available = true'),
+        # JSONB containment (@>) lookups, e.g. HardwareConfig.specs.contains({...})
+        Index('idx_hardware_specs_gin', 'specs', postgresql_using='gin', postgresql_ops={'specs': 'jsonb_path_ops'}),
     )
     
     def __repr__(self) -> str:
@@ -60,6 +64,10 @@ class InferenceFramework(BaseModel):
     benchmarks = relationship("BenchmarkResult", back_populates="framework")
     benchmark_configs = relationship("BenchmarkConfig", back_populates="framework")
     
+    __table_args__ = (
+        Index('idx_framework_capabilities_gin', 'capabilities', postgresql_using='gin', postgresql_ops={'capabilities': 'jsonb_path_ops'}),
+    )
+    
     def __repr__(self) -> str:
         return f"<InferenceFramework(name={self.name}, version={self.version})>"
 
@@ -83,6 +91,8 @@ class UseCaseTaxonomy(BaseModel):
     
     __table_args__ = (
         Index('idx_taxonomy_category_subcategory', 'category', 'subcategory'),
+        Index('idx_taxonomy_characteristics_gin', 'characteristics', postgresql_using='gin', postgresql_ops={'characteristics': 'jsonb_path_ops'}),
+        Index('idx_taxonomy_default_weights_gin', 'default_weights', postgresql_using='gin', postgresql_ops={'default_weights': 'jsonb_path_ops'}),
     )
     
     def __repr__(self) -> str:
@@ -113,6 +123,16 @@ class ModelUseCase(BaseModel):
     __table_args__ = (
         Index('idx_model_use_case_suitability', 'model_id', 'use_case_id', 'suitability_score'),
         Index('idx_recommended_models', 'model_id', 'recommended', postgresql_where='recommended = true'),
+        # Recommended models of a use case by suitability; covers the join
+        # to models too (INCLUDE model_id), so it is an index-only scan
+        Index(
+            'idx_model_use_case_recommended_covering',
+            'use_case_id',
+            text('suitability_score DESC'),
+            postgresql_include=['model_id'],
+            postgresql_where='recommended = true'
+        ),
+        Index('idx_model_use_case_performance_gin', 'performance_summary', postgresql_using='gin', postgresql_ops={'performance_summary': 'jsonb_path_ops'}),
     )
     
     def __repr__(self) -> str:
@@ -18,8 +18,9 @@ class Model(BaseModel):
     parameters = Column(BigInteger, nullable=False)  # e.g., 7B, 13B, 70B (in billions)
     base_model = Column(String(255), nullable=True)  # Parent model if fine-tuned
     
-    # Metadata and tags
-    metadata = Column(JSONB, nullable=True)  # Flexible model info
+    # Metadata and tags ('metadata' is reserved on declarative classes for
+    # the MetaData collection, so the attribute is named model_metadata)
+    model_metadata = Column('metadata', JSONB, nullable=True)  # Flexible model info
     tags = Column(ARRAY(Text), nullable=True)  # Searchable tags
     
     # Relationships
@@ -30,6 +31,10 @@ class Model(BaseModel):
     
     __table_args__ = (
         Index('idx_model_architecture_params', 'architecture', 'parameters'),
+        # GIN indexes serve JSONB containment (@>) only: filter with
+        # Model.model_metadata.contains({'key': 'value'}), not
+        # Model.model_metadata['key'].astext == 'value', which cannot use them
+        Index('idx_models_metadata_gin', 'metadata', postgresql_using='gin', postgresql_ops={'metadata': 'jsonb_path_ops'}),
     )
     
     def __repr__(self) -> str:
@@ -65,6 +70,7 @@ class ModelVersion(BaseModel):
     __table_args__ = (
         Index('idx_model_version_vram_quant', 'vram_requirement_gb', 'quantization_bits', 'format'),
         Index('idx_model_version_model_quant', 'model_id', 'quantization'),
+        Index('idx_model_versions_model_config_gin', 'model_config', postgresql_using='gin', postgresql_ops={'model_config': 'jsonb_path_ops'}),
     )
     
     def __repr__(self) -> str:
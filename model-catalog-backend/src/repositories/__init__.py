@@ -10,6 +10,7 @@ from .base_repository import BaseRepository
 from .model_repository import ModelRepository
 from .benchmark_repository import BenchmarkRepository
 from .hardware_repository import HardwareRepository
+from .benchmark_config_repository import BenchmarkConfigRepository
 
 __all__ = [
     # Protocols
@@ -22,4 +23,5 @@ __all__ = [
     "ModelRepository",
     "BenchmarkRepository",
     "HardwareRepository",
+    "BenchmarkConfigRepository",
 ]
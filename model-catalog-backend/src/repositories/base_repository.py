@@ -1,18 +1,100 @@
 """Base repository implementation with common functionality."""
 
-from typing import List, Optional, Dict, Any, TypeVar, Generic, Type
+import functools
+from typing import List, Optional, Dict, Any, TypeVar, Generic, Type, Tuple, Sequence, Iterable, FrozenSet
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import (
+    Integer, Select, select, update, delete, func, insert, inspect, column, values, text, exists, bindparam,
+    tuple_
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import DeclarativeBase, raiseload
+from sqlalchemy.sql.base import ExecutableOption
 
 from .protocols import BaseRepositoryProtocol
 
 T = TypeVar('T', bound=DeclarativeBase)
 
+# Planner row estimate of a table, refreshed by VACUUM/ANALYZE; -1 (or 0
+# on older servers) until the table has been analyzed
+ESTIMATED_ROW_COUNT = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)"
+)
+
+# Row batches from this many up are written with COPY by bulk_copy
+# (asyncpg only); smaller ones go through bulk_create's INSERT
+BULK_COPY_THRESHOLD = 500
+
+
+def _criterion_kind(value: Any) -> str:
+    """How find_by_criteria compares a field with value: 'null', 'contains' or 'eq'."""
+    if value is None:
+        return 'null'
+    if isinstance(value, (dict, list)):
+        return 'contains'
+    return 'eq'
+
+
+@functools.lru_cache(maxsize=256)
+def _criteria_select(
+    model_class: type,
+    criteria: Tuple[Tuple[str, str], ...]
+) -> Tuple[Select, Tuple[str, ...]]:
+    """Select for find_by_criteria on one set of fields, built once per set.
+    
+    Values, offset and limit are bound parameters (criteria_<field>,
+    criteria_skip, criteria_limit), so every call with the same fields
+    reuses the statement and its compiled form. Fields must be column
+    attributes of the model; find_by_criteria checks them beforehand.
+    
+    A dict or list value on a JSONB column is matched by containment
+    (col @> value), which the jsonb_path_ops GIN indexes serve; equality
+    would compare whole documents and scan. None matches IS NULL.
+    
+    Args:
+        model_class: Model to select
+        criteria: Sorted (field, _criterion_kind of its value) pairs
+    
+    Returns:
+        Tuple of (statement, the fields bound as parameters)
+    """
+    columns = inspect(model_class).column_attrs
+    conditions = []
+    fields = []
+    for field, kind in criteria:
+        attr = columns[field].class_attribute
+        if kind == 'null':
+            conditions.append(attr.is_(None))
+            continue
+        value = bindparam(f'criteria_{field}')
+        if kind == 'contains' and isinstance(columns[field].columns[0].type, JSONB):
+            conditions.append(attr.contains(value))
+        else:
+            conditions.append(attr == value)
+        fields.append(field)
+    
+    stmt = (
+        select(model_class)
+        .where(*conditions)
+        .options(raiseload('*'))
+        .offset(bindparam('criteria_skip', type_=Integer))
+        .limit(bindparam('criteria_limit', type_=Integer))
+    )
+    return stmt, tuple(fields)
+
 
 class BaseRepository(Generic[T]):
-    """Base repository implementation with common CRUD operations."""
+    """Base repository implementation with common CRUD operations.
+    
+    Entities returned by list, list_paginated and find_by_criteria have
+    their relationships set to raise on access instead of lazy loading:
+    under AsyncSession an implicit lazy load fails anyway, and when it
+    does not it costs one query per row. Callers that need relationships
+    pass loader options (e.g. selectinload(Model.versions)), which take
+    precedence over the raise default; repositories wrap common ones in
+    helpers such as ModelRepository.list_with_versions.
+    """
     
     def __init__(self, db: AsyncSession, model_class: Type[T]):
         """Initialize base repository.
@@ -23,6 +105,8 @@ class BaseRepository(Generic[T]):
         """
         self.db = db
         self.model_class = model_class
+        # Column attribute names find_by_criteria accepts
+        self._columns = frozenset(attr.key for attr in inspect(model_class).column_attrs)
     
     async def create(self, entity: T) -> T:
         """Create a new entity.
@@ -51,20 +135,165 @@ class BaseRepository(Generic[T]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
-    async def list(self, skip: int = 0, limit: int = 100) -> List[T]:
+    async def list(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        *,
+        options: Sequence[ExecutableOption] = ()
+    ) -> List[T]:
         """Get all entities with pagination.
         
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            options: Loader options for relationships the caller will read
             
         Returns:
             List of entities
         """
-        stmt = select(self.model_class).offset(skip).limit(limit)
+        stmt = (
+            select(self.model_class)
+            .options(*self._load_options(options))
+            .offset(skip)
+            .limit(limit)
+        )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
+    async def list_paginated(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        *,
+        options: Sequence[ExecutableOption] = ()
+    ) -> Tuple[List[T], int]:
+        """Get a page of entities together with the total count.
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            options: Loader options for relationships the caller will read
+            
+        Returns:
+            Tuple of (entities, total number of entities)
+        """
+        stmt = select(self.model_class).options(*self._load_options(options))
+        return await self._paginate(stmt, skip, limit)
+    
+    async def list_after(
+        self,
+        *,
+        after: Optional[Tuple[Any, ...]] = None,
+        limit: int = 100,
+        options: Sequence[ExecutableOption] = ()
+    ) -> Tuple[List[T], Optional[Tuple[Any, ...]]]:
+        """Get a page of entities by keyset (seek) pagination.
+        
+        Entities are ordered by the model's __keyset__ columns, descending,
+        and a page starts right after the cursor with a row comparison
+        WHERE (created_at, id) < (:created_at, :id). Unlike OFFSET, no
+        skipped rows are read, so deep pages cost the same as the first.
+        
+        Args:
+            after: Cursor returned with the previous page; None for the first page
+            limit: Maximum number of records to return
+            options: Loader options for relationships the caller will read
+            
+        Returns:
+            Tuple of (entities, cursor of the next page or None after the last)
+        """
+        keyset = [getattr(self.model_class, name) for name in self.model_class.__keyset__]
+        stmt = (
+            select(self.model_class)
+            .options(*self._load_options(options))
+            .order_by(*(col.desc() for col in keyset))
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(*keyset) < tuple_(*after))
+        
+        result = await self.db.execute(stmt)
+        entities = list(result.scalars().all())
+        if len(entities) < limit:
+            return entities, None
+        last = entities[-1]
+        return entities, tuple(getattr(last, name) for name in self.model_class.__keyset__)
+    
+    async def _asyncpg_connection(self) -> Any:
+        """The session's asyncpg connection, inside the session's transaction.
+        
+        SQLAlchemy's asyncpg adapter sends BEGIN lazily, with the first
+        statement it executes. A driver-level call made before that (e.g.
+        copy_records_to_table) would run in autocommit and survive a
+        rollback of the session, so a statement is sent through SQLAlchemy
+        first when no transaction is open yet.
+        
+        Returns:
+            asyncpg Connection; only valid while the session's transaction lasts
+        """
+        conn = await self.db.connection()
+        raw = await conn.get_raw_connection()
+        if not raw.driver_connection.is_in_transaction():
+            await conn.exec_driver_sql("SELECT 1")
+        return raw.driver_connection
+    
+    @staticmethod
+    def _load_options(options: Sequence[ExecutableOption]) -> Tuple[ExecutableOption, ...]:
+        """Caller's loader options, with every other relationship raising on access."""
+        return (*options, raiseload('*'))
+    
+    async def _paginate(self, stmt: Select, skip: int, limit: int) -> Tuple[List[T], int]:
+        """Run a select with OFFSET/LIMIT and count all matching rows.
+        
+        The total comes from a COUNT(*) OVER () window column, so page and
+        count share one round trip. Only when the page is empty (skip past
+        the end) is a separate COUNT query needed.
+        
+        Args:
+            stmt: Select of the model entity, with filters and ordering
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (entities on the page, total matching entities)
+        """
+        rows, total = await self._paginate_rows(stmt, skip, limit)
+        return [row[0] for row in rows], total
+    
+    async def _paginate_rows(
+        self,
+        stmt: Select,
+        skip: int,
+        limit: int
+    ) -> Tuple[List[Tuple[Any, ...]], int]:
+        """Like _paginate, for selects with extra columns besides the entity.
+        
+        Args:
+            stmt: Select with filters and ordering
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (row tuples on the page, total matching rows)
+        """
+        page_stmt = (
+            stmt.add_columns(func.count().over().label('total_count'))
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db.execute(page_stmt)
+        rows = result.all()
+        
+        if rows:
+            return [tuple(row)[:-1] for row in rows], rows[0].total_count
+        if skip == 0:
+            return [], 0
+        
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+        total = (await self.db.execute(count_stmt)).scalar() or 0
+        return [], total
+    
     async def update(self, entity_id: UUID, entity: T) -> T:
         """Update an existing entity.
         
@@ -93,12 +322,27 @@ class BaseRepository(Generic[T]):
         await self.db.commit()
         return result.rowcount > 0
     
-    async def count(self) -> int:
+    async def count(self, approximate: bool = False) -> int:
         """Get total count of entities.
         
+        Args:
+            approximate: Read PostgreSQL's row estimate for the table from
+                pg_class instead of scanning it. Cheap on any table size and
+                good enough for dashboards, but only as current as the last
+                VACUUM/ANALYZE. Falls back to an exact count when no estimate
+                is available (never analyzed, or a hypertable parent).
+        
         Returns:
             Total number of entities
         """
+        if approximate:
+            result = await self.db.execute(
+                ESTIMATED_ROW_COUNT, {'table_name': self.model_class.__table__.fullname}
+            )
+            estimate = result.scalar()
+            if estimate is not None and estimate > 0:
+                return estimate
+        
         stmt = select(func.count()).select_from(self.model_class)
         result = await self.db.execute(stmt)
         return result.scalar() or 0
@@ -112,40 +356,147 @@ class BaseRepository(Generic[T]):
         Returns:
             True if exists, False otherwise
         """
-        entity = await self.get_by_id(entity_id)
-        return entity is not None
+        # SELECT EXISTS(...) answers from the primary key index without
+        # loading the row into an entity
+        stmt = select(exists().where(self.model_class.id == entity_id))
+        result = await self.db.execute(stmt)
+        return bool(result.scalar())
     
     async def bulk_create(self, entities: List[T]) -> List[T]:
         """Create multiple entities in bulk.
         
+        All rows go in one INSERT whose RETURNING clause brings back
+        generated ids and server defaults, instead of a refresh per entity.
+        Only column attributes are inserted; relationships set on the
+        entities are not cascaded.
+        
         Args:
             entities: List of entity instances
             
         Returns:
-            List of created entities
+            List of created entities, loaded from the returned rows, in input order
         """
-        self.db.add_all(entities)
+        if not entities:
+            return []
+        
+        created = await self._insert_returning(entities)
         await self.db.commit()
-        for entity in entities:
-            await self.db.refresh(entity)
-        return entities
+        return created
+    
+    async def _insert_returning(self, entities: List[T]) -> List[T]:
+        """INSERT ... RETURNING the entities' column values, without committing."""
+        keys = [attr.key for attr in inspect(self.model_class).column_attrs]
+        values = [
+            {key: entity.__dict__[key] for key in keys if key in entity.__dict__}
+            for entity in entities
+        ]
+        stmt = insert(self.model_class).returning(
+            self.model_class, sort_by_parameter_order=True
+        )
+        return list((await self.db.scalars(stmt, values)).all())
+    
+    async def bulk_copy(self, rows: Iterable[Dict[str, Any]], commit: bool = True) -> int:
+        """Insert many rows with binary COPY and commit.
+        
+        Meant for backfills: COPY skips per-row statement binding and
+        returns nothing, so no entities are loaded. Python-side column
+        defaults (e.g. UUID ids) are filled in client-side. Rows are copied
+        in groups with the same keys, and columns a group doesn't set are
+        left out of its COPY, so their server defaults (e.g. timestamps)
+        apply just as with bulk_create. Batches under BULK_COPY_THRESHOLD rows, or on a
+        driver other than asyncpg, go through bulk_create's INSERT instead.
+        Either way the rows are written in the session's transaction.
+        
+        Args:
+            rows: Dictionaries of column attribute values, one per row
+            commit: Commit when done; pass False when the caller owns the
+                transaction (e.g. inside ``session.begin()``)
+            
+        Returns:
+            Number of rows inserted
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        
+        conn = await self.db.connection()
+        if len(rows) < BULK_COPY_THRESHOLD or conn.dialect.driver != 'asyncpg':
+            created = await self._insert_returning([self.model_class(**row) for row in rows])
+            if commit:
+                await self.db.commit()
+            return len(created)
+        
+        # One COPY per key set, as bulk_update groups by field set: a
+        # column a row leaves out must get its default, not the NULL a
+        # shared column list would send
+        groups: Dict[FrozenSet[str], List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(frozenset(row), []).append(row)
+        
+        table = self.model_class.__table__
+        copy_conn = await self._asyncpg_connection()
+        for given, group in groups.items():
+            attrs = [
+                (attr.key, attr.columns[0])
+                for attr in inspect(self.model_class).column_attrs
+                if attr.key in given or _has_python_default(attr.columns[0])
+            ]
+            records = [
+                tuple(
+                    row[key] if key in row else _python_default(col)
+                    for key, col in attrs
+                )
+                for row in group
+            ]
+            await copy_conn.copy_records_to_table(
+                table.name,
+                records=records,
+                columns=[col.name for _, col in attrs],
+                schema_name=table.schema
+            )
+        if commit:
+            await self.db.commit()
+        return len(rows)
     
     async def bulk_update(self, updates: List[Dict[str, Any]]) -> int:
         """Bulk update entities.
         
+        Updates setting the same fields are grouped, and each group runs as
+        one UPDATE ... FROM (VALUES ...) joined on id, so a batch costs one
+        statement per distinct field set rather than one per entity. If an
+        id appears more than once in a group, its last update wins. The
+        update dictionaries are not modified.
+        
         Args:
             updates: List of dictionaries with 'id' and update fields
             
         Returns:
-            Number of updated entities
+            Number of updated entities (ids that do not exist are skipped)
         """
-        updated_count = 0
+        groups: Dict[Tuple[str, ...], Dict[Any, Tuple[Any, ...]]] = {}
         for update_data in updates:
-            entity_id = update_data.pop('id')
+            fields = tuple(sorted(key for key in update_data if key != 'id'))
+            groups.setdefault(fields, {})[update_data['id']] = (
+                update_data['id'], *(update_data[field] for field in fields)
+            )
+        
+        # Fields are attribute names, which can differ from column names
+        # (model_metadata maps to the "metadata" column)
+        column_attrs = inspect(self.model_class).column_attrs
+        updated_count = 0
+        for fields, rows in groups.items():
+            if not fields:
+                continue
+            columns = [column_attrs[name].columns[0] for name in ('id', *fields)]
+            new_values = values(
+                *(column(col.name, col.type) for col in columns),
+                name='new_values'
+            ).data(list(rows.values()))
             stmt = (
                 update(self.model_class)
-                .where(self.model_class.id == entity_id)
-                .values(**update_data)
+                .where(self.model_class.id == new_values.c.id)
+                .values({col: new_values.c[col.name] for col in columns[1:]})
+                .execution_options(synchronize_session=False)
             )
             result = await self.db.execute(stmt)
             updated_count += result.rowcount
@@ -157,7 +508,9 @@ class BaseRepository(Generic[T]):
         self, 
         criteria: Dict[str, Any],
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        *,
+        options: Sequence[ExecutableOption] = ()
     ) -> List[T]:
         """Find entities by criteria.
         
@@ -165,28 +518,65 @@ class BaseRepository(Generic[T]):
             criteria: Dictionary of field:value pairs
             skip: Number of records to skip
             limit: Maximum number of records to return
+            options: Loader options for relationships the caller will read
             
         Returns:
             List of matching entities
+        
+        Raises:
+            ValueError: If a field is not a column of the model
         """
-        stmt = select(self.model_class)
+        unknown = criteria.keys() - self._columns
+        if unknown:
+            # Dropping them silently would widen the query, possibly to
+            # the whole table
+            raise ValueError(
+                f"Unknown {self.model_class.__name__} fields in criteria: "
+                f"{', '.join(sorted(unknown))}"
+            )
         
-        for field, value in criteria.items():
-            if hasattr(self.model_class, field):
-                stmt = stmt.where(getattr(self.model_class, field) == value)
+        stmt, fields = _criteria_select(
+            self.model_class,
+            tuple(sorted((field, _criterion_kind(value)) for field, value in criteria.items()))
+        )
+        if options:
+            stmt = stmt.options(*options)
         
-        stmt = stmt.offset(skip).limit(limit)
-        result = await self.db.execute(stmt)
+        params = {f'criteria_{field}': criteria[field] for field in fields}
+        params['criteria_skip'] = skip
+        params['criteria_limit'] = limit
+        result = await self.db.execute(stmt, params)
         return list(result.scalars().all())
     
-    async def find_one_by_criteria(self, criteria: Dict[str, Any]) -> Optional[T]:
+    async def find_one_by_criteria(
+        self,
+        criteria: Dict[str, Any],
+        *,
+        options: Sequence[ExecutableOption] = ()
+    ) -> Optional[T]:
         """Find single entity by criteria.
         
         Args:
             criteria: Dictionary of field:value pairs
+            options: Loader options for relationships the caller will read
             
         Returns:
             First matching entity, or None
         """
-        entities = await self.find_by_criteria(criteria, limit=1)
+        entities = await self.find_by_criteria(criteria, limit=1, options=options)
         return entities[0] if entities else None
+
+
+def _has_python_default(col: Any) -> bool:
+    """Whether a column has a scalar or Python callable default."""
+    default = col.default
+    return default is not None and (default.is_scalar or default.is_callable)
+
+
+def _python_default(col: Any) -> Any:
+    """Value a column's Python-side default would insert, or None."""
+    if not _has_python_default(col):
+        return None
+    if col.default.is_callable:
+        return col.default.arg(None)
+    return col.default.arg
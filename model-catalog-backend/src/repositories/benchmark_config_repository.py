@@ -0,0 +1,642 @@
+"""Benchmark config repository for workflow orchestration.
+
+Race-condition safe: pending configs are claimed with
+SELECT ... FOR UPDATE SKIP LOCKED so concurrent Argo worker pods never
+receive the same config.
+"""
+
+import asyncio
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+from datetime import datetime, timedelta
+from sqlalchemy import (
+    DateTime, Row, String, Text, Update, Uuid, column, literal, literal_column,
+    select, table, text, update, func, insert, values
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.exceptions import BenchmarkError
+from src.models import BenchmarkConfig
+from .base_repository import BaseRepository
+from .progress_counter import progress_counter
+
+
+# Column order of the records accepted by bulk_create_configs
+CONFIG_COPY_COLUMNS: Tuple[str, ...] = (
+    'id',
+    'model_version_id',
+    'hardware_config_id',
+    'framework_id',
+    'workload_type',
+    'batch_size',
+    'sequence_length',
+    'status',
+    'priority',
+    'created_at',
+    'retry_count',
+)
+
+# PostgreSQL element types of CONFIG_COPY_COLUMNS, for UNNEST array binds
+CONFIG_COLUMN_PG_TYPES: Tuple[str, ...] = (
+    'uuid', 'uuid', 'uuid', 'uuid', 'text', 'integer', 'integer',
+    'text', 'integer', 'timestamp', 'integer',
+)
+
+# One INSERT per chunk: each column is bound as a single array and
+# UNNEST zips the arrays back into rows server-side
+CONFIG_UNNEST_INSERT = text(
+    f"INSERT INTO {BenchmarkConfig.__tablename__} ({', '.join(CONFIG_COPY_COLUMNS)}) "
+    "SELECT * FROM UNNEST("
+    + ", ".join(
+        f"CAST(:{name} AS {pg_type}[])"
+        for name, pg_type in zip(CONFIG_COPY_COLUMNS, CONFIG_COLUMN_PG_TYPES)
+    )
+    + ")"
+)
+
+# Records per COPY / INSERT batch; bounds memory when streaming a generator
+BULK_CHUNK_SIZE = 10_000
+
+# Config columns returned to workflow clients, in output order: the
+# objects of claim_pending_batch_json and the rows of get_pending_batch
+# and get_by_model_version
+CONFIG_OUTPUT_FIELDS: Tuple[str, ...] = (
+    'id',
+    'model_version_id',
+    'hardware_config_id',
+    'framework_id',
+    'workload_type',
+    'batch_size',
+    'sequence_length',
+    'status',
+    'priority',
+    'created_at',
+    'started_at',
+    'completed_at',
+    'error_message',
+    'retry_count',
+)
+
+# Status updates from this many configs up are COPYed into a temp table
+# (asyncpg only); smaller batches go inline as a VALUES list
+STATUS_COPY_THRESHOLD = 1000
+
+# Session-local table bulk_set_final_status COPYs large batches into;
+# created per transaction and dropped on commit
+STATUS_UPDATES_TABLE = table(
+    '_config_status_updates',
+    column('id', Uuid),
+    column('status', String),
+    column('error_message', String)
+)
+CREATE_STATUS_UPDATES_TABLE = text(
+    "CREATE TEMP TABLE _config_status_updates "
+    "(id uuid, status text, error_message text) ON COMMIT DROP"
+)
+
+# Claimable configs, matching idx_benchmark_config_pending_priority. The
+# status is inlined as a SQL literal rather than bound: once PostgreSQL
+# switches asyncpg's prepared statement to a generic plan, it cannot prove
+# "status = $1" implies the partial index predicate and would skip it.
+IS_PENDING = BenchmarkConfig.status == literal_column("'pending'")
+
+# Claimed configs, matching idx_benchmark_config_stale_running (inlined
+# for the same reason)
+IS_RUNNING = BenchmarkConfig.status == literal_column("'running'")
+
+# Table columns for CONFIG_OUTPUT_FIELDS; selected instead of the entity
+# so results are plain rows with no ORM identity map or instance state
+CONFIG_OUTPUT_COLUMNS = tuple(BenchmarkConfig.__table__.c[f] for f in CONFIG_OUTPUT_FIELDS)
+
+
+def _json_text(col: Any) -> Any:
+    """A column as the text of its JSON encoding, labeled with its name."""
+    return func.to_json(col).op('#>>')(literal_column("'{}'")).label(col.name)
+
+
+# CONFIG_OUTPUT_COLUMNS with timestamps formatted by PostgreSQL: the same
+# ISO 8601 strings claim_pending_batch_json emits, and rows carry str
+# instead of datetime objects
+CONFIG_OUTPUT_TEXT_COLUMNS = tuple(
+    _json_text(c) if isinstance(c.type, DateTime) else c
+    for c in CONFIG_OUTPUT_COLUMNS
+)
+
+# Status counts reported by get_progress_stats
+PROGRESS_STATUSES: Tuple[str, ...] = ('pending', 'running', 'completed', 'failed')
+
+# Per-model-version status counts, materialized (see
+# scripts/db/init_timescaledb.sql) and refreshed by refresh_progress_view
+PROGRESS_VIEW = table(
+    'mv_workflow_progress',
+    column('model_version_id'),
+    column('total'),
+    *(column(status) for status in PROGRESS_STATUSES)
+)
+
+
+def _next_chunk(records: Iterator[Tuple[Any, ...]], size: int) -> List[Tuple[Any, ...]]:
+    """Pull the next chunk of records (empty list when exhausted)."""
+    return list(islice(records, size))
+
+
+def _progress_stats(total: int, counts: Dict[str, int]) -> Dict[str, Any]:
+    """Shape status counts into the progress stats dictionary."""
+    stats = {status: counts.get(status, 0) for status in PROGRESS_STATUSES}
+    return {
+        'total': total,
+        **stats,
+        'progress_pct': round(stats['completed'] / total * 100, 2) if total else 0.0
+    }
+
+
+class BenchmarkConfigRepository(BaseRepository[BenchmarkConfig]):
+    """Repository for BenchmarkConfig entity operations."""
+    
+    def __init__(self, db: AsyncSession):
+        """Initialize benchmark config repository.
+        
+        Args:
+            db: Async database session
+        """
+        super().__init__(db, BenchmarkConfig)
+    
+    async def bulk_create_configs(
+        self,
+        records: Iterable[Tuple[Any, ...]],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        commit: bool = True
+    ) -> int:
+        """Bulk load configs in chunks and commit once.
+        
+        Uses PostgreSQL COPY via asyncpg's copy_records_to_table when the
+        session runs on asyncpg. Other PostgreSQL drivers insert each chunk
+        with one INSERT ... SELECT FROM UNNEST of per-column arrays (a fixed
+        11 parameters per chunk); other databases fall back to a batched
+        multi-row INSERT. Records may be a generator: the next chunk is
+        produced in a worker thread while the current one is being written,
+        so generation overlaps the database round trip. At most two chunks
+        are held in memory at a time.
+        
+        All chunks go through the session's single connection, inside the
+        session's transaction (COPY included: the transaction is opened
+        before the first chunk), so a rollback discards the whole load.
+        
+        Args:
+            records: Tuples ordered as CONFIG_COPY_COLUMNS
+            chunk_size: Records per COPY / INSERT batch
+            commit: Commit when done; pass False when the caller owns the
+                transaction (e.g. inside ``session.begin()``)
+        
+        Returns:
+            Number of configs created
+        """
+        conn = await self.db.connection()
+        use_copy = conn.dialect.driver == 'asyncpg'
+        use_unnest = not use_copy and conn.dialect.name == 'postgresql'
+        if use_copy:
+            copy_conn = await self._asyncpg_connection()
+        
+        total = 0
+        it = iter(records)
+        pending = asyncio.ensure_future(asyncio.to_thread(_next_chunk, it, chunk_size))
+        try:
+            while chunk := await pending:
+                # Produce the next chunk while this one is written
+                pending = asyncio.ensure_future(
+                    asyncio.to_thread(_next_chunk, it, chunk_size)
+                )
+                if use_copy:
+                    await copy_conn.copy_records_to_table(
+                        BenchmarkConfig.__tablename__,
+                        records=chunk,
+                        columns=list(CONFIG_COPY_COLUMNS)
+                    )
+                elif use_unnest:
+                    await conn.execute(
+                        CONFIG_UNNEST_INSERT,
+                        dict(zip(CONFIG_COPY_COLUMNS, map(list, zip(*chunk))))
+                    )
+                else:
+                    await conn.execute(
+                        insert(BenchmarkConfig.__table__).execution_options(
+                            insertmanyvalues_page_size=chunk_size
+                        ),
+                        [dict(zip(CONFIG_COPY_COLUMNS, record)) for record in chunk]
+                    )
+                total += len(chunk)
+        finally:
+            pending.cancel()
+        
+        if commit:
+            await self.db.commit()
+        return total
+    
+    async def get_pending_batch(
+        self,
+        limit: int = 100,
+        priority_threshold: int = 1000
+    ) -> List[Row]:
+        """Atomically claim a batch of pending configs.
+        
+        Selected rows are locked with FOR UPDATE SKIP LOCKED and marked
+        'running' by the same UPDATE ... RETURNING statement.
+        
+        Args:
+            limit: Maximum number of configs to claim
+            priority_threshold: Only claim configs with priority <= threshold
+        
+        Returns:
+            Claimed configs as rows of CONFIG_OUTPUT_FIELDS, highest
+            priority first
+        """
+        stmt = self._claim_stmt(limit, priority_threshold).returning(*CONFIG_OUTPUT_COLUMNS)
+        rows = (await self.db.execute(stmt)).all()
+        await self.db.commit()
+        
+        # RETURNING order is unspecified
+        rows.sort(key=lambda row: (row.priority, row.created_at))
+        return rows
+    
+    async def claim_pending_batch_json(
+        self,
+        limit: int = 100,
+        priority_threshold: int = 1000
+    ) -> bytes:
+        """Atomically claim a batch of pending configs as a JSON array.
+        
+        Same claim as get_pending_batch, in one statement: the UPDATE marks
+        the rows locked by FOR UPDATE SKIP LOCKED as 'running', and
+        PostgreSQL builds the JSON array of the returned rows
+        (json_build_object per row, CONFIG_OUTPUT_FIELDS in order), so no ORM
+        objects are loaded and nothing is encoded in Python.
+        
+        Args:
+            limit: Maximum number of configs to claim
+            priority_threshold: Only claim configs with priority <= threshold
+        
+        Returns:
+            UTF-8 JSON array of the claimed configs, highest priority first
+        """
+        claimed = (
+            self._claim_stmt(limit, priority_threshold)
+            .returning(*CONFIG_OUTPUT_COLUMNS)
+            .cte('claimed')
+        )
+        row_json = func.json_build_object(
+            *(part for f in CONFIG_OUTPUT_FIELDS for part in (literal_column(f"'{f}'"), claimed.c[f]))
+        )
+        rows_json = func.json_agg(
+            aggregate_order_by(row_json, claimed.c.priority, claimed.c.created_at)
+        )
+        # json_agg over no rows is NULL; an empty claim is an empty array
+        stmt = select(func.coalesce(rows_json.cast(Text), literal('[]', Text)))
+        
+        body = (await self.db.execute(stmt)).scalar_one()
+        await self.db.commit()
+        return body.encode()
+    
+    async def count_claimable(
+        self,
+        priority_threshold: int = 1000,
+        cap: int = 1000
+    ) -> int:
+        """Count pending configs a claim could take, up to cap.
+        
+        Reads idx_benchmark_config_pending_priority without locking rows,
+        and stops after cap matches, so it stays cheap however large the
+        backlog. Rows locked by an in-flight claim are still counted.
+        
+        Args:
+            priority_threshold: Only count configs with priority <= threshold
+            cap: Maximum count to report
+        
+        Returns:
+            Number of claimable configs, at most cap
+        """
+        claimable = (
+            select(literal_column('1'))
+            .where(IS_PENDING, BenchmarkConfig.priority <= priority_threshold)
+            .limit(cap)
+            .subquery()
+        )
+        stmt = select(func.count()).select_from(claimable)
+        return (await self.db.execute(stmt)).scalar_one()
+    
+    @staticmethod
+    def _claim_stmt(limit: int, priority_threshold: int) -> Update:
+        """UPDATE marking the next claimable pending configs as 'running'.
+        
+        The ids are picked in claim order, and rows locked by another
+        claim are skipped rather than waited on.
+        """
+        claim_ids = (
+            select(BenchmarkConfig.id)
+            .where(IS_PENDING, BenchmarkConfig.priority <= priority_threshold)
+            .order_by(BenchmarkConfig.priority, BenchmarkConfig.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return (
+            update(BenchmarkConfig)
+            .where(BenchmarkConfig.id.in_(claim_ids))
+            .values(status='running', started_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+    
+    async def mark_completed(self, config_id: UUID) -> BenchmarkConfig:
+        """Mark a config as completed.
+        
+        Args:
+            config_id: Config UUID
+        
+        Returns:
+            Updated config
+        
+        Raises:
+            BenchmarkError: If config does not exist
+        """
+        return await self._set_final_status(config_id, 'completed')
+    
+    async def mark_failed(self, config_id: UUID, error_message: str) -> BenchmarkConfig:
+        """Mark a config as failed.
+        
+        Args:
+            config_id: Config UUID
+            error_message: Failure reason (truncated to 1000 chars)
+        
+        Returns:
+            Updated config
+        
+        Raises:
+            BenchmarkError: If config does not exist
+        """
+        return await self._set_final_status(config_id, 'failed', error_message[:1000])
+    
+    async def bulk_set_final_status(
+        self,
+        updates: Sequence[Tuple[UUID, str, Optional[str]]]
+    ) -> int:
+        """Set terminal statuses on many configs with one UPDATE and commit.
+        
+        Runs UPDATE ... FROM (VALUES ...) joined on id, so the batch costs
+        one statement and one commit. On asyncpg, batches of
+        STATUS_COPY_THRESHOLD configs or more are instead streamed with
+        binary COPY into a temp table that the UPDATE joins, avoiding
+        parsing a statement with one VALUES row per config. If a config id
+        appears more than once, its last update wins.
+        
+        Args:
+            updates: (config_id, status, error_message) tuples; status is
+                'completed' or 'failed', error messages are truncated to
+                1000 chars
+        
+        Returns:
+            Number of configs updated (ids that do not exist are skipped)
+        """
+        rows = {
+            config_id: (config_id, status, error_message[:1000] if error_message else None)
+            for config_id, status, error_message in updates
+        }
+        if not rows:
+            return 0
+        
+        conn = await self.db.connection()
+        if len(rows) >= STATUS_COPY_THRESHOLD and conn.dialect.driver == 'asyncpg':
+            await conn.execute(CREATE_STATUS_UPDATES_TABLE)
+            copy_conn = await self._asyncpg_connection()
+            await copy_conn.copy_records_to_table(
+                STATUS_UPDATES_TABLE.name,
+                records=list(rows.values()),
+                columns=[c.name for c in STATUS_UPDATES_TABLE.c]
+            )
+            new_values = STATUS_UPDATES_TABLE
+        else:
+            new_values = values(
+                column('id', Uuid),
+                column('status', String),
+                column('error_message', String),
+                name='new_values'
+            ).data(list(rows.values()))
+        
+        stmt = (
+            update(BenchmarkConfig)
+            .where(BenchmarkConfig.id == new_values.c.id)
+            .values(
+                status=new_values.c.status,
+                error_message=new_values.c.error_message,
+                completed_at=datetime.utcnow()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount
+    
+    async def _set_final_status(
+        self,
+        config_id: UUID,
+        status: str,
+        error_message: Optional[str] = None
+    ) -> BenchmarkConfig:
+        """Set a terminal status on a config and commit."""
+        config = await self.get_by_id(config_id)
+        if config is None:
+            raise BenchmarkError(f"Benchmark config {config_id} not found")
+        
+        config.status = status
+        config.completed_at = datetime.utcnow()
+        config.error_message = error_message
+        
+        await self.db.commit()
+        await self.db.refresh(config)
+        return config
+    
+    async def get_progress_stats(self, model_version_id: UUID) -> Dict[str, Any]:
+        """Get status breakdown for a model version.
+        
+        Served from the in-memory counters kept current by the
+        benchmark_configs NOTIFY triggers (see progress_counter); a model
+        version's first read seeds them with a live count (ids with no
+        configs are not kept, and are counted live each time). While the
+        listener is down, reads the single precomputed row of
+        mv_workflow_progress instead. The view is only refreshed while the
+        listener is down, so for up to one refresh interval after it drops
+        the view may still hold counts from before it came up; after that
+        counts lag by at most one interval. Model versions not in the view
+        yet (configs created since the last refresh) are counted live.
+        
+        Args:
+            model_version_id: Model version UUID
+        
+        Returns:
+            Dictionary with total, pending, running, completed, failed and
+            progress_pct (completed over total, 0-100)
+        """
+        counts = progress_counter.get(model_version_id)
+        if counts is not None:
+            return _progress_stats(sum(counts.values()), counts)
+        
+        token = progress_counter.begin_seed(model_version_id)
+        if token is not None:
+            try:
+                counts, snapshot = await self.get_status_counts_snapshot(model_version_id)
+            except Exception:
+                progress_counter.abort_seed(model_version_id, token)
+                raise
+            progress_counter.finish_seed(model_version_id, token, counts, snapshot)
+            return _progress_stats(sum(counts.values()), counts)
+        
+        stmt = (
+            select(PROGRESS_VIEW.c.total, *(PROGRESS_VIEW.c[s] for s in PROGRESS_STATUSES))
+            .where(PROGRESS_VIEW.c.model_version_id == model_version_id)
+        )
+        row = (await self.db.execute(stmt)).first()
+        if row is None:
+            return await self.get_live_progress_stats(model_version_id)
+        
+        counts = row._asdict()
+        return _progress_stats(counts.pop('total'), counts)
+    
+    async def get_status_counts_snapshot(
+        self,
+        model_version_id: UUID
+    ) -> Tuple[Dict[str, int], str]:
+        """Count configs per status along with the statement's snapshot.
+        
+        Both come from one statement, so the snapshot says exactly which
+        committed transactions the counts include.
+        
+        Args:
+            model_version_id: Model version UUID
+        
+        Returns:
+            Tuple of ({status: count}, txid_current_snapshot() as text)
+        """
+        counts = (
+            select(BenchmarkConfig.status, func.count().label('n'))
+            .where(BenchmarkConfig.model_version_id == model_version_id)
+            .group_by(BenchmarkConfig.status)
+            .subquery()
+        )
+        # Aggregates without GROUP BY always return a row, even for no configs
+        stmt = select(
+            func.txid_current_snapshot().cast(Text),
+            func.array_agg(counts.c.status),
+            func.array_agg(counts.c.n)
+        )
+        snapshot, statuses, totals = (await self.db.execute(stmt)).one()
+        return dict(zip(statuses or (), totals or ())), snapshot
+    
+    async def get_live_progress_stats(self, model_version_id: UUID) -> Dict[str, Any]:
+        """Get status breakdown for a model version from benchmark_configs.
+        
+        Same result as get_progress_stats, aggregated at query time.
+        
+        Args:
+            model_version_id: Model version UUID
+        
+        Returns:
+            Dictionary with total, pending, running, completed, failed and
+            progress_pct (completed over total, 0-100)
+        """
+        stmt = (
+            select(BenchmarkConfig.status, func.count())
+            .where(BenchmarkConfig.model_version_id == model_version_id)
+            .group_by(BenchmarkConfig.status)
+        )
+        result = await self.db.execute(stmt)
+        counts = dict(result.all())
+        
+        return _progress_stats(sum(counts.values()), counts)
+    
+    async def refresh_progress_view(self) -> None:
+        """Recompute mv_workflow_progress without blocking its readers."""
+        await self.db.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_workflow_progress")
+        )
+        await self.db.commit()
+    
+    async def reset_stale_running(self, timeout_minutes: int = 120) -> int:
+        """Reset configs stuck in 'running' back to 'pending'.
+        
+        Recovers work lost to spot instance interruptions. One UPDATE,
+        answered with its row count; no rows are returned or loaded.
+        
+        Args:
+            timeout_minutes: Age after which a running config is stale
+        
+        Returns:
+            Number of configs reset
+        """
+        cutoff = datetime.utcnow() - timedelta(minutes=timeout_minutes)
+        stmt = (
+            update(BenchmarkConfig)
+            .where(IS_RUNNING, BenchmarkConfig.started_at < cutoff)
+            .values(
+                status='pending',
+                started_at=None,
+                retry_count=BenchmarkConfig.retry_count + 1
+            )
+            # Only the count is needed: no RETURNING of ids to sync the session
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount
+    
+    async def get_change_marker(
+        self,
+        model_version_id: UUID,
+        status: Optional[str] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """Get (latest updated_at, row count) of a model version's configs.
+        
+        Any insert, delete or status change in the filtered set moves one
+        of the two, so the pair identifies a version of the config list.
+        Served from idx_benchmark_config_model_status plus the heap rows.
+        
+        Args:
+            model_version_id: Model version UUID
+            status: Optional status filter
+        
+        Returns:
+            Tuple of (max updated_at or None, number of configs)
+        """
+        stmt = select(func.max(BenchmarkConfig.updated_at), func.count()).where(
+            BenchmarkConfig.model_version_id == model_version_id
+        )
+        if status:
+            stmt = stmt.where(BenchmarkConfig.status == status)
+        
+        latest, count = (await self.db.execute(stmt)).one()
+        return latest, count
+    
+    async def get_by_model_version(
+        self,
+        model_version_id: UUID,
+        status: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Row]:
+        """Get configs for a model version.
+        
+        Args:
+            model_version_id: Model version UUID
+            status: Optional status filter
+            limit: Maximum number of configs to return
+        
+        Returns:
+            Configs as rows of CONFIG_OUTPUT_FIELDS, ordered by priority;
+            timestamps are ISO 8601 strings
+        """
+        stmt = select(*CONFIG_OUTPUT_TEXT_COLUMNS).where(
+            BenchmarkConfig.model_version_id == model_version_id
+        )
+        if status:
+            stmt = stmt.where(BenchmarkConfig.status == status)
+        
+        stmt = stmt.order_by(BenchmarkConfig.priority, BenchmarkConfig.created_at).limit(limit)
+        result = await self.db.execute(stmt)
+        return result.all()
@@ -1,6 +1,6 @@
 """Benchmark repository implementation with aggregation support."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime, timedelta
 from sqlalchemy import select, and_, func, desc
@@ -23,14 +23,21 @@ class BenchmarkRepository(BaseRepository[BenchmarkResult]):
         """
         super().__init__(db, BenchmarkResult)
     
-    async def get_by_model_version(self, model_version_id: UUID) -> List[BenchmarkResult]:
-        """Get all benchmarks for a specific model version.
+    async def get_by_model_version(
+        self,
+        model_version_id: UUID,
+        skip: int = 0,
+        limit: int = 50
+    ) -> Tuple[List[BenchmarkResult], int]:
+        """Get a page of benchmarks for a specific model version.
         
         Args:
             model_version_id: Model version UUID
+            skip: Number of records to skip
+            limit: Maximum number of records to return
             
         Returns:
-            List of benchmark results
+            Tuple of (benchmark results, total for the model version)
         """
         stmt = (
             select(BenchmarkResult)
@@ -41,8 +48,7 @@ class BenchmarkRepository(BaseRepository[BenchmarkResult]):
             )
             .order_by(desc(BenchmarkResult.benchmark_date))
         )
-        result = await self.db.execute(stmt)
-        return list(result.unique().scalars().all())
+        return await self._paginate(stmt, skip, limit)
     
     async def get_by_criteria(
         self,
@@ -51,9 +57,11 @@ class BenchmarkRepository(BaseRepository[BenchmarkResult]):
         framework_id: Optional[UUID] = None,
         workload_type: Optional[str] = None,
         max_ttft_p90: Optional[float] = None,
-        min_throughput: Optional[float] = None
-    ) -> List[BenchmarkResult]:
-        """Get benchmarks filtered by multiple criteria.
+        min_throughput: Optional[float] = None,
+        skip: int = 0,
+        limit: int = 50
+    ) -> Tuple[List[BenchmarkResult], int]:
+        """Get a page of benchmarks filtered by multiple criteria.
         
         Args:
             model_version_id: Filter by model version
@@ -62,9 +70,11 @@ class BenchmarkRepository(BaseRepository[BenchmarkResult]):
             workload_type: Filter by workload type (chatbot, summarization, etc.)
             max_ttft_p90: Maximum acceptable TTFT P90 latency (ms)
             min_throughput: Minimum acceptable throughput (tokens/sec)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
             
         Returns:
-            List of matching benchmark results
+            Tuple of (matching benchmark results, total matches)
         """
         stmt = select(BenchmarkResult)
         
@@ -96,8 +106,7 @@ class BenchmarkRepository(BaseRepository[BenchmarkResult]):
             BenchmarkResult.ttft_p90_ms
         )
         
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return await self._paginate(stmt, skip, limit)
     
     async def get_aggregated_stats(
         self,
@@ -163,7 +172,7 @@ class BenchmarkRepository(BaseRepository[BenchmarkResult]):
         self,
         model_version_id: UUID,
         limit: int = 10
-    ) -> List[BenchmarkResult]:
+    ) -> Tuple[List[BenchmarkResult], int]:
         """Get latest benchmarks for a model version.
         
         Args:
@@ -171,16 +180,14 @@ class BenchmarkRepository(BaseRepository[BenchmarkResult]):
             limit: Maximum number of results
             
         Returns:
-            List of latest benchmark results
+            Tuple of (latest benchmark results, total for the model version)
         """
         stmt = (
             select(BenchmarkResult)
             .where(BenchmarkResult.model_version_id == model_version_id)
             .order_by(desc(BenchmarkResult.benchmark_date))
-            .limit(limit)
         )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return await self._paginate(stmt, 0, limit)
     
     async def get_best_performing_configs(
         self,
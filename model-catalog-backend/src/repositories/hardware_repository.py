@@ -1,6 +1,6 @@
 """Hardware configuration repository implementation."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy import select, and_, or_, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,36 +21,46 @@ class HardwareRepository(BaseRepository[HardwareConfig]):
         """
         super().__init__(db, HardwareConfig)
     
-    async def get_by_gpu_type(self, gpu_type: str) -> List[HardwareConfig]:
+    async def get_by_gpu_type(
+        self,
+        gpu_type: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[HardwareConfig], int]:
         """Get hardware configs by GPU type.
         
         Args:
             gpu_type: GPU type (A100-80GB, H100, L4, etc.)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
             
         Returns:
-            List of hardware configurations with specified GPU type
+            Tuple of (hardware configurations with specified GPU type, total)
         """
         stmt = (
             select(HardwareConfig)
             .where(HardwareConfig.gpu_type == gpu_type)
             .order_by(HardwareConfig.gpu_count, HardwareConfig.cost_per_hour_usd)
         )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return await self._paginate(stmt, skip, limit)
     
     async def get_by_vram_requirement(
         self, 
         min_vram_gb: int,
-        prefer_spot: bool = True
-    ) -> List[HardwareConfig]:
+        prefer_spot: bool = True,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[HardwareConfig], int]:
         """Get hardware configs meeting VRAM requirement.
         
         Args:
             min_vram_gb: Minimum required VRAM in GB
             prefer_spot: Prefer spot instances when available
+            skip: Number of records to skip
+            limit: Maximum number of records to return
             
         Returns:
-            List of hardware configurations meeting VRAM requirement
+            Tuple of (hardware configurations meeting VRAM requirement, total)
         """
         stmt = select(HardwareConfig).where(
             HardwareConfig.total_vram_gb >= min_vram_gb
@@ -69,24 +79,27 @@ class HardwareRepository(BaseRepository[HardwareConfig]):
                 asc(HardwareConfig.total_vram_gb)
             )
         
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return await self._paginate(stmt, skip, limit)
     
     async def get_cost_optimized(
         self,
         min_vram_gb: int,
         max_cost_per_hour: Optional[float] = None,
-        cloud_provider: Optional[str] = None
-    ) -> List[HardwareConfig]:
+        cloud_provider: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[HardwareConfig], int]:
         """Get cost-optimized hardware configurations.
         
         Args:
             min_vram_gb: Minimum required VRAM in GB
             max_cost_per_hour: Maximum cost per hour in USD
             cloud_provider: Filter by cloud provider (aws, gcp, azure)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
             
         Returns:
-            List of cost-optimized hardware configurations
+            Tuple of (cost-optimized hardware configurations, total)
         """
         conditions = [HardwareConfig.total_vram_gb >= min_vram_gb]
         
@@ -106,8 +119,7 @@ class HardwareRepository(BaseRepository[HardwareConfig]):
             )
         )
         
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return await self._paginate(stmt, skip, limit)
     
     async def get_by_cloud_provider(
         self,
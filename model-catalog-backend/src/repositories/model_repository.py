@@ -1,16 +1,29 @@
 """Model repository implementation."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy import select, or_, and_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import Select, select, update, or_, and_, func
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models import Model, ModelVersion, ModelUseCase
+from src.models import BenchmarkResult, Model, ModelVersion, ModelUseCase
 from .base_repository import BaseRepository
 from .protocols import ModelRepositoryProtocol
 
 
+# Number of versions per model, as a correlated subquery column so list
+# views get the count in the same query instead of loading each model's
+# versions (one extra round trip per row)
+VERSION_COUNT = (
+    select(func.count(ModelVersion.id))
+    .where(ModelVersion.model_id == Model.id)
+    .correlate(Model)
+    .scalar_subquery()
+    .label('version_count')
+)
+
+
 class ModelRepository(BaseRepository[Model]):
     """Repository for Model entity operations."""
     
@@ -22,6 +35,108 @@ class ModelRepository(BaseRepository[Model]):
         """
         super().__init__(db, Model)
     
+    async def create(self, entity: Model) -> Model:
+        """Create a new model.
+        
+        A new model has no versions, so the collection is marked loaded
+        (empty) and reading it never triggers a lazy load.
+        
+        Args:
+            entity: Model instance to create
+            
+        Returns:
+            Created model with populated fields
+        """
+        created = await super().create(entity)
+        set_committed_value(created, 'versions', [])
+        return created
+    
+    async def get_with_versions(self, model_id: UUID) -> Optional[Model]:
+        """Get model by ID with its versions eagerly loaded.
+        
+        Args:
+            model_id: Model UUID
+            
+        Returns:
+            Model with versions loaded, or None
+        """
+        stmt = (
+            select(Model)
+            .where(Model.id == model_id)
+            .options(selectinload(Model.versions))
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+    
+    async def list_with_versions(self, skip: int = 0, limit: int = 100) -> List[Model]:
+        """Get a page of models with their versions eagerly loaded.
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of models with versions loaded
+        """
+        return await self.list(skip, limit, options=(selectinload(Model.versions),))
+    
+    async def update_fields(
+        self,
+        model_id: UUID,
+        fields: Dict[str, Any]
+    ) -> Optional[Model]:
+        """Update the given columns of a model with a single UPDATE.
+        
+        Issues UPDATE ... RETURNING, so there is no SELECT beforehand and
+        no ORM change tracking; a missing model simply returns no row.
+        Versions are loaded with the returned row.
+        
+        Args:
+            model_id: Model UUID
+            fields: Column values to set (only these columns are written)
+            
+        Returns:
+            Updated model with versions loaded, or None if not found
+        """
+        if not fields:
+            return await self.get_with_versions(model_id)
+        
+        stmt = (
+            update(Model)
+            .where(Model.id == model_id)
+            .values(**fields)
+            .returning(Model)
+            .options(selectinload(Model.versions))
+        )
+        result = await self.db.execute(stmt)
+        model = result.scalar_one_or_none()
+        await self.db.commit()
+        return model
+    
+    async def list_summaries(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        architecture: Optional[str] = None
+    ) -> Tuple[List[Tuple[Model, int]], int]:
+        """Get a page of models with their version counts and the total.
+        
+        Page and total come back in one query (see _paginate).
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            architecture: Optional architecture filter
+            
+        Returns:
+            Tuple of ((model, version_count) rows, total matching models)
+        """
+        stmt = select(Model, VERSION_COUNT)
+        if architecture:
+            stmt = stmt.where(Model.architecture == architecture)
+        
+        return await self._paginate_rows(stmt, skip, limit)
+    
     async def get_by_name(self, name: str) -> Optional[Model]:
         """Get model by name.
         
@@ -100,8 +215,51 @@ class ModelRepository(BaseRepository[Model]):
         Returns:
             List of matching models
         """
-        stmt = select(Model)
+        stmt = self._search_stmt(
+            select(Model), query, architecture, min_parameters, max_parameters
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+    
+    async def search_summaries(
+        self,
+        query: str,
+        architecture: Optional[str] = None,
+        min_parameters: Optional[int] = None,
+        max_parameters: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Tuple[Model, int]], int]:
+        """Get a page of search results with version counts and the total.
         
+        Same filters and ordering as search_models; OFFSET/LIMIT run in SQL
+        and the total comes from the same query (see _paginate).
+        
+        Args:
+            query: Search query (matches name or tags)
+            architecture: Filter by architecture (llama, gpt, mistral, etc.)
+            min_parameters: Minimum parameter count (in billions)
+            max_parameters: Maximum parameter count (in billions)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of ((model, version_count) rows, total matching models)
+        """
+        stmt = self._search_stmt(
+            select(Model, VERSION_COUNT), query, architecture, min_parameters, max_parameters
+        )
+        return await self._paginate_rows(stmt, skip, limit)
+    
+    @staticmethod
+    def _search_stmt(
+        stmt: Select,
+        query: str,
+        architecture: Optional[str],
+        min_parameters: Optional[int],
+        max_parameters: Optional[int]
+    ) -> Select:
+        """Apply search filters and relevance ordering to a Model select."""
         # Text search in name or tags
         if query:
             stmt = stmt.where(
@@ -123,10 +281,7 @@ class ModelRepository(BaseRepository[Model]):
             stmt = stmt.where(Model.parameters <= max_parameters)
         
         # Order by relevance (parameters desc)
-        stmt = stmt.order_by(Model.parameters.desc())
-        
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return stmt.order_by(Model.parameters.desc())
     
     async def get_by_architecture(self, architecture: str, limit: int = 100) -> List[Model]:
         """Get models by architecture type.
@@ -156,14 +311,20 @@ class ModelRepository(BaseRepository[Model]):
         Returns:
             List of popular models
         """
+        # Counted on the denormalized benchmark_results.model_id, without
+        # joining through model_versions
+        benchmark_counts = (
+            select(BenchmarkResult.model_id, func.count().label('benchmark_count'))
+            .group_by(BenchmarkResult.model_id)
+            .order_by(func.count().desc())
+            .limit(limit)
+            .subquery()
+        )
         stmt = (
             select(Model)
-            .join(Model.versions)
-            .join(ModelVersion.benchmarks)
-            .group_by(Model.id)
-            .order_by(Model.daily_stats.count().desc())
-            .limit(limit)
+            .join(benchmark_counts, benchmark_counts.c.model_id == Model.id)
+            .order_by(benchmark_counts.c.benchmark_count.desc())
         )
         result = await self.db.execute(stmt)
-        return list(result.unique().scalars().all())
+        return list(result.scalars().all())
 
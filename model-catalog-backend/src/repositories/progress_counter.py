@@ -0,0 +1,237 @@
+"""In-memory workflow progress counters fed by PostgreSQL LISTEN/NOTIFY.
+
+Statement-level triggers on benchmark_configs (see
+scripts/db/init_timescaledb.sql) publish the net status count changes of
+every INSERT, UPDATE and DELETE on the benchmark_config_status channel.
+ProgressCounter listens on one dedicated asyncpg connection and keeps
+per-model-version counts, so GET /workflow/progress is a dictionary
+lookup instead of an aggregate query.
+
+A model version is seeded from a live count the first time it is read.
+Model versions without configs are not tracked (the API accepts any
+UUID, so tracking them would grow the maps without bound); they are
+counted live on every read until configs exist. The count's transaction snapshot is kept with it: each notification
+carries the writer's transaction id, and changes the snapshot already
+saw are skipped, so no change is counted twice or missed.
+
+Example:
+    >>> counts = progress_counter.get(model_version_id)
+    >>> token = progress_counter.begin_seed(model_version_id) if counts is None else None
+    >>> if token is not None:
+    ...     counts, snapshot = await repo.get_status_counts_snapshot(model_version_id)
+    ...     progress_counter.finish_seed(model_version_id, token, counts, snapshot)
+"""
+
+import asyncio
+import contextlib
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+import asyncpg
+
+from src.core.serialization import json_deserializer
+
+
+# Channel the benchmark_configs triggers notify on
+PROGRESS_CHANNEL = "benchmark_config_status"
+
+# Seconds between reconnect attempts after the listener connection drops
+RECONNECT_DELAY_SECONDS = 5
+
+
+class TxidSnapshot(NamedTuple):
+    """A txid_current_snapshot() value: which transactions a query saw."""
+    
+    xmin: int
+    xmax: int
+    xip: FrozenSet[int]
+    
+    @classmethod
+    def parse(cls, value: str) -> "TxidSnapshot":
+        """Parse the text form 'xmin:xmax:xip1,xip2,...'."""
+        xmin, xmax, xip = value.split(':')
+        return cls(int(xmin), int(xmax), frozenset(int(x) for x in xip.split(',') if x))
+    
+    def sees(self, xid: int) -> bool:
+        """Whether a committed transaction's changes are visible in the snapshot."""
+        if xid < self.xmin:
+            return True
+        if xid >= self.xmax:
+            return False
+        return xid not in self.xip
+
+
+class ProgressCounter:
+    """Per-model-version status counts kept current by NOTIFY messages.
+    
+    Counts are only served while the listener connection is up; when it
+    drops they are discarded and callers fall back to querying.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty, not yet listening counter."""
+        self._counts: Dict[UUID, Dict[str, int]] = {}
+        self._snapshots: Dict[UUID, TxidSnapshot] = {}
+        # Notifications received while a model version is being seeded,
+        # with the generation the seed was started in
+        self._seeding: Dict[UUID, Tuple[int, List[Tuple[int, Dict[str, int]]]]] = {}
+        # Bumped by reset, so a seed started before it is discarded
+        self._generation = 0
+        self._listening = False
+    
+    @property
+    def listening(self) -> bool:
+        """Whether notifications are currently being received."""
+        return self._listening
+    
+    def get(self, model_version_id: UUID) -> Optional[Dict[str, int]]:
+        """Get status counts for a model version, or None if not tracked yet."""
+        counts = self._counts.get(model_version_id)
+        return dict(counts) if counts is not None else None
+    
+    def begin_seed(self, model_version_id: UUID) -> Optional[int]:
+        """Start tracking a model version.
+        
+        Returns None when the counter is not listening or the model
+        version is already tracked or being seeded; the caller should then
+        query the counts itself. Otherwise returns a token the caller must
+        pass to finish_seed or abort_seed.
+        """
+        if (
+            not self._listening
+            or model_version_id in self._counts
+            or model_version_id in self._seeding
+        ):
+            return None
+        self._seeding[model_version_id] = (self._generation, [])
+        return self._generation
+    
+    def finish_seed(
+        self,
+        model_version_id: UUID,
+        token: int,
+        counts: Dict[str, int],
+        snapshot: str
+    ) -> None:
+        """Install counts read under snapshot and replay changes it missed.
+        
+        Nothing is installed when the model version has no configs, so
+        unknown ids never take up an entry.
+        
+        Args:
+            model_version_id: Model version UUID
+            token: Value returned by begin_seed
+            counts: Status counts from the seeding query
+            snapshot: txid_current_snapshot() of the same statement
+        """
+        pending = self._take_seed(model_version_id, token)
+        if pending is None:
+            # The listener reconnected meanwhile and may have missed changes
+            return
+        
+        txid_snapshot = TxidSnapshot.parse(snapshot)
+        counts = dict(counts)
+        for xid, deltas in pending:
+            if not txid_snapshot.sees(xid):
+                _apply(counts, deltas)
+        if not any(counts.values()):
+            return
+        self._counts[model_version_id] = counts
+        self._snapshots[model_version_id] = txid_snapshot
+    
+    def abort_seed(self, model_version_id: UUID, token: int) -> None:
+        """Give up seeding a model version (e.g. its query failed)."""
+        self._take_seed(model_version_id, token)
+    
+    def handle_notification(self, payload: str) -> None:
+        """Apply one trigger notification.
+        
+        The payload is JSON with the writer's transaction id, the model
+        version and the net change per status, e.g.
+        {"xid": 1234, "model_version_id": "...", "deltas": {"pending": -5, "running": 5}}.
+        """
+        message = json_deserializer(payload)
+        model_version_id = UUID(message['model_version_id'])
+        xid, deltas = message['xid'], message['deltas']
+        
+        seeding = self._seeding.get(model_version_id)
+        if seeding is not None:
+            seeding[1].append((xid, deltas))
+            return
+        
+        counts = self._counts.get(model_version_id)
+        if counts is not None and not self._snapshots[model_version_id].sees(xid):
+            _apply(counts, deltas)
+    
+    def reset(self) -> None:
+        """Drop all counts; model versions are re-seeded on their next read."""
+        self._counts.clear()
+        self._snapshots.clear()
+        self._seeding.clear()
+        self._generation += 1
+    
+    async def run(self, dsn: str) -> None:
+        """Listen for notifications until cancelled, reconnecting on errors.
+        
+        Args:
+            dsn: PostgreSQL connection string for the dedicated connection
+        """
+        while True:
+            conn: Optional[asyncpg.Connection] = None
+            try:
+                conn = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: closed.set())
+                await conn.add_listener(PROGRESS_CHANNEL, self._on_notification)
+                self._listening = True
+                await closed.wait()
+                print("⚠️  Workflow progress listener connection closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️  Workflow progress listener failed: {e}")
+            finally:
+                # Changes made while not listening are unknown
+                self._listening = False
+                self.reset()
+                if conn is not None and not conn.is_closed():
+                    with contextlib.suppress(Exception):
+                        await conn.close()
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+    
+    def _take_seed(
+        self,
+        model_version_id: UUID,
+        token: int
+    ) -> Optional[List[Tuple[int, Dict[str, int]]]]:
+        """Remove a seed started with token and return its buffered changes."""
+        seeding = self._seeding.get(model_version_id)
+        if seeding is None or seeding[0] != token:
+            return None
+        del self._seeding[model_version_id]
+        return seeding[1]
+    
+    def _on_notification(
+        self,
+        conn: Any,
+        pid: int,
+        channel: str,
+        payload: str
+    ) -> None:
+        """asyncpg listener callback."""
+        try:
+            self.handle_notification(payload)
+        except Exception as e:
+            # A malformed message must not kill the listener; start over
+            print(f"⚠️  Bad workflow progress notification: {e}")
+            self.reset()
+
+
+def _apply(counts: Dict[str, int], deltas: Dict[str, int]) -> None:
+    """Add per-status deltas to counts in place."""
+    for status, delta in deltas.items():
+        counts[status] = counts.get(status, 0) + delta
+
+
+# Process-wide counter, run by the application lifespan
+progress_counter = ProgressCounter()
@@ -1,6 +1,6 @@
 """Protocol definitions for repository pattern."""
 
-from typing import Protocol, List, Optional, Dict, Any, TypeVar, Generic
+from typing import Protocol, List, Optional, Dict, Any, TypeVar, Generic, Tuple, Sequence
 from uuid import UUID
 
 T = TypeVar('T')
@@ -17,7 +17,7 @@ class BaseRepositoryProtocol(Protocol, Generic[T]):
         """Get entity by ID."""
         ...
     
-    async def list(self, skip: int = 0, limit: int = 100) -> List[T]:
+    async def list(self, skip: int = 0, limit: int = 100, *, options: Sequence[Any] = ()) -> List[T]:
         """Get all entities with pagination."""
         ...
     
@@ -29,8 +29,8 @@ class BaseRepositoryProtocol(Protocol, Generic[T]):
         """Delete an entity by ID."""
         ...
     
-    async def count(self) -> int:
-        """Get total count of entities."""
+    async def count(self, approximate: bool = False) -> int:
+        """Get total count of entities, or PostgreSQL's estimate of it."""
         ...
     
     async def exists(self, entity_id: UUID) -> bool:
@@ -53,6 +53,27 @@ class ModelRepositoryProtocol(BaseRepositoryProtocol[T], Protocol):
         """Get model with all benchmark results."""
         ...
     
+    async def get_with_versions(self, model_id: UUID) -> Optional[T]:
+        """Get model with its versions loaded."""
+        ...
+    
+    async def list_with_versions(self, skip: int = 0, limit: int = 100) -> List[T]:
+        """Get a page of models with versions eagerly loaded."""
+        ...
+    
+    async def update_fields(self, model_id: UUID, fields: Dict[str, Any]) -> Optional[T]:
+        """Update the given columns of a model; None if not found."""
+        ...
+    
+    async def list_summaries(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        architecture: Optional[str] = None
+    ) -> Tuple[List[Tuple[T, int]], int]:
+        """Get a page of models with their version counts, with total."""
+        ...
+    
     async def search_models(
         self, 
         query: str, 
@@ -62,13 +83,30 @@ class ModelRepositoryProtocol(BaseRepositoryProtocol[T], Protocol):
     ) -> List[T]:
         """Search models with filters."""
         ...
+    
+    async def search_summaries(
+        self, 
+        query: str, 
+        architecture: Optional[str] = None,
+        min_parameters: Optional[int] = None,
+        max_parameters: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Tuple[T, int]], int]:
+        """Get a page of search results with version counts, with total."""
+        ...
 
 
 class BenchmarkRepositoryProtocol(BaseRepositoryProtocol[T], Protocol):
     """Protocol for benchmark repository operations."""
     
-    async def get_by_model_version(self, model_version_id: UUID) -> List[T]:
-        """Get benchmarks by model version ID."""
+    async def get_by_model_version(
+        self,
+        model_version_id: UUID,
+        skip: int = 0,
+        limit: int = 50
+    ) -> Tuple[List[T], int]:
+        """Get a page of benchmarks by model version ID, with total."""
         ...
     
     async def get_by_criteria(
@@ -78,9 +116,11 @@ class BenchmarkRepositoryProtocol(BaseRepositoryProtocol[T], Protocol):
         framework_id: Optional[UUID] = None,
         workload_type: Optional[str] = None,
         max_ttft_p90: Optional[float] = None,
-        min_throughput: Optional[float] = None
-    ) -> List[T]:
-        """Get benchmarks filtered by multiple criteria."""
+        min_throughput: Optional[float] = None,
+        skip: int = 0,
+        limit: int = 50
+    ) -> Tuple[List[T], int]:
+        """Get a page of benchmarks filtered by multiple criteria, with total."""
         ...
     
     async def get_aggregated_stats(
@@ -95,31 +135,40 @@ class BenchmarkRepositoryProtocol(BaseRepositoryProtocol[T], Protocol):
         self,
         model_version_id: UUID,
         limit: int = 10
-    ) -> List[T]:
-        """Get latest benchmarks for a model version."""
+    ) -> Tuple[List[T], int]:
+        """Get latest benchmarks for a model version, with total."""
         ...
 
 
 class HardwareRepositoryProtocol(BaseRepositoryProtocol[T], Protocol):
     """Protocol for hardware repository operations."""
     
-    async def get_by_gpu_type(self, gpu_type: str) -> List[T]:
-        """Get hardware configs by GPU type."""
+    async def get_by_gpu_type(
+        self,
+        gpu_type: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[T], int]:
+        """Get hardware configs by GPU type, with total."""
         ...
     
     async def get_by_vram_requirement(
         self, 
         min_vram_gb: int,
-        prefer_spot: bool = True
-    ) -> List[T]:
-        """Get hardware configs meeting VRAM requirement."""
+        prefer_spot: bool = True,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[T], int]:
+        """Get hardware configs meeting VRAM requirement, with total."""
         ...
     
     async def get_cost_optimized(
         self,
         min_vram_gb: int,
         max_cost_per_hour: Optional[float] = None,
-        cloud_provider: Optional[str] = None
-    ) -> List[T]:
-        """Get cost-optimized hardware configurations."""
+        cloud_provider: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[T], int]:
+        """Get cost-optimized hardware configurations, with total."""
         ...
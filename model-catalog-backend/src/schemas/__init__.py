@@ -28,10 +28,12 @@ from .hardware_schemas import (
     HardwareConfigQueryRequest,
     InferenceFrameworkCreateRequest,
     VRAMCalculationRequest,
+    VRAMBatchCalculationRequest,
     GPURecommendationRequest,
     HardwareConfigResponse,
     InferenceFrameworkResponse,
     VRAMCalculationResponse,
+    VRAMBatchCalculationResponse,
     GPUConfigRecommendation,
     GPURecommendationResponse,
     HardwareConfigListResponse,
@@ -83,10 +85,12 @@ __all__ = [
     "HardwareConfigQueryRequest",
     "InferenceFrameworkCreateRequest",
     "VRAMCalculationRequest",
+    "VRAMBatchCalculationRequest",
     "GPURecommendationRequest",
     "HardwareConfigResponse",
     "InferenceFrameworkResponse",
     "VRAMCalculationResponse",
+    "VRAMBatchCalculationResponse",
     "GPUConfigRecommendation",
     "GPURecommendationResponse",
     "HardwareConfigListResponse",
@@ -3,10 +3,10 @@
 NO business logic - only validation and serialization.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PositiveInt
 
 
 # ============================================================================
@@ -107,6 +107,23 @@ class VRAMCalculationRequest(BaseModel):
     )
 
 
+class VRAMBatchCalculationRequest(BaseModel):
+    """Request to calculate VRAM requirements for several models."""
+    parameters: List[PositiveInt] = Field(..., min_length=1, max_length=1000, description="Number of parameters per model")
+    quantization: List[str] = Field(..., min_length=1, max_length=1000, description="Quantization type per model")
+    batch_size: int = Field(1, ge=1, description="Batch size")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "parameters": [7_000_000_000, 70_000_000_000],
+                "quantization": ["fp16", "int4"],
+                "batch_size": 1
+            }
+        }
+    )
+
+
 class GPURecommendationRequest(BaseModel):
     """Request for GPU configuration recommendations."""
     vram_needed_gb: float = Field(..., gt=0, description="Required VRAM in GB")
@@ -169,6 +186,19 @@ class VRAMCalculationResponse(BaseModel):
     )
 
 
+class VRAMBatchCalculationResponse(BaseModel):
+    """Response with VRAM requirements, aligned with the request lists."""
+    vram_required_gb: List[float] = Field(..., description="Required VRAM in GB per model")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "vram_required_gb": [16.8, 42.0]
+            }
+        }
+    )
+
+
 class GPUConfigRecommendation(BaseModel):
     """Single GPU configuration recommendation."""
     gpu_type: str
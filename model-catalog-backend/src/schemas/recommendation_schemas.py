@@ -3,9 +3,10 @@
 NO business logic - only validation and serialization.
 """
 
+import math
 from typing import Optional, Dict, Any
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 
 
 # ============================================================================
@@ -43,10 +44,23 @@ class RecommendationRequest(BaseModel):
             raise ValueError('Weight must be between 0 and 1')
         return v
     
-    def validate_weights_sum(self) -> bool:
-        """Validate that all weights sum to 1.0."""
-        total = self.weight_accuracy + self.weight_latency + self.weight_throughput + self.weight_cost
-        return abs(total - 1.0) < 0.001  # Allow small floating point errors
+    @model_validator(mode='after')
+    def validate_weights_sum(self) -> 'RecommendationRequest':
+        """Validate that all weights sum to 1.0.
+        
+        Runs as part of request validation, so a bad sum is reported in the
+        standard 422 error body. fsum keeps the sum exact (0.3 + 0.3 + 0.3
+        + 0.1 is 1.0, not 0.9999...).
+        """
+        total = math.fsum((
+            self.weight_accuracy,
+            self.weight_latency,
+            self.weight_throughput,
+            self.weight_cost
+        ))
+        if not math.isclose(total, 1.0, abs_tol=0.001):  # Allow rounded inputs
+            raise ValueError(f'Weights must sum to 1.0 (got {total})')
+        return self
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -63,6 +63,29 @@ class RedisCache:
         except RedisError as e:
             raise CacheError(f"Failed to set key {key}: {str(e)}")
     
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """Get a raw value from cache, without deserializing it."""
+        try:
+            return self.redis_client.get(key)
+        except RedisError as e:
+            raise CacheError(f"Failed to get key {key}: {str(e)}")
+    
+    def set_bytes(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[Union[int, timedelta]] = None
+    ) -> bool:
+        """Set a raw value (e.g. a serialized response body) in cache."""
+        try:
+            if isinstance(ttl, timedelta):
+                ttl = int(ttl.total_seconds())
+            
+            return self.redis_client.set(key, value, ex=ttl)
+            
+        except RedisError as e:
+            raise CacheError(f"Failed to set key {key}: {str(e)}")
+    
     def delete(self, key: str) -> bool:
         """Delete key from cache."""
         try:
@@ -85,12 +108,22 @@ class RedisCache:
             raise CacheError(f"Failed to get TTL for key {key}: {str(e)}")
     
     def clear_pattern(self, pattern: str) -> int:
-        """Clear all keys matching a pattern."""
+        """Clear all keys matching a pattern.
+        
+        Walks the keyspace with SCAN (KEYS blocks the server for its whole
+        run) and frees values with UNLINK in batches.
+        """
         try:
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                return self.redis_client.delete(*keys)
-            return 0
+            cleared = 0
+            batch = []
+            for key in self.redis_client.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) == 1000:
+                    cleared += self.redis_client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                cleared += self.redis_client.unlink(*batch)
+            return cleared
         except RedisError as e:
             raise CacheError(f"Failed to clear pattern {pattern}: {str(e)}")
     
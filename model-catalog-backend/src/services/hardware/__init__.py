@@ -1,6 +1,15 @@
 """Hardware optimization utilities."""
 
-from .vram_calculator import VRAMCalculator
+from .vram_calculator import (
+    calculate_vram_batch,
+    calculate_vram_requirement,
+    recommend_gpu_config,
+)
 from .gpu_matcher import GPUMatcher
 
-__all__ = ["VRAMCalculator", "GPUMatcher"]
+__all__ = [
+    "calculate_vram_batch",
+    "calculate_vram_requirement",
+    "recommend_gpu_config",
+    "GPUMatcher",
+]
@@ -1,6 +1,7 @@
 """VRAM calculation utilities for model requirements.
 
-Pure function implementation - NO external dependencies.
+Pure function implementation - NO external project dependencies.
+Only numpy required.
 
 Example:
     >>> # Calculate VRAM for Llama-7B FP16
@@ -17,10 +18,14 @@ Example:
     >>> for config in configs[:2]:
     ...     print(f"{config['gpu_type']} x{config['count']}: {config['utilization']:.0f}% utilization")
     L4 x1: 70% utilization
-    A100-40GB x1: 42% utilization
+    L4 x2: 35% utilization
 """
 
-from typing import Dict, List, Literal
+import math
+from functools import lru_cache
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 # Quantization bits mapping
@@ -37,7 +42,62 @@ QUANTIZATION_BITS: Dict[str, float] = {
 # Memory overhead factor (20% for KV cache, activations, etc.)
 OVERHEAD_FACTOR = 1.2
 
+# Sorted quantization codes with aligned bytes-per-parameter, so
+# calculate_vram_batch can map names to bytes with one searchsorted
+_QUANT_CODES = np.array(sorted(QUANTIZATION_BITS))
+_QUANT_BYTES = np.array([QUANTIZATION_BITS[q] for q in _QUANT_CODES], dtype=np.float64)
+
+# Quantizations reported by get_quantization_comparison, with their
+# bytes-per-parameter as a vector for single-shot evaluation
+COMPARISON_QUANTS: List[str] = ['fp32', 'fp16', 'int8', 'int4']
+_COMPARISON_BYTES = np.array(
+    [QUANTIZATION_BITS[q] for q in COMPARISON_QUANTS], dtype=np.float64
+)
+
+# Available GPU configurations: one structured array (name, VRAM per GPU,
+# on-demand hourly cost, spot availability), built once at import. Catalog
+# order is kept: it breaks cost ties between candidates.
+GPU_CATALOG = np.array(
+    [
+        ('L4', 24, 0.50, True),
+        ('A100-40GB', 40, 1.20, True),
+        ('A100-80GB', 80, 2.40, True),
+        ('H100', 80, 4.00, True),
+        ('V100', 16, 0.80, False),
+    ],
+    dtype=[('name', 'U16'), ('vram_gb', 'i8'), ('cost_hourly', 'f8'), ('spot', '?')]
+)
+
+# Contiguous per-field columns used by the vectorized candidate search
+_GPU_TYPES: List[str] = GPU_CATALOG['name'].tolist()
+_GPU_VRAM = np.ascontiguousarray(GPU_CATALOG['vram_gb'])
+_GPU_COST = np.ascontiguousarray(GPU_CATALOG['cost_hourly'])
+_GPU_SPOT = np.ascontiguousarray(GPU_CATALOG['spot'])
+
+# Consider the minimum GPU count plus up to two more, never above 8 (practical limit)
+_COUNT_OFFSETS = np.arange(3)
+_MAX_GPU_COUNT = 8
+
+# Batch sizes probed by estimate_max_batch_size
+_MAX_BATCH_SIZE = 64
+_BATCH_SIZES = np.arange(1, _MAX_BATCH_SIZE + 1)
+
+
+def _bytes_per_param(quantization: str) -> float:
+    """Bytes per parameter for a quantization type.
+    
+    Raises:
+        ValueError: If quantization type is not supported
+    """
+    if quantization not in QUANTIZATION_BITS:
+        raise ValueError(
+            f"Unsupported quantization: {quantization}. "
+            f"Supported types: {list(QUANTIZATION_BITS.keys())}"
+        )
+    return QUANTIZATION_BITS[quantization]
 
+
+@lru_cache(maxsize=4096)
 def calculate_vram_requirement(
     parameters: int,
     quantization: str,
@@ -48,6 +108,9 @@ def calculate_vram_requirement(
     
     Formula: (parameters × bytes_per_param) × overhead_factor
     
+    Results are memoized per (parameters, quantization, batch_size,
+    sequence_length) since the calculation is pure.
+    
     Args:
         parameters: Number of model parameters (e.g., 7_000_000_000 for 7B)
         quantization: Quantization type ('fp32', 'fp16', 'int8', 'int4', 'awq', 'gptq')
@@ -71,18 +134,11 @@ def calculate_vram_requirement(
         >>> print(f"{vram:.1f} GB")
         42.0 GB
     """
-    # Validate quantization type
-    if quantization not in QUANTIZATION_BITS:
-        raise ValueError(
-            f"Unsupported quantization: {quantization}. "
-            f"Supported types: {list(QUANTIZATION_BITS.keys())}"
-        )
-    
-    # Get bytes per parameter
-    bytes_per_param = QUANTIZATION_BITS[quantization]
+    # Get bytes per parameter (validates the quantization type)
+    bytes_per_param = _bytes_per_param(quantization)
     
-    # Base model memory in GB
-    model_memory_gb = (parameters * bytes_per_param) / (1024**3)
+    # Base model memory in GB (decimal, matching GPU vendor VRAM specs)
+    model_memory_gb = (parameters * bytes_per_param) / 1e9
     
     # Apply overhead factor (KV cache, activations, etc.)
     total_vram_gb = model_memory_gb * OVERHEAD_FACTOR
@@ -95,6 +151,55 @@ def calculate_vram_requirement(
     return round(total_vram_gb, 2)
 
 
+def calculate_vram_batch(
+    parameters: Sequence[int],
+    quantizations: Sequence[str],
+    batch_size: int = 1
+) -> np.ndarray:
+    """Calculate VRAM requirements for many models at once.
+    
+    Vectorized form of calculate_vram_requirement: same formula, evaluated
+    for all (parameters, quantization) pairs in one NumPy expression.
+    
+    Args:
+        parameters: Parameter count per model
+        quantizations: Quantization type per model (aligned with parameters)
+        batch_size: Batch size for inference, shared by all models (default: 1)
+    
+    Returns:
+        Array of VRAM requirements in GB, one per model
+    
+    Raises:
+        ValueError: If the inputs differ in length or a quantization type
+            is not supported
+    
+    Example:
+        >>> calculate_vram_batch([7_000_000_000, 70_000_000_000], ['fp16', 'int4'])
+        array([16.8, 42. ])
+    """
+    if len(parameters) != len(quantizations):
+        raise ValueError(
+            f"Got {len(parameters)} parameter counts but "
+            f"{len(quantizations)} quantization types"
+        )
+    
+    quants = np.asarray(quantizations, dtype=str)
+    idx = np.searchsorted(_QUANT_CODES, quants).clip(max=len(_QUANT_CODES) - 1)
+    unknown = _QUANT_CODES[idx] != quants
+    if unknown.any():
+        raise ValueError(
+            f"Unsupported quantization: {quants[unknown][0]}. "
+            f"Supported types: {list(QUANTIZATION_BITS.keys())}"
+        )
+    
+    params = np.asarray(parameters, dtype=np.float64)
+    vram_gb = params * _QUANT_BYTES[idx] / 1e9 * OVERHEAD_FACTOR
+    if batch_size > 1:
+        vram_gb *= 1 + 0.1 * (batch_size - 1)  # 10% per additional batch
+    
+    return np.round(vram_gb, 2)
+
+
 def recommend_gpu_config(
     vram_needed: float,
     prefer_spot: bool = True,
@@ -102,13 +207,18 @@ def recommend_gpu_config(
 ) -> List[Dict[str, any]]:
     """Recommend GPU configurations for given VRAM requirement.
     
+    The candidate search is memoized per 0.5 GB bucket of vram_needed;
+    each call still returns fresh dicts, so callers may mutate them.
+    
     Args:
         vram_needed: Required VRAM in GB
         prefer_spot: Prefer spot instances (60-90% cost savings)
         max_cost_per_hour: Maximum cost per hour in USD (optional)
     
     Returns:
-        List of GPU configurations sorted by cost efficiency
+        List of GPU configurations, cheapest first (spot prices when
+        prefer_spot); on equal cost, catalog order decides. Several smaller
+        GPUs often beat one large one, e.g. 2x L4 for Llama-70B INT4.
         Each config contains: gpu_type, count, total_vram_gb, utilization_pct, 
         cost_per_hour_usd, spot_available
     
@@ -117,64 +227,67 @@ def recommend_gpu_config(
         >>> for cfg in configs[:3]:
         ...     print(f"{cfg['gpu_type']} x{cfg['count']}: "
         ...           f"{cfg['utilization_pct']:.0f}% @ ${cfg['cost_per_hour_usd']}/hr")
-        A100-40GB x1: 88% @ $1.20/hr
-        A100-80GB x1: 44% @ $2.40/hr
-        L4 x2: 73% @ $1.00/hr
+        L4 x2: 73% @ $0.25/hr
+        A100-40GB x1: 88% @ $0.3/hr
+        L4 x3: 49% @ $0.38/hr
     """
-    # Available GPU configurations
-    gpu_catalog = [
-        {'gpu_type': 'L4', 'vram_per_gpu': 24, 'cost_per_hour': 0.50, 'spot_available': True},
-        {'gpu_type': 'A100-40GB', 'vram_per_gpu': 40, 'cost_per_hour': 1.20, 'spot_available': True},
-        {'gpu_type': 'A100-80GB', 'vram_per_gpu': 80, 'cost_per_hour': 2.40, 'spot_available': True},
-        {'gpu_type': 'H100', 'vram_per_gpu': 80, 'cost_per_hour': 4.00, 'spot_available': True},
-        {'gpu_type': 'V100', 'vram_per_gpu': 16, 'cost_per_hour': 0.80, 'spot_available': False},
-    ]
-    
     recommendations = []
-    
-    for gpu in gpu_catalog:
-        # Calculate minimum GPUs needed
-        min_gpus = int(vram_needed / gpu['vram_per_gpu']) + (
-            1 if vram_needed % gpu['vram_per_gpu'] > 0 else 0
-        )
-        
-        # Only consider up to 8 GPUs (practical limit)
-        for count in range(min_gpus, min(9, min_gpus + 3)):
-            total_vram = gpu['vram_per_gpu'] * count
-            
-            if total_vram >= vram_needed:
-                cost = gpu['cost_per_hour'] * count
-                
-                # Apply spot instance discount (75% average)
-                if gpu['spot_available'] and prefer_spot:
-                    cost *= 0.25  # 75% discount
-                
-                # Check cost constraint
-                if max_cost_per_hour and cost > max_cost_per_hour:
-                    continue
-                
-                # Filter by spot preference
-                if prefer_spot and not gpu['spot_available']:
-                    continue
-                
-                utilization = (vram_needed / total_vram) * 100
-                
-                recommendations.append({
-                    'gpu_type': gpu['gpu_type'],
-                    'count': count,
-                    'vram_per_gpu_gb': gpu['vram_per_gpu'],
-                    'total_vram_gb': total_vram,
-                    'utilization_pct': round(utilization, 1),
-                    'cost_per_hour_usd': round(cost, 2),
-                    'spot_available': gpu['spot_available']
-                })
-    
-    # Sort by cost efficiency (cost per GB utilized)
-    recommendations.sort(key=lambda x: x['cost_per_hour_usd'] / vram_needed)
+    for i, count, cost in _gpu_candidates(
+        math.ceil(vram_needed * 2), prefer_spot, max_cost_per_hour
+    ):
+        total_vram = _GPU_VRAM[i].item() * count
+        recommendations.append({
+            'gpu_type': _GPU_TYPES[i],
+            'count': count,
+            'vram_per_gpu_gb': _GPU_VRAM[i].item(),
+            'total_vram_gb': total_vram,
+            'utilization_pct': round((vram_needed / total_vram) * 100, 1),
+            'cost_per_hour_usd': cost,
+            'spot_available': bool(_GPU_SPOT[i])
+        })
     
     return recommendations
 
 
+@lru_cache(maxsize=2048)
+def _gpu_candidates(
+    vram_half_gb: int,
+    prefer_spot: bool,
+    max_cost_per_hour: Optional[float]
+) -> Tuple[Tuple[int, int, float], ...]:
+    """Sorted (GPU index, count, cost) candidates for a VRAM bucket.
+    
+    VRAM is bucketed up to the next 0.5 GB. GPU sizes are whole GB, so
+    every bucket needs exactly the same GPU counts as the values it
+    covers and results are unchanged; only utilization depends on the
+    exact requirement, and recommend_gpu_config computes that per call.
+    """
+    vram_needed = vram_half_gb / 2
+    
+    # Candidate grid: each GPU type x (min_gpus + 0..2), capped at 8 GPUs
+    min_gpus = np.ceil(vram_needed / _GPU_VRAM).astype(np.int64)
+    counts = min_gpus[:, None] + _COUNT_OFFSETS
+    gpu_idx = np.broadcast_to(np.arange(len(_GPU_TYPES))[:, None], counts.shape)
+    
+    spot_discount = np.where(_GPU_SPOT & prefer_spot, 0.25, 1.0)  # 75% discount
+    costs = np.round((_GPU_COST * spot_discount)[:, None] * counts, 2)
+    
+    mask = counts <= _MAX_GPU_COUNT
+    if max_cost_per_hour:
+        mask &= costs <= max_cost_per_hour
+    if prefer_spot:
+        mask &= _GPU_SPOT[:, None]
+    
+    gpu_idx, counts, costs = gpu_idx[mask], counts[mask], costs[mask]
+    
+    # Cheapest first; stable keeps catalog order on ties
+    order = np.argsort(costs, kind='stable')
+    
+    return tuple(zip(
+        gpu_idx[order].tolist(), counts[order].tolist(), costs[order].tolist()
+    ))
+
+
 def get_quantization_comparison(parameters: int) -> Dict[str, float]:
     """Compare VRAM requirements across different quantization levels.
     
@@ -193,10 +306,8 @@ def get_quantization_comparison(parameters: int) -> Dict[str, float]:
         int8  :  8.4 GB
         int4  :  4.2 GB
     """
-    return {
-        quant: calculate_vram_requirement(parameters, quant)
-        for quant in ['fp32', 'fp16', 'int8', 'int4']
-    }
+    vram_gb = np.round(parameters * _COMPARISON_BYTES / 1e9 * OVERHEAD_FACTOR, 2)
+    return dict(zip(COMPARISON_QUANTS, vram_gb.tolist()))
 
 
 def estimate_max_batch_size(
@@ -223,17 +334,17 @@ def estimate_max_batch_size(
         ...     available_vram_gb=40
         ... )
         >>> print(f"Max batch size: {max_batch}")
-        Max batch size: 2
+        Max batch size: 14
     """
-    for batch_size in range(1, 65):  # Test up to 64
-        vram_needed = calculate_vram_requirement(
-            parameters, 
-            quantization, 
-            batch_size, 
-            sequence_length
-        )
-        
-        if vram_needed > available_vram_gb:
-            return max(1, batch_size - 1)
+    # Unrounded batch-size-1 requirement; each candidate below is rounded
+    # once, like calculate_vram_requirement
+    base_vram_gb = parameters * _bytes_per_param(quantization) / 1e9 * OVERHEAD_FACTOR
+    
+    # VRAM for every candidate batch size at once (10% per additional batch)
+    vram_needed = np.round(base_vram_gb * (1 + 0.1 * (_BATCH_SIZES - 1)), 2)
+    
+    too_large = np.flatnonzero(vram_needed > available_vram_gb)
+    if too_large.size:
+        return max(1, int(too_large[0]))
     
-    return 64  # Maximum tested
+    return _MAX_BATCH_SIZE  # Maximum tested
@@ -14,6 +14,7 @@ import pandas as pd
 from src.repositories import ModelRepository, BenchmarkRepository, HardwareRepository
 from src.services.ranking.topsis import calculate_topsis_scores
 from src.services.hardware.vram_calculator import (
+    calculate_vram_batch,
     calculate_vram_requirement,
     recommend_gpu_config
 )
@@ -42,6 +43,14 @@ class ModelCard:
     rank: Optional[int] = None
 
 
+# Ranked DataFrame columns in ModelCard field order
+_CARD_COLUMNS = (
+    'model_id', 'model_name', 'architecture', 'parameters', 'quantization',
+    'accuracy', 'latency', 'throughput', 'vram_requirement_gb', 'gpu_config',
+    'topsis_score', 'topsis_rank'
+)
+
+
 @dataclass
 class UseCaseConstraints:
     """Use case constraints for model selection."""
@@ -115,8 +124,8 @@ class ModelService:
         if not models:
             return []
         
-        # Step 2: Build evaluation dataset
-        evaluation_data = []
+        # Step 2: Collect versions that pass the hard constraints
+        candidates = []
         
         for model in models:
             # Get benchmark statistics
@@ -141,43 +150,52 @@ class ModelService:
                     if stats['avg_accuracy'] < constraints.min_accuracy:
                         continue
                 
-                # Calculate VRAM requirement
-                vram_needed = calculate_vram_requirement(
-                    parameters=model.parameters,
-                    quantization=version.quantization
-                )
-                
-                # Get cost-optimized GPU config
-                gpu_configs = recommend_gpu_config(
-                    vram_needed=vram_needed,
-                    prefer_spot=constraints.prefer_spot_instances,
-                    max_cost_per_hour=constraints.max_cost_per_hour
-                )
-                
-                if not gpu_configs:
-                    continue
-                
-                best_gpu = gpu_configs[0]
-                
-                evaluation_data.append({
-                    'model_id': model.id,
-                    'model_name': model.name,
-                    'architecture': model.architecture,
-                    'parameters': model.parameters,
-                    'version_id': version.id,
-                    'quantization': version.quantization,
-                    'vram_requirement_gb': vram_needed,
-                    'accuracy': stats['avg_accuracy'] or 0.0,
-                    'latency': stats['avg_ttft_p90_ms'] or 0.0,
-                    'throughput': stats['avg_throughput'] or 0.0,
-                    'cost': best_gpu['cost_per_hour_usd'],
-                    'gpu_config': best_gpu
-                })
+                candidates.append((model, version, stats))
+        
+        if not candidates:
+            return []
+        
+        # Step 3: Calculate VRAM requirements for all candidates at once
+        vram_requirements = calculate_vram_batch(
+            [model.parameters for model, _, _ in candidates],
+            [version.quantization for _, version, _ in candidates]
+        ).tolist()
+        
+        # Step 4: Build evaluation dataset
+        evaluation_data = []
+        
+        for (model, version, stats), vram_needed in zip(candidates, vram_requirements):
+            # Get cost-optimized GPU config
+            gpu_configs = recommend_gpu_config(
+                vram_needed=vram_needed,
+                prefer_spot=constraints.prefer_spot_instances,
+                max_cost_per_hour=constraints.max_cost_per_hour
+            )
+            
+            if not gpu_configs:
+                continue
+            
+            best_gpu = gpu_configs[0]
+            
+            evaluation_data.append({
+                'model_id': model.id,
+                'model_name': model.name,
+                'architecture': model.architecture,
+                'parameters': model.parameters,
+                'version_id': version.id,
+                'quantization': version.quantization,
+                'vram_requirement_gb': vram_needed,
+                'accuracy': stats['avg_accuracy'] or 0.0,
+                'latency': stats['avg_ttft_p90_ms'] or 0.0,
+                'throughput': stats['avg_throughput'] or 0.0,
+                'cost': best_gpu['cost_per_hour_usd'],
+                'gpu_config': best_gpu
+            })
         
         if not evaluation_data:
             return []
         
-        # Step 3: Apply TOPSIS ranking
+        # Step 5: Apply TOPSIS ranking
         df = pd.DataFrame(evaluation_data)
         
         weights = {
@@ -194,28 +212,12 @@ class ModelService:
             cost_criteria=['latency', 'cost']
         )
         
-        # Step 4: Build model cards
+        # Step 6: Build model cards, one column at a time: tolist() yields
+        # native Python values, so no per-row NumPy scalar boxing
         ranked_df = ranked_df.sort_values('topsis_rank').head(limit)
+        columns = [ranked_df[name].tolist() for name in _CARD_COLUMNS]
         
-        recommendations = []
-        for _, row in ranked_df.iterrows():
-            card = ModelCard(
-                model_id=row['model_id'],
-                model_name=row['model_name'],
-                architecture=row['architecture'],
-                parameters=row['parameters'],
-                quantization=row['quantization'],
-                avg_accuracy=row['accuracy'],
-                avg_ttft_p90_ms=row['latency'],
-                avg_throughput=row['throughput'],
-                vram_requirement_gb=row['vram_requirement_gb'],
-                recommended_gpu=row['gpu_config'],
-                topsis_score=row['topsis_score'],
-                rank=row['topsis_rank']
-            )
-            recommendations.append(card)
-        
-        return recommendations
+        return [ModelCard(*values) for values in zip(*columns)]
     
     async def get_model_with_stats(self, model_id: UUID) -> Optional[Dict[str, Any]]:
         """Get detailed model information with statistics.
@@ -1,6 +1,6 @@
 """Ranking algorithms for model optimization."""
 
-from .topsis import TOPSISRanker
+from .topsis import calculate_topsis_scores, calculate_topsis_scores_ndarray
 from .pareto import ParetoOptimizer
 
-__all__ = ["TOPSISRanker", "ParetoOptimizer"]
+__all__ = ["calculate_topsis_scores", "calculate_topsis_scores_ndarray", "ParetoOptimizer"]
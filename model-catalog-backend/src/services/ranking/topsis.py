@@ -1,7 +1,8 @@
 """TOPSIS (Technique for Order Preference by Similarity to Ideal Solution) implementation.
 
 Pure function implementation - NO external project dependencies.
-Only numpy and pandas required.
+Only numpy required. pandas DataFrames are accepted (and returned) but
+pandas itself is never imported here, so importing this module stays cheap.
 
 Example:
     >>> import pandas as pd
@@ -24,17 +25,23 @@ Example:
     >>> print(result[['accuracy', 'latency', 'score']].round(3))
 """
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Sequence, Union
 import numpy as np
-import pandas as pd
+
+from .topsis_numba import topsis_closeness
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TOPSISInput = Union["pd.DataFrame", np.ndarray, Mapping[str, Sequence[float]]]
 
 
 def calculate_topsis_scores(
-    data: pd.DataFrame,
+    data: TOPSISInput,
     weights: Dict[str, float],
     benefit_criteria: Optional[List[str]] = None,
     cost_criteria: Optional[List[str]] = None
-) -> pd.DataFrame:
+) -> Union["pd.DataFrame", Dict[str, np.ndarray]]:
     """Calculate TOPSIS scores for multi-criteria decision making.
     
     TOPSIS (Technique for Order Preference by Similarity to Ideal Solution) ranks
@@ -42,14 +49,17 @@ def calculate_topsis_scores(
     the anti-ideal solution.
     
     Args:
-        data: DataFrame with criteria columns (e.g., accuracy, latency, throughput, cost)
+        data: DataFrame or mapping of column name -> values with the criteria
+            columns (e.g., accuracy, latency, throughput, cost), or a 2-D
+            array whose columns follow the order of ``weights``
         weights: Dictionary mapping criteria names to their weights (must sum to 1.0)
         benefit_criteria: List of criteria where higher is better (default: all)
         cost_criteria: List of criteria where lower is better (default: none)
     
     Returns:
-        Original DataFrame with added 'topsis_score' column (0-1, higher is better)
-        and 'topsis_rank' column (1 = best)
+        For a DataFrame: a copy with added 'topsis_score' column (0-1, higher
+        is better) and 'topsis_rank' column (1 = best). For a mapping or array:
+        a dict of column arrays with the same two keys added.
     
     Raises:
         ValueError: If weights don't sum to 1.0 or criteria are invalid
@@ -71,12 +81,27 @@ def calculate_topsis_scores(
         ... )
         >>> print(result.sort_values('topsis_rank'))
     """
+    criteria_cols = list(weights.keys())
+    is_dataframe = hasattr(data, 'to_numpy')  # duck-typed, avoids importing pandas
+    
+    if isinstance(data, np.ndarray):
+        if data.ndim != 2 or data.shape[1] != len(criteria_cols):
+            raise ValueError(
+                f"Array input must be 2-D with {len(criteria_cols)} columns "
+                f"(one per weight), got shape {data.shape}"
+            )
+        data = {col: data[:, j] for j, col in enumerate(criteria_cols)}
+    
     # Validate inputs
     _validate_inputs(data, weights, benefit_criteria, cost_criteria)
     
-    # Extract criteria columns
-    criteria_cols = list(weights.keys())
-    decision_matrix = data[criteria_cols].values
+    # Extract criteria columns once as a contiguous float64 matrix
+    if is_dataframe:
+        decision_matrix = data[criteria_cols].to_numpy(dtype=np.float64, copy=False)
+    else:
+        decision_matrix = np.column_stack(
+            [np.asarray(data[col], dtype=np.float64) for col in criteria_cols]
+        )
     
     # Default: all criteria are benefit unless specified in cost_criteria
     if benefit_criteria is None and cost_criteria is None:
@@ -87,16 +112,108 @@ def calculate_topsis_scores(
     elif cost_criteria is None:
         cost_criteria = [c for c in criteria_cols if c not in (benefit_criteria or [])]
     
+    # Column mask: True for benefit criteria, False for cost criteria
+    benefit_mask = np.array([col in benefit_criteria for col in criteria_cols])
+    
+    weight_array = np.array([weights[col] for col in criteria_cols], dtype=np.float64)
+    
+    scores = topsis_closeness(decision_matrix, weight_array, benefit_mask)
+    
+    # Add scores to a copy of the input
+    if is_dataframe:
+        result = data.copy()
+        result['topsis_score'] = scores
+        result['topsis_rank'] = result['topsis_score'].rank(ascending=False, method='min').astype(int)
+        return result
+    
+    result = {col: np.asarray(values) for col, values in data.items()}
+    result['topsis_score'] = scores
+    result['topsis_rank'] = _rank_descending(scores)
+    return result
+
+
+def calculate_topsis_scores_ndarray(
+    decision_matrix: np.ndarray,
+    weights: np.ndarray,
+    benefit_mask: np.ndarray
+) -> np.ndarray:
+    """Calculate TOPSIS scores for a plain decision matrix.
+    
+    Array form of calculate_topsis_scores for callers that already hold
+    the criteria as columns: no names, no copy of the input, and only the
+    scores are returned.
+    
+    Args:
+        decision_matrix: Matrix of shape (n_alternatives, n_criteria)
+        weights: Criteria weights of shape (n_criteria,) (must sum to 1.0)
+        benefit_mask: Boolean mask of shape (n_criteria,), True where higher
+            is better and False for cost criteria
+    
+    Returns:
+        Array of TOPSIS scores (0-1, higher is better), one per row
+    
+    Raises:
+        ValueError: If the shapes disagree or weights don't sum to 1.0
+    
+    Example:
+        >>> calculate_topsis_scores_ndarray(
+        ...     np.array([[1.0, 3.0], [2.0, 2.0], [3.0, 1.0]]),
+        ...     np.array([0.5, 0.5]),
+        ...     np.array([True, False])
+        ... )
+        array([0. , 0.5, 1. ])
+    """
+    decision_matrix = np.asarray(decision_matrix, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    benefit_mask = np.asarray(benefit_mask, dtype=bool)
+    
+    if decision_matrix.ndim != 2:
+        raise ValueError(
+            f"Decision matrix must be 2-D, got shape {decision_matrix.shape}"
+        )
+    n_criteria = decision_matrix.shape[1]
+    if weights.shape != (n_criteria,) or benefit_mask.shape != (n_criteria,):
+        raise ValueError(
+            f"Expected {n_criteria} weights and benefit flags, got shapes "
+            f"{weights.shape} and {benefit_mask.shape}"
+        )
+    
+    total_weight = weights.sum()
+    if not np.isclose(total_weight, 1.0, atol=1e-6):
+        raise ValueError(f"Weights must sum to 1.0, got {total_weight:.6f}")
+    
+    return topsis_closeness(decision_matrix, weights, benefit_mask)
+
+
+def _rank_descending(scores: np.ndarray) -> np.ndarray:
+    """Rank scores highest-first with ties sharing the lowest rank.
+    
+    Matches ``Series.rank(ascending=False, method='min')``.
+    """
+    sorted_scores = np.sort(scores)
+    n_greater = len(scores) - np.searchsorted(sorted_scores, scores, side='right')
+    return n_greater + 1
+
+
+def _calculate_scores(
+    decision_matrix: np.ndarray,
+    weight_array: np.ndarray,
+    benefit_mask: np.ndarray
+) -> np.ndarray:
+    """Calculate TOPSIS closeness scores with NumPy broadcasting.
+    
+    The fallback behind topsis_closeness when Numba isn't installed, and
+    the reference the compiled kernel is tested against.
+    """
     # Step 1: Normalize the decision matrix (vector normalization)
     normalized_matrix = _normalize_matrix(decision_matrix)
     
     # Step 2: Calculate weighted normalized matrix
-    weight_array = np.array([weights[col] for col in criteria_cols])
     weighted_matrix = normalized_matrix * weight_array
     
     # Step 3: Determine ideal and anti-ideal solutions
     ideal_solution, anti_ideal_solution = _calculate_ideal_solutions(
-        weighted_matrix, criteria_cols, benefit_criteria, cost_criteria
+        weighted_matrix, benefit_mask
     )
     
     # Step 4: Calculate Euclidean distances
@@ -109,16 +226,11 @@ def calculate_topsis_scores(
         scores = anti_ideal_distances / (ideal_distances + anti_ideal_distances)
         scores = np.nan_to_num(scores, nan=0.5)  # If equal distances, score = 0.5
     
-    # Add scores to dataframe
-    result = data.copy()
-    result['topsis_score'] = scores
-    result['topsis_rank'] = result['topsis_score'].rank(ascending=False, method='min').astype(int)
-    
-    return result
+    return scores
 
 
 def _validate_inputs(
-    data: pd.DataFrame,
+    data: Union["pd.DataFrame", Mapping[str, Sequence[float]]],
     weights: Dict[str, float],
     benefit_criteria: Optional[List[str]],
     cost_criteria: Optional[List[str]]
@@ -130,7 +242,8 @@ def _validate_inputs(
         raise ValueError(f"Weights must sum to 1.0, got {total_weight:.6f}")
     
     # Check all weight keys exist in dataframe
-    missing_cols = set(weights.keys()) - set(data.columns)
+    columns = data.columns if hasattr(data, 'columns') else data.keys()
+    missing_cols = set(weights.keys()) - set(columns)
     if missing_cols:
         raise ValueError(f"Criteria columns not found in DataFrame: {missing_cols}")
     
@@ -158,7 +271,7 @@ def _normalize_matrix(matrix: np.ndarray) -> np.ndarray:
     For each column j: normalized_value = value / sqrt(sum of squares)
     """
     # Calculate norm for each column
-    column_norms = np.sqrt(np.sum(matrix ** 2, axis=0))
+    column_norms = np.linalg.norm(matrix, axis=0)
     
     # Avoid division by zero
     column_norms[column_norms == 0] = 1
@@ -168,29 +281,20 @@ def _normalize_matrix(matrix: np.ndarray) -> np.ndarray:
 
 def _calculate_ideal_solutions(
     weighted_matrix: np.ndarray,
-    criteria_names: List[str],
-    benefit_criteria: List[str],
-    cost_criteria: List[str]
+    benefit_mask: np.ndarray
 ) -> tuple[np.ndarray, np.ndarray]:
     """Calculate ideal (best) and anti-ideal (worst) solutions.
     
     For benefit criteria: ideal = max, anti-ideal = min
     For cost criteria: ideal = min, anti-ideal = max
+    
+    Cost columns are negated so a single max/min reduction serves both
+    criterion types (branchless), then flipped back.
     """
-    n_criteria = len(criteria_names)
-    ideal_solution = np.zeros(n_criteria)
-    anti_ideal_solution = np.zeros(n_criteria)
-    
-    for i, criterion in enumerate(criteria_names):
-        column_values = weighted_matrix[:, i]
-        
-        if criterion in benefit_criteria:
-            # Benefit criterion: higher is better
-            ideal_solution[i] = np.max(column_values)
-            anti_ideal_solution[i] = np.min(column_values)
-        else:
-            # Cost criterion: lower is better
-            ideal_solution[i] = np.min(column_values)
-            anti_ideal_solution[i] = np.max(column_values)
+    sign = np.where(benefit_mask, 1.0, -1.0)
+    signed_matrix = weighted_matrix * sign
+    
+    ideal_solution = signed_matrix.max(axis=0) * sign
+    anti_ideal_solution = signed_matrix.min(axis=0) * sign
     
     return ideal_solution, anti_ideal_solution
@@ -0,0 +1,116 @@
+"""Numba-accelerated TOPSIS kernel.
+
+Fuses normalization, weighting, ideal extraction and distance computation
+into a single compiled pass so large candidate pools don't allocate the
+intermediate matrices the NumPy path needs.
+
+Numba is optional. When it isn't installed, ``topsis_closeness`` falls back
+to the NumPy implementation in ``topsis`` and ``_NUMBA_AVAILABLE`` is False.
+
+The kernel compiles on first call. Call ``warm_up`` at startup (the API's
+lifespan does, off the event loop) so no request pays the compile cost;
+importing this module never compiles anything.
+
+Example:
+    >>> import numpy as np
+    >>> D = np.array([[0.85, 100.0], [0.90, 150.0]])
+    >>> w = np.array([0.6, 0.4])
+    >>> bmask = np.array([True, False])
+    >>> topsis_closeness(D, w, bmask)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore[import]
+    _NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True, parallel=True)  # type: ignore[misc]  # numba is untyped
+    def _topsis_kernel(  # pragma: no cover - compiled
+        D: np.ndarray, w: np.ndarray, sign: np.ndarray
+    ) -> np.ndarray:
+        n_rows, n_cols = D.shape
+
+        # Loop 1: column norms (single pass over the matrix)
+        col_norm = np.zeros(n_cols)
+        for i in range(n_rows):
+            for j in range(n_cols):
+                col_norm[j] += D[i, j] * D[i, j]
+        for j in range(n_cols):
+            col_norm[j] = np.sqrt(col_norm[j])
+            if col_norm[j] == 0.0:
+                col_norm[j] = 1.0
+            # Fold the weight into the scale so V[i, j] = D[i, j] * scale[j]
+            col_norm[j] = w[j] / col_norm[j]
+
+        # Loop 2: ideal / anti-ideal per column. Cost columns are negated
+        # (sign = -1) so max is always the ideal and no per-column branch
+        # is needed.
+        ideal = np.empty(n_cols)
+        anti = np.empty(n_cols)
+        for j in range(n_cols):
+            scale = col_norm[j] * sign[j]
+            lo = D[0, j] * scale
+            hi = lo
+            for i in range(1, n_rows):
+                v = D[i, j] * scale
+                lo = min(lo, v)
+                hi = max(hi, v)
+            ideal[j] = hi * sign[j]
+            anti[j] = lo * sign[j]
+
+        # Loop 3: distances and relative closeness, parallel over rows
+        scores = np.empty(n_rows)
+        for i in prange(n_rows):
+            s_star = 0.0
+            s_minus = 0.0
+            for j in range(n_cols):
+                v = D[i, j] * col_norm[j]
+                s_star += (v - ideal[j]) ** 2
+                s_minus += (v - anti[j]) ** 2
+            s_star = np.sqrt(s_star)
+            s_minus = np.sqrt(s_minus)
+            total = s_star + s_minus
+            scores[i] = s_minus / total if total > 0.0 else 0.5
+        return scores
+
+
+def warm_up() -> None:
+    """Compile the Numba kernel (or load it from the on-disk cache).
+
+    Blocking and CPU-bound; a no-op without Numba.
+    """
+    if _NUMBA_AVAILABLE:
+        _topsis_kernel(np.ones((2, 2)), np.full(2, 0.5), np.array([1.0, -1.0]))
+
+
+def topsis_closeness(D: np.ndarray, w: np.ndarray, bmask: np.ndarray) -> np.ndarray:
+    """Compute TOPSIS relative closeness for every row of a decision matrix.
+
+    Args:
+        D: Decision matrix of shape (n_alternatives, n_criteria)
+        w: Criteria weights of shape (n_criteria,)
+        bmask: Boolean mask of shape (n_criteria,), True for benefit criteria
+
+    Returns:
+        Array of closeness scores in [0, 1] (0.5 when both distances are 0);
+        empty for a matrix with no rows
+    """
+    D = np.ascontiguousarray(D, dtype=np.float64)
+    w = np.ascontiguousarray(w, dtype=np.float64)
+    # The compiled kernel reads row 0 unchecked (njit does no bounds
+    # checking) and the NumPy path fails in its reductions, so no backend
+    # ever sees an empty matrix
+    if D.shape[0] == 0:
+        return np.empty(0)
+    if not _NUMBA_AVAILABLE:
+        # Imported here: topsis imports this module
+        from .topsis import _calculate_scores
+        return _calculate_scores(D, w, np.asarray(bmask, dtype=np.bool_))
+    sign = np.where(np.asarray(bmask, dtype=np.bool_), 1.0, -1.0)
+    return _topsis_kernel(D, w, sign)
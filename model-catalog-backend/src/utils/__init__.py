@@ -1 +1,5 @@
 """Helper functions and utilities package."""
+
+from .fast_render import render_table
+
+__all__ = ["render_table"]
@@ -0,0 +1,50 @@
+"""Plain-text table rendering without the pandas formatter.
+
+Example:
+    >>> rows = [(1, 'Mistral-7B', 0.7312), (2, 'Qwen2.5-7B', 0.6954)]
+    >>> print(render_table(rows, ['rank', 'model', 'score'], ['d', 's', '.4f']))
+    rank      model  score
+       1 Mistral-7B 0.7312
+       2 Qwen2.5-7B 0.6954
+"""
+
+from typing import Any, Iterable, List, Sequence
+
+
+def render_table(
+    rows: Iterable[Sequence[Any]],
+    headers: List[str],
+    fmts: List[str]
+) -> str:
+    """Render rows as a right-aligned text table.
+
+    Args:
+        rows: Row sequences, e.g. a 2-D numpy array or
+            ``df[cols].itertuples(index=False)``
+        headers: Column headers
+        fmts: Format spec per column (e.g. ``'.4f'``, ``'d'``, ``'s'``)
+
+    Returns:
+        Table as a single string (no trailing newline)
+
+    Raises:
+        ValueError: If headers and fmts lengths differ
+    """
+    if len(headers) != len(fmts):
+        raise ValueError(
+            f"Got {len(headers)} headers but {len(fmts)} format specs"
+        )
+
+    cells = [[format(value, spec) for value, spec in zip(row, fmts)] for row in rows]
+
+    # Column width = widest of header and rendered cells
+    widths = [len(h) for h in headers]
+    for row_cells in cells:
+        for j, cell in enumerate(row_cells):
+            if len(cell) > widths[j]:
+                widths[j] = len(cell)
+
+    line_fmt = " ".join(f"{{{j}:>{w}}}" for j, w in enumerate(widths))
+    lines = [line_fmt.format(*headers)]
+    lines.extend(line_fmt.format(*row_cells) for row_cells in cells)
+    return "\n".join(lines)
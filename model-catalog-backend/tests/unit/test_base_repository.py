@@ -0,0 +1,134 @@
+"""Tests for BaseRepository statement building."""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.models import HardwareConfig, Model
+from src.repositories.base_repository import BULK_COPY_THRESHOLD, BaseRepository
+
+
+class _Result:
+    """Stand-in for a CursorResult."""
+    
+    def __init__(self, rowcount):
+        self.rowcount = rowcount
+
+
+class _RecordingSession:
+    """Session that records executed statements instead of running them."""
+    
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+    
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result(1)
+    
+    async def commit(self):
+        self.commits += 1
+    
+    async def connection(self):
+        return SimpleNamespace(dialect=SimpleNamespace(driver='asyncpg'))
+
+
+class _RecordingCopyConnection:
+    """asyncpg connection stand-in that records COPY calls."""
+    
+    def __init__(self):
+        self.copies = []
+    
+    async def copy_records_to_table(self, table_name, *, records, columns, schema_name):
+        self.copies.append((columns, list(records)))
+
+
+def _compile(stmt):
+    """Render a statement as PostgreSQL SQL."""
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestBulkUpdate:
+    """Test suite for BaseRepository.bulk_update."""
+    
+    @pytest.mark.asyncio
+    async def test_attribute_named_differently_from_column(self):
+        """Test model_metadata updates the "metadata" column."""
+        session = _RecordingSession()
+        repo = BaseRepository(session, Model)
+        
+        updated = await repo.bulk_update([
+            {'id': uuid.uuid4(), 'model_metadata': {'license': 'apache-2.0'}},
+            {'id': uuid.uuid4(), 'model_metadata': {'license': 'mit'}},
+        ])
+        
+        assert updated == 1
+        assert session.commits == 1
+        [stmt] = session.statements
+        sql = _compile(stmt)
+        assert 'SET metadata=new_values.metadata' in sql
+        assert 'new_values (id, metadata)' in sql
+    
+    @pytest.mark.asyncio
+    async def test_groups_by_field_set(self):
+        """Test updates setting different fields run as separate statements."""
+        session = _RecordingSession()
+        repo = BaseRepository(session, Model)
+        
+        await repo.bulk_update([
+            {'id': uuid.uuid4(), 'base_model': 'a'},
+            {'id': uuid.uuid4(), 'base_model': 'b', 'model_metadata': {}},
+            {'id': uuid.uuid4(), 'base_model': 'c'},
+        ])
+        
+        assert len(session.statements) == 2
+        assert 'SET base_model=new_values.base_model' in _compile(session.statements[0])
+        assert 'metadata=new_values.metadata' in _compile(session.statements[1])
+
+
+
+class TestBulkCopy:
+    """Test suite for BaseRepository.bulk_copy."""
+    
+    @pytest.mark.asyncio
+    async def test_rows_with_different_keys_copied_separately(self):
+        """Test a key one row omits is left to its default, not sent as NULL."""
+        copy_conn = _RecordingCopyConnection()
+        repo = BaseRepository(_RecordingSession(), HardwareConfig)
+        
+        async def asyncpg_connection():
+            return copy_conn
+        repo._asyncpg_connection = asyncpg_connection
+        
+        base = {
+            'gpu_type': 'L4',
+            'gpu_count': 1,
+            'vram_per_gpu_gb': 24,
+            'total_vram_gb': 24,
+            'cost_per_hour_usd': 0.8,
+            'cloud_provider': 'gcp'
+        }
+        rows = [dict(base) for _ in range(BULK_COPY_THRESHOLD)]
+        rows.append({
+            **base,
+            'created_at': datetime(2024, 1, 1, tzinfo=timezone.utc),
+            'instance_type': 'g2-standard-4'
+        })
+        
+        assert await repo.bulk_copy(rows) == len(rows)
+        
+        assert len(copy_conn.copies) == 2
+        (plain_columns, plain), (full_columns, full) = copy_conn.copies
+        assert len(plain) == BULK_COPY_THRESHOLD and len(full) == 1
+        assert 'created_at' not in plain_columns
+        assert 'instance_type' not in plain_columns
+        assert {'created_at', 'instance_type'} <= set(full_columns)
+        # Python-side defaults are still filled for every group
+        assert 'id' in plain_columns and 'spot_available' in plain_columns
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,76 @@
+"""Tests for benchmark matrix record generation."""
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+from scripts.workflows.populate_matrix import (
+    BATCH_SIZES,
+    SEQUENCE_LENGTHS,
+    WORKLOAD_TYPES,
+    calculate_priority,
+    generate_config_records,
+    random_uuids,
+)
+from src.models import BenchmarkConfig
+from src.repositories.benchmark_config_repository import CONFIG_COPY_COLUMNS
+
+
+@pytest.fixture
+def records():
+    """Records for a 3 hardware x 2 framework matrix."""
+    hardware_ids = [uuid4() for _ in range(3)]
+    framework_ids = [uuid4() for _ in range(2)]
+    return list(generate_config_records(uuid4(), hardware_ids, framework_ids, block_size=7))
+
+
+class TestConfigRecords:
+    """Test suite for COPY record generation."""
+    
+    def test_record_count(self, records):
+        """Test one record per matrix cell."""
+        expected = 3 * 2 * len(WORKLOAD_TYPES) * len(BATCH_SIZES) * len(SEQUENCE_LENGTHS)
+        assert len(records) == expected
+        assert all(len(record) == len(CONFIG_COPY_COLUMNS) for record in records)
+    
+    def test_record_types_match_columns(self, records):
+        """Test every value has its column's native type, so binary COPY
+        never falls back to text casting."""
+        table = BenchmarkConfig.__table__
+        for index, column in enumerate(CONFIG_COPY_COLUMNS):
+            python_type = table.c[column].type.python_type
+            for record in records:
+                assert isinstance(record[index], python_type), (
+                    f"{column}: expected {python_type.__name__}, "
+                    f"got {type(record[index]).__name__}"
+                )
+    
+    def test_created_at_is_naive_utc(self, records):
+        """Test created_at is naive UTC, like the column's default.
+        
+        The column is timestamp without time zone; asyncpg's encoder for it
+        subtracts a naive epoch, so an aware value fails the whole COPY.
+        """
+        column = BenchmarkConfig.__table__.c.created_at
+        assert not column.type.timezone
+        
+        created_at = records[0][CONFIG_COPY_COLUMNS.index('created_at')]
+        assert isinstance(created_at, datetime)
+        assert created_at.tzinfo is None
+        assert abs(datetime.utcnow() - created_at).total_seconds() < 60
+    
+    def test_priorities_match_rules(self, records):
+        """Test vectorized priorities agree with calculate_priority."""
+        columns = {name: i for i, name in enumerate(CONFIG_COPY_COLUMNS)}
+        for record in records:
+            assert record[columns['priority']] == calculate_priority(
+                record[columns['workload_type']],
+                record[columns['batch_size']],
+                record[columns['sequence_length']]
+            )
+    
+    def test_random_uuids_are_unique_v4(self):
+        """Test bulk UUIDs are distinct version-4 UUIDs."""
+        ids = random_uuids(1000)
+        assert len(set(ids)) == 1000
+        assert all(isinstance(u, UUID) and u.version == 4 for u in ids)
@@ -0,0 +1,114 @@
+"""Tests for the NOTIFY-fed workflow progress counters."""
+
+import json
+import uuid
+
+import pytest
+
+from src.repositories.progress_counter import ProgressCounter, TxidSnapshot
+
+
+def _payload(model_version_id, xid, **deltas):
+    """Build a notification payload like the benchmark_configs triggers send."""
+    return json.dumps({
+        'seq': 1,
+        'xid': xid,
+        'model_version_id': str(model_version_id),
+        'deltas': deltas
+    })
+
+
+@pytest.fixture
+def counter():
+    """Counter with its listener marked as connected."""
+    counter = ProgressCounter()
+    counter._listening = True
+    return counter
+
+
+class TestTxidSnapshot:
+    """Test suite for snapshot visibility."""
+    
+    def test_visibility(self):
+        """Test committed xids below xmin are seen, in-progress and later ones are not."""
+        snapshot = TxidSnapshot.parse('100:105:101,103')
+        
+        assert snapshot.sees(99)
+        assert snapshot.sees(102)
+        assert not snapshot.sees(101)
+        assert not snapshot.sees(105)
+        assert TxidSnapshot.parse('100:100:').xip == frozenset()
+
+
+class TestProgressCounter:
+    """Test suite for ProgressCounter."""
+    
+    def test_not_listening_never_seeds(self):
+        """Test callers query themselves while the listener is down."""
+        mv = uuid.uuid4()
+        
+        assert ProgressCounter().begin_seed(mv) is None
+        assert ProgressCounter().get(mv) is None
+    
+    def test_seed_then_apply_deltas(self, counter):
+        """Test notifications after the seed update the counts."""
+        mv = uuid.uuid4()
+        token = counter.begin_seed(mv)
+        counter.finish_seed(mv, token, {'pending': 10}, '50:50:')
+        
+        counter.handle_notification(_payload(mv, 50, pending=-3, running=3))
+        counter.handle_notification(_payload(mv, 51, running=-1, completed=1))
+        
+        assert counter.get(mv) == {'pending': 7, 'running': 2, 'completed': 1}
+    
+    def test_changes_seen_by_seed_are_skipped(self, counter):
+        """Test a change the seeding query already counted is not applied twice."""
+        mv = uuid.uuid4()
+        token = counter.begin_seed(mv)
+        # Buffered while seeding: 40 was committed before the snapshot, 60 after
+        counter.handle_notification(_payload(mv, 40, pending=-1, running=1))
+        counter.handle_notification(_payload(mv, 60, pending=-2, running=2))
+        counter.finish_seed(mv, token, {'pending': 9, 'running': 1}, '45:55:')
+        # Late delivery of a transaction the snapshot saw
+        counter.handle_notification(_payload(mv, 44, pending=-1, running=1))
+        
+        assert counter.get(mv) == {'pending': 7, 'running': 3}
+    
+    def test_untracked_model_versions_ignored(self, counter):
+        """Test notifications for model versions never read are dropped."""
+        mv = uuid.uuid4()
+        counter.handle_notification(_payload(mv, 10, pending=5))
+        
+        assert counter.get(mv) is None
+    
+    def test_reset_discards_seed_in_flight(self, counter):
+        """Test a seed started before a reconnect is not installed."""
+        mv = uuid.uuid4()
+        token = counter.begin_seed(mv)
+        counter.reset()
+        counter.finish_seed(mv, token, {'pending': 10}, '50:50:')
+        
+        assert counter.get(mv) is None
+        assert counter.begin_seed(mv) is not None
+    
+    def test_model_versions_without_configs_not_tracked(self, counter):
+        """Test seeding an unknown model version installs nothing."""
+        mv = uuid.uuid4()
+        
+        counter.finish_seed(mv, counter.begin_seed(mv), {}, '50:50:')
+        
+        assert counter.get(mv) is None
+        assert counter._counts == {} and counter._snapshots == {}
+        assert counter.begin_seed(mv) is not None
+    
+    def test_returned_counts_are_copies(self, counter):
+        """Test callers cannot modify the live counts."""
+        mv = uuid.uuid4()
+        counter.finish_seed(mv, counter.begin_seed(mv), {'pending': 1}, '1:1:')
+        counter.get(mv)['pending'] = 100
+        
+        assert counter.get(mv) == {'pending': 1}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
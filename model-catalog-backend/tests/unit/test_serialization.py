@@ -0,0 +1,37 @@
+"""Tests for orjson-backed JSON serialization."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from asyncpg.pgproto import pgproto
+
+from src.core.serialization import json_bytes, json_serializer
+
+
+class TestJSONSerialization:
+    """Test suite for json_bytes / json_serializer."""
+    
+    def test_asyncpg_uuid_is_uuid_subclass(self):
+        """Test asyncpg's UUID type can be passed wherever uuid.UUID is expected."""
+        assert issubclass(pgproto.UUID, uuid.UUID)
+    
+    def test_asyncpg_uuid_encoded_like_stdlib(self):
+        """Test UUIDs decoded by asyncpg serialize exactly like uuid.UUID."""
+        value = uuid.uuid4()
+        row = {'id': pgproto.UUID(str(value)), 'created_at': datetime(2024, 1, 2, 3, 4, 5)}
+        
+        assert json_bytes(row) == json_bytes({'id': value, 'created_at': row['created_at']})
+        assert json_bytes(row) == (
+            f'{{"id":"{value}","created_at":"2024-01-02T03:04:05"}}'.encode()
+        )
+        assert json_serializer([pgproto.UUID(str(value))]) == f'["{value}"]'
+    
+    def test_unsupported_type_raises(self):
+        """Test values orjson cannot encode still raise."""
+        with pytest.raises(TypeError):
+            json_bytes({'value': object()})
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -3,7 +3,12 @@
 import pytest
 import pandas as pd
 import numpy as np
-from src.services.ranking.topsis import calculate_topsis_scores
+from src.services.ranking.topsis import (
+    calculate_topsis_scores,
+    calculate_topsis_scores_ndarray,
+    _calculate_scores,
+)
+from src.services.ranking.topsis_numba import topsis_closeness
 
 
 class TestTOPSIS:
@@ -237,6 +242,85 @@ class TestTOPSIS:
         assert result['topsis_rank'].values[0] == 1
         # Score should be 0.5 (equal distance to ideal and anti-ideal)
         assert np.isclose(result['topsis_score'].values[0], 0.5)
+    
+    def test_mapping_and_array_inputs_match_dataframe(self):
+        """Test dict and ndarray inputs rank identically to a DataFrame."""
+        columns = {
+            'accuracy': [0.85, 0.90, 0.88, 0.90],
+            'latency': [100, 150, 120, 150]
+        }
+        weights = {'accuracy': 0.6, 'latency': 0.4}
+        
+        df_result = calculate_topsis_scores(
+            pd.DataFrame(columns), weights, cost_criteria=['latency']
+        )
+        dict_result = calculate_topsis_scores(columns, weights, cost_criteria=['latency'])
+        array_result = calculate_topsis_scores(
+            np.column_stack([columns['accuracy'], columns['latency']]),
+            weights,
+            cost_criteria=['latency']
+        )
+        
+        for result in (dict_result, array_result):
+            assert np.allclose(result['topsis_score'], df_result['topsis_score'].values)
+            assert list(result['topsis_rank']) == df_result['topsis_rank'].tolist()
+    
+    def test_fused_kernel_matches_numpy_path(self):
+        """Test the fused kernel produces the same scores as the NumPy path."""
+        rng = np.random.default_rng(42)
+        D = rng.random((200, 5))
+        w = np.array([0.3, 0.2, 0.2, 0.15, 0.15])
+        bmask = np.array([True, False, True, False, True])
+        
+        expected = _calculate_scores(D, w, bmask)
+        
+        assert np.allclose(topsis_closeness(D, w, bmask), expected)
+    
+    def test_ndarray_matches_dataframe(self):
+        """Test the array entry point scores like the DataFrame one."""
+        columns = {
+            'accuracy': [0.85, 0.90, 0.88],
+            'latency': [100.0, 150.0, 120.0],
+        }
+        weights = {'accuracy': 0.6, 'latency': 0.4}
+        
+        expected = calculate_topsis_scores(
+            pd.DataFrame(columns), weights, cost_criteria=['latency']
+        )['topsis_score'].values
+        scores = calculate_topsis_scores_ndarray(
+            np.column_stack([columns['accuracy'], columns['latency']]),
+            np.array([0.6, 0.4]),
+            np.array([True, False])
+        )
+        
+        assert np.allclose(scores, expected)
+    
+    def test_ndarray_validation(self):
+        """Test the array entry point rejects bad shapes and weights."""
+        matrix = np.ones((3, 2))
+        mask = np.array([True, False])
+        
+        with pytest.raises(ValueError, match="sum to 1.0"):
+            calculate_topsis_scores_ndarray(matrix, np.array([0.5, 0.6]), mask)
+        
+        with pytest.raises(ValueError, match="Expected 2 weights"):
+            calculate_topsis_scores_ndarray(matrix, np.array([1.0]), mask)
+        
+        with pytest.raises(ValueError, match="must be 2-D"):
+            calculate_topsis_scores_ndarray(np.ones(3), np.array([1.0]), np.array([True]))
+    
+    def test_no_alternatives(self):
+        """Test an empty candidate matrix scores to an empty array."""
+        w = np.array([0.5, 0.5])
+        mask = np.array([True, False])
+        
+        scores = calculate_topsis_scores_ndarray(np.zeros((0, 2)), w, mask)
+        assert scores.shape == (0,)
+        assert topsis_closeness(np.zeros((0, 2)), w, mask).shape == (0,)
+        
+        result = calculate_topsis_scores({'a': [], 'b': []}, {'a': 0.5, 'b': 0.5})
+        assert len(result['topsis_score']) == 0
+        assert len(result['topsis_rank']) == 0
 
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 
 import pytest
 from src.services.hardware.vram_calculator import (
+    calculate_vram_batch,
     calculate_vram_requirement,
     recommend_gpu_config,
     get_quantization_comparison,
@@ -94,6 +95,24 @@ class TestVRAMCalculator:
             expected_util = (16.0 / cfg['total_vram_gb']) * 100
             assert abs(cfg['utilization_pct'] - expected_util) < 0.1
     
+    def test_recommend_gpu_config_memoized_bucket(self):
+        """Test requirements sharing a 0.5 GB bucket keep exact utilization."""
+        low = recommend_gpu_config(vram_needed=20.1)
+        high = recommend_gpu_config(vram_needed=20.4)
+        
+        assert [c['gpu_type'] for c in low] == [c['gpu_type'] for c in high]
+        assert low[0]['utilization_pct'] == round(20.1 / low[0]['total_vram_gb'] * 100, 1)
+        assert high[0]['utilization_pct'] == round(20.4 / high[0]['total_vram_gb'] * 100, 1)
+    
+    def test_recommend_gpu_config_returns_fresh_results(self):
+        """Test mutating a result does not leak into later calls."""
+        first = recommend_gpu_config(vram_needed=30.0)
+        first[0]['count'] = 99
+        first.clear()
+        
+        second = recommend_gpu_config(vram_needed=30.0)
+        assert second and second[0]['count'] != 99
+    
     def test_estimate_max_batch_size(self):
         """Test maximum batch size estimation."""
         # Llama-7B FP16 on A100-80GB should support batch > 1
@@ -132,6 +151,26 @@ class TestVRAMCalculator:
             assert vram > 0, f"Failed for {quant}"
             assert isinstance(vram, float)
     
+    def test_batch_matches_scalar(self):
+        """Test batched VRAM calculation agrees with the scalar function."""
+        quantizations = ['fp32', 'fp16', 'bf16', 'int8', 'int4', 'awq', 'gptq']
+        parameters = [1_000_000_000 * (i + 1) for i in range(len(quantizations))]
+        
+        for batch_size in (1, 4):
+            batch = calculate_vram_batch(parameters, quantizations, batch_size=batch_size)
+            expected = [
+                calculate_vram_requirement(p, q, batch_size=batch_size)
+                for p, q in zip(parameters, quantizations)
+            ]
+            assert batch.tolist() == expected
+    
+    def test_batch_invalid_quantization(self):
+        """Test batched calculation rejects unknown or misaligned inputs."""
+        with pytest.raises(ValueError, match="Unsupported quantization: zzz"):
+            calculate_vram_batch([7_000_000_000, 7_000_000_000], ['fp16', 'zzz'])
+        with pytest.raises(ValueError):
+            calculate_vram_batch([7_000_000_000], ['fp16', 'int4'])
+    
     def test_realistic_scenario_llama_70b(self):
         """Test realistic deployment scenario for Llama-70B."""
         # INT4 quantization
@@ -143,11 +182,19 @@ class TestVRAMCalculator:
         # Get recommendations
         configs = recommend_gpu_config(vram, prefer_spot=True)
         
-        # Should recommend A100-80GB or H100
+        # Cheapest first: two L4s at spot price undercut any A100/H100
         assert len(configs) > 0
         best = configs[0]
         assert best['total_vram_gb'] >= vram
-        assert best['gpu_type'] in ['A100-80GB', 'H100', 'A100-40GB']
+        assert (best['gpu_type'], best['count']) == ('L4', 2)
+        costs = [cfg['cost_per_hour_usd'] for cfg in configs]
+        assert costs == sorted(costs)
+        
+        # Single-GPU placements are still offered
+        assert any(
+            cfg['gpu_type'] in ('A100-80GB', 'H100') and cfg['count'] == 1
+            for cfg in configs
+        )
 
 
 if __name__ == '__main__':